@@ -0,0 +1,64 @@
+# =============================================================================
+# Benchmark: import corpus campuran encoding, deteksi BOM vs trial-and-error
+# =============================================================================
+# Usage: python benchmarks/bench_encoding.py [file_count]
+import os
+import sys
+import json
+import time
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from song_json import decode_song_bytes, parse_song_text  # noqa: E402
+from bench_note_memory import synthetic_song_notes  # noqa: E402
+
+# Campuran encoding seperti sheet komunitas (banyak UTF-16 dengan BOM)
+CORPUS_ENCODINGS = ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16', 'utf-16-le')
+TRIAL_ENCODINGS = ('utf-8', 'utf-8-sig', 'utf-16', 'utf-16-le', 'utf-32')
+
+
+def build_corpus(folder: str, file_count: int) -> list:
+    file_paths = []
+    for index in range(file_count):
+        encoding = CORPUS_ENCODINGS[index % len(CORPUS_ENCODINGS)]
+        text = json.dumps([{"name": f"Song {index}", "bpm": 120,
+                            "songNotes": synthetic_song_notes(2000, seed=index)}])
+        file_path = os.path.join(folder, f"song_{index}.json")
+        with open(file_path, 'wb') as f:
+            f.write(text.encode(encoding))
+        file_paths.append(file_path)
+    return file_paths
+
+
+def load_detected(file_path: str):
+    with open(file_path, 'rb') as f:
+        return parse_song_text(decode_song_bytes(f.read()))
+
+
+def load_trial_and_error(file_path: str):
+    """Cara lama + retry: buka ulang file dengan encoding berikutnya saat gagal"""
+    for encoding in TRIAL_ENCODINGS:
+        try:
+            with open(file_path, 'r', encoding=encoding) as f:
+                return parse_song_text(f.read())
+        except (UnicodeError, ValueError):
+            continue
+    raise ValueError(f"Unknown encoding: {file_path}")
+
+
+def main():
+    file_count = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    with tempfile.TemporaryDirectory() as folder:
+        file_paths = build_corpus(folder, file_count)
+        print(f"{file_count} files, encodings: {', '.join(sorted(set(CORPUS_ENCODINGS)))}")
+        for label, load in (("trial-and-error", load_trial_and_error), ("BOM sniffing", load_detected)):
+            start = time.perf_counter()
+            for file_path in file_paths:
+                load(file_path)
+            elapsed = time.perf_counter() - start
+            print(f"  {label:16} {elapsed * 1000:8.1f} ms ({elapsed * 1e6 / file_count:7.1f} us/file)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+# =============================================================================
+# Benchmark: waktu dan peak memori load sheet JSON, full parse vs streaming
+# =============================================================================
+# Usage: python benchmarks/bench_json_load.py [song.json ...]
+#
+# Tradeoff tanpa ijson (streaming = cursor stdlib Python murni), sheet 5 MB:
+#   orjson.loads ~0.20 s, peak ~9x ukuran file; stdlib-stream ~0.63 s, peak ~1.6 MB.
+# Karena itu dengan orjson tanpa ijson, song_json.STREAMING_THRESHOLD_BYTES
+# dinaikkan ke 16 MB; dengan ijson (atau tanpa orjson) tetap 1 MB.
+import os
+import sys
+import json
+import time
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import song_loader  # noqa: E402
+from song_json import STREAMING_THRESHOLD_BYTES, json_backend_name  # noqa: E402
+from bench_note_memory import synthetic_song_notes  # noqa: E402
+
+
+def measure(file_path: str, threshold: int):
+    """(detik, peak bytes) untuk parse_song dengan threshold streaming tertentu"""
+    song_loader.STREAMING_THRESHOLD_BYTES = threshold
+    tracemalloc.start()
+    start = time.perf_counter()
+    song = song_loader.parse_song(file_path)
+    elapsed = time.perf_counter() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return elapsed, peak, song.note_count
+
+
+def main():
+    temp_dir = None
+    if len(sys.argv) > 1:
+        file_paths = sys.argv[1:]
+    else:
+        temp_dir = tempfile.TemporaryDirectory()
+        file_path = os.path.join(temp_dir.name, "synthetic.json")
+        with open(file_path, 'w', encoding='utf-8') as f:
+            json.dump([{"name": "synthetic", "bpm": 120,
+                        "songNotes": synthetic_song_notes(200_000)}], f)
+        file_paths = [file_path]
+
+    # Timing tracemalloc lebih lambat dari normal, tapi sebanding antar mode
+    print(f"Streaming threshold: {STREAMING_THRESHOLD_BYTES // (1024 * 1024)} MiB "
+          f"(full: {json_backend_name()}, stream: {json_backend_name(True)})")
+    for file_path in file_paths:
+        size = os.path.getsize(file_path)
+        print(f"{os.path.basename(file_path)} ({size / 1e6:.2f} MB)")
+        for label, threshold, streaming in (("full", sys.maxsize, False), ("stream", -1, True)):
+            elapsed, peak, count = measure(file_path, threshold)
+            print(f"  {label:6} [{json_backend_name(streaming):13}] {elapsed * 1000:8.1f} ms  "
+                  f"peak {peak / 1e6:7.2f} MB  ({peak / max(count, 1):6.1f} bytes/note)")
+    if temp_dir is not None:
+        temp_dir.cleanup()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# =============================================================================
+# Benchmark: memori per note, List[Note] dataclass vs NoteColumns
+# =============================================================================
+# Usage: python benchmarks/bench_note_memory.py [song.json ...]
+import os
+import sys
+import json
+import random
+import tracemalloc
+from dataclasses import dataclass
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from note_columns import NoteColumns  # noqa: E402
+
+
+@dataclass
+class LegacyNote:
+    """Note sebelum NoteColumns: dataclass biasa dengan __dict__ per note"""
+    key: str
+    time: int
+
+
+def synthetic_song_notes(count: int = 100_000, seed: int = 1) -> list:
+    """songNotes acak seperti sheet Sky (15 key, 1 instrumen, kadang chord)"""
+    rng = random.Random(seed)
+    notes = []
+    time_ms = 0
+    for _ in range(count):
+        time_ms += rng.choice((0, 125, 250, 375))
+        notes.append({"time": time_ms, "key": f"1Key{rng.randrange(15)}"})
+    return notes
+
+
+def load_song_notes(file_path: str) -> list:
+    with open(file_path, 'r', encoding='utf-8') as f:
+        data = json.load(f)
+    song_data = data[0] if isinstance(data, list) else data
+    return song_data.get('songNotes', [])
+
+
+def measure(build, song_notes: list) -> int:
+    """Bytes yang masih teralokasi setelah build(song_notes) selesai"""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build(song_notes)
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del result
+    return after - before
+
+
+def build_legacy(song_notes: list) -> list:
+    # Key string dibuat ulang per note seperti hasil json.load
+    return [LegacyNote(key="".join(n['key']), time=n['time']) for n in song_notes]
+
+
+def build_columns(song_notes: list) -> NoteColumns:
+    columns = NoteColumns()
+    for n in song_notes:
+        columns.append(n['key'], n['time'])
+    return columns
+
+
+def main():
+    if len(sys.argv) > 1:
+        song_notes = [note for path in sys.argv[1:] for note in load_song_notes(path)]
+        source = f"{len(sys.argv) - 1} files"
+    else:
+        song_notes = synthetic_song_notes()
+        source = "synthetic"
+    count = len(song_notes)
+    if not count:
+        print("No notes found")
+        return
+
+    legacy = measure(build_legacy, song_notes)
+    columns = measure(build_columns, song_notes)
+    print(f"{count} notes ({source})")
+    print(f"  List[Note] dataclass: {legacy / count:8.1f} bytes/note ({legacy / 1e6:.2f} MB)")
+    print(f"  NoteColumns:          {columns / count:8.1f} bytes/note ({columns / 1e6:.2f} MB)")
+    print(f"  Reduction:            {legacy / max(columns, 1):8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
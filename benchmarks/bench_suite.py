@@ -0,0 +1,276 @@
+# =============================================================================
+# Benchmark Suite: load, grouping, memori dan jitter scheduler (hasil JSON)
+# =============================================================================
+# Usage:
+#   python benchmarks/bench_suite.py                      (1k, 10k, 100k, 1M notes)
+#   python benchmarks/bench_suite.py --quick              (tanpa 1M, play lebih singkat)
+#   python benchmarks/bench_suite.py -o run.json --compare baseline.json
+#
+# Semua sheet dibuat dari seed tetap, jadi dua run di mesin yang sama memakai
+# input identik. Tidak butuh PyQt6 atau pydirectinput: play memakai
+# RecordingBackend, dan grouping lama (dict waktu -> list Note) dibandingkan
+# lewat implementasi referensi di file ini, bukan lewat main.py.
+import os
+import gc
+import sys
+import json
+import time
+import random
+import argparse
+import platform
+import statistics
+import subprocess
+import tempfile
+import tracemalloc
+from collections import defaultdict
+from typing import Callable, Dict, List, Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from input_backend import RecordingBackend  # noqa: E402
+from input_pool import InputWorkerPool  # noqa: E402
+from key_mapping import KEY_MAPPING  # noqa: E402
+from note_columns import Note  # noqa: E402
+from playback import PlaybackController  # noqa: E402
+from song_binary import write_compiled  # noqa: E402
+from song_json import json_backend_name  # noqa: E402
+from song_loader import count_chords, parse_song  # noqa: E402
+from timeline import compile_timeline  # noqa: E402
+
+SUITE_VERSION = 1
+DEFAULT_SIZES = (1_000, 10_000, 100_000, 1_000_000)
+QUICK_SIZES = (1_000, 10_000, 100_000)
+# (nama, peluang note berikutnya satu chord dengan note sebelumnya, jumlah key yang dipakai)
+DEFAULT_PROFILES = (("melody", 0.05, 8), ("chords", 0.5, 15))
+# Metrik yang dibandingkan dengan --compare (lebih kecil = lebih baik)
+COMPARED_METRICS = ("load_json_ms", "load_skyc_ms", "compile_timeline_ms",
+                    "group_notes_by_time_ms", "peak_load_bytes_per_note")
+
+
+# STEP 1: Synthetic Sheets - Notes acak dengan seed tetap
+def synthetic_notes(count: int, chord_density: float, key_spread: int,
+                    seed: int = 1, step_ms: int = 125) -> list:
+    """songNotes: `chord_density` = peluang note jatuh di waktu yang sama dengan
+    note sebelumnya, `key_spread` = jumlah key berbeda (1-15) yang dipakai"""
+    rng = random.Random(seed)
+    keys = [f"1Key{index}" for index in range(max(1, min(15, key_spread)))]
+    notes = []
+    time_ms = 0
+    for index in range(count):
+        if index and rng.random() >= chord_density:
+            time_ms += step_ms * rng.choice((1, 1, 2, 3))
+        notes.append({"time": time_ms, "key": rng.choice(keys)})
+    return notes
+
+
+def write_sheet(folder: str, label: str, notes: list) -> str:
+    file_path = os.path.join(folder, f"{label}.json")
+    with open(file_path, "w", encoding="utf-8") as f:
+        json.dump([{"name": label, "bpm": 120, "songNotes": notes}], f)
+    return file_path
+
+
+# STEP 2: Measurement Helpers
+def time_call(function: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Min dan median wall time (ms) dari `repeat` kali panggilan"""
+    samples = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        function()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {"min": min(samples), "median": statistics.median(samples)}
+
+
+def peak_memory(function: Callable[[], object]) -> int:
+    """Peak bytes teralokasi selama function (tracemalloc, terpisah dari timing)"""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        function()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def group_notes_by_time(notes: list) -> list:
+    """Referensi grouping sebelum CompiledTimeline: dict waktu -> list Note, lalu sort"""
+    time_groups = defaultdict(list)
+    for note in notes:
+        time_groups[note.time].append(note)
+    return [(time_ms, time_groups[time_ms]) for time_ms in sorted(time_groups)]
+
+
+# STEP 3: Load, Grouping, dan Memori per Ukuran Sheet
+def bench_sheet(folder: str, count: int, profile: tuple, repeat: int) -> dict:
+    name, chord_density, key_spread = profile
+    label = f"{name}_{count}"
+    json_path = write_sheet(folder, label, synthetic_notes(count, chord_density, key_spread))
+    song = parse_song(json_path)
+    notes = song.notes
+    skyc_path = os.path.join(folder, f"{label}.skyc")
+    write_compiled(skyc_path, song.name, song.bpm, notes, count_chords(notes))
+
+    # Sheet besar cukup diulang sekali agar suite tetap selesai dalam hitungan menit
+    runs = repeat if count < 1_000_000 else 1
+    result = {
+        "notes": count,
+        "profile": name,
+        "chord_density": chord_density,
+        "key_spread": key_spread,
+        "json_bytes": os.path.getsize(json_path),
+        "skyc_bytes": os.path.getsize(skyc_path),
+    }
+    load_json = time_call(lambda: parse_song(json_path), runs)
+    result["load_json_ms"] = load_json["min"]
+    result["load_json_median_ms"] = load_json["median"]
+    result["load_notes_per_s"] = count / (load_json["min"] / 1000)
+    result["load_mb_per_s"] = result["json_bytes"] / 1e6 / (load_json["min"] / 1000)
+    result["load_skyc_ms"] = time_call(lambda: parse_song(skyc_path), runs)["min"]
+
+    timeline = compile_timeline(notes, KEY_MAPPING)
+    result["groups"] = len(timeline)
+    result["chords"] = timeline.chord_count
+    result["compile_timeline_ms"] = time_call(lambda: compile_timeline(notes, KEY_MAPPING), runs)["min"]
+    note_list = list(notes)
+    result["group_notes_by_time_ms"] = time_call(lambda: group_notes_by_time(note_list), runs)["min"]
+
+    # Memori: peak selama load JSON, dan ukuran kolom yang tersimpan per lagu
+    peak = peak_memory(lambda: parse_song(json_path))
+    result["peak_load_bytes"] = peak
+    result["peak_load_bytes_per_note"] = peak / count
+    result["notes_nbytes"] = notes.nbytes
+    result["timeline_nbytes"] = timeline.nbytes
+    result["retained_bytes_per_note"] = (notes.nbytes + timeline.nbytes) / count
+    return result
+
+
+# STEP 4: Scheduler Jitter - Putar timeline ke RecordingBackend, ukur lateness
+def bench_scheduler(play_seconds: float, tempo: float) -> dict:
+    """Putar sheet sintetis selama ~play_seconds (waktu nyata) dan ambil telemetry"""
+    # Chord density 0.5: rata-rata 2 note per group, jarak group rata-rata 1.75 x 125ms
+    groups = max(1, int(play_seconds * 1000 * tempo / (125 * 1.75)))
+    notes = synthetic_notes(groups * 2, 0.5, 15, seed=2)
+    timeline = compile_timeline([Note(n["key"], n["time"]) for n in notes], KEY_MAPPING)
+
+    backend = RecordingBackend()
+    controller = PlaybackController(
+        backend, InputWorkerPool(backend, worker_count=len(set(KEY_MAPPING.values()))))
+    controller.set_tempo(tempo)
+    start = time.perf_counter()
+    controller.play(timeline, 0, countdown=0)
+    controller.wait_idle()
+    elapsed = time.perf_counter() - start
+    controller.shutdown()
+
+    report = controller.telemetry.report()
+    return {
+        "tempo": tempo,
+        "groups": len(timeline),
+        "song_ms": timeline.duration_ms,
+        "wall_s": elapsed,
+        "key_events": len(backend.events),
+        "dispatch_lateness_ms": report["dispatch"],
+        "emit_lateness_ms": report["emit"],
+        "histogram": report["histogram"],
+        "incomplete": report["incomplete"],
+    }
+
+
+# STEP 5: Metadata dan Compare
+def environment() -> dict:
+    try:
+        commit = subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True,
+                                text=True, cwd=os.path.dirname(os.path.abspath(__file__)),
+                                timeout=5).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        commit = ""
+    return {
+        "suite_version": SUITE_VERSION,
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "cpu_count": os.cpu_count(),
+        "json_backend": json_backend_name(False),
+        "stream_backend": json_backend_name(True),
+        "commit": commit,
+    }
+
+
+def compare(results: dict, baseline: dict) -> List[str]:
+    """Baris perbandingan (rasio baru / baseline) untuk metrik di COMPARED_METRICS"""
+    old_sheets = {(sheet["profile"], sheet["notes"]): sheet for sheet in baseline.get("sheets", [])}
+    lines = []
+    for sheet in results["sheets"]:
+        old = old_sheets.get((sheet["profile"], sheet["notes"]))
+        if old is None:
+            continue
+        for metric in COMPARED_METRICS:
+            if metric in sheet and old.get(metric):
+                ratio = sheet[metric] / old[metric]
+                lines.append(f"  {sheet['profile']:7} {sheet['notes']:>8} {metric:26} "
+                             f"{old[metric]:12.2f} -> {sheet[metric]:12.2f}  ({ratio:5.2f}x)")
+    new_emit = results.get("scheduler", {}).get("emit_lateness_ms", {})
+    old_emit = baseline.get("scheduler", {}).get("emit_lateness_ms", {})
+    for key in ("p50", "p99", "max", "jitter"):
+        if key in new_emit and key in old_emit:
+            lines.append(f"  scheduler emit lateness {key:6} {old_emit[key]:8.3f} -> "
+                         f"{new_emit[key]:8.3f} ms")
+    return lines
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Sky player benchmark suite")
+    parser.add_argument("-o", "--output", default="bench_results.json", help="Result JSON path")
+    parser.add_argument("--quick", action="store_true", help="Skip 1M-note sheets, shorter play")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Note counts (default 1k..1M)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing runs per measurement")
+    parser.add_argument("--play-seconds", type=float, default=None,
+                        help="Real-time length of the scheduler run (default 10, quick 3)")
+    parser.add_argument("--tempo", type=float, default=4.0, help="Tempo of the scheduler run")
+    parser.add_argument("--compare", metavar="BASELINE", help="Print ratios against a previous run")
+    args = parser.parse_args(argv)
+
+    sizes = args.sizes or (QUICK_SIZES if args.quick else DEFAULT_SIZES)
+    play_seconds = args.play_seconds or (3.0 if args.quick else 10.0)
+
+    results = {"environment": environment(), "sheets": []}
+    with tempfile.TemporaryDirectory() as folder:
+        for count in sizes:
+            for profile in DEFAULT_PROFILES:
+                sheet = bench_sheet(folder, count, profile, args.repeat)
+                results["sheets"].append(sheet)
+                print(f"{profile[0]:7} {count:>8} notes: load {sheet['load_json_ms']:9.1f} ms "
+                      f"({sheet['load_notes_per_s'] / 1e6:5.2f} M notes/s), "
+                      f".skyc {sheet['load_skyc_ms']:7.2f} ms, "
+                      f"compile {sheet['compile_timeline_ms']:8.1f} ms "
+                      f"(dict grouping {sheet['group_notes_by_time_ms']:8.1f} ms), "
+                      f"peak {sheet['peak_load_bytes_per_note']:6.1f} B/note, "
+                      f"kept {sheet['retained_bytes_per_note']:5.1f} B/note")
+
+    scheduler = bench_scheduler(play_seconds, args.tempo)
+    results["scheduler"] = scheduler
+    emit = scheduler["emit_lateness_ms"]
+    if emit:
+        print(f"scheduler {scheduler['groups']} groups at {args.tempo}x: emit lateness "
+              f"p50 {emit['p50']:.3f} p95 {emit['p95']:.3f} p99 {emit['p99']:.3f} "
+              f"max {emit['max']:.3f} ms, jitter {emit['jitter']:.3f} ms")
+
+    with open(args.output, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=1)
+    print(f"Results written to {args.output}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+        print(f"Compared with {args.compare} ({baseline.get('environment', {}).get('commit', '?')}):")
+        for line in compare(results, baseline):
+            print(line)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
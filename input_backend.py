@@ -0,0 +1,211 @@
+# =============================================================================
+# Input Backends - Abstraksi pengiriman key ke game
+# =============================================================================
+import time
+import ctypes
+import threading
+import logging
+from typing import Callable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class InputBackend:
+    """Interface backend input: key_down, key_up dan batched chord events
+
+    Semua method harus non-blocking: durasi tekan (hold) dijadwalkan oleh
+    player dengan chord_down dan chord_up, bukan dengan sleep di backend.
+    """
+
+    name = "base"
+    # True jika send_chord mengirim seluruh chord dalam satu panggilan backend
+    batches_chords = False
+
+    def key_down(self, key: str):
+        raise NotImplementedError
+
+    def key_up(self, key: str):
+        raise NotImplementedError
+
+    def chord_down(self, keys: Sequence[str]):
+        """Key-down untuk semua key dalam chord"""
+        for key in keys:
+            self.key_down(key)
+
+    def chord_up(self, keys: Sequence[str]):
+        """Key-up untuk semua key dalam chord"""
+        for key in keys:
+            self.key_up(key)
+
+    def send_chord(self, keys: Sequence[str]):
+        """Tekan (down lalu up) semua key dalam chord tanpa hold"""
+        self.chord_down(keys)
+        self.chord_up(keys)
+
+    def close(self):
+        """Lepaskan resource backend (opsional)"""
+
+
+# STEP B1: PyDirectInput Backend - Backend default untuk Windows
+class PyDirectInputBackend(InputBackend):
+    """Backend berbasis pydirectinput, satu SendInput untuk seluruh chord"""
+
+    name = "pydirectinput"
+    batches_chords = True
+
+    def __init__(self):
+        import pydirectinput  # Import di sini agar modul tetap bisa dipakai di Linux
+        self._pdi = pydirectinput
+        self._batch_supported = all(
+            hasattr(pydirectinput, attr)
+            for attr in ('SendInput', 'Input', 'Input_I', 'KeyBdInput', 'KEYBOARD_MAPPING')
+        )
+        if not self._batch_supported:
+            logger.warning("pydirectinput has no SendInput structures, falling back to per-key input")
+
+    def key_down(self, key: str):
+        self._pdi.keyDown(key, _pause=False)
+
+    def key_up(self, key: str):
+        self._pdi.keyUp(key, _pause=False)
+
+    def _send_batch(self, keys: Sequence[str], key_up: bool) -> int:
+        """Kirim event untuk semua key dalam satu panggilan SendInput"""
+        pdi = self._pdi
+        inputs = []
+        extra = ctypes.c_ulong(0)
+        for key in keys:
+            scan_code = pdi.KEYBOARD_MAPPING.get(key)
+            if scan_code is None:
+                logger.warning(f"Key not supported by pydirectinput: {key}")
+                continue
+            flags = pdi.KEYEVENTF_SCANCODE
+            if key_up:
+                flags |= pdi.KEYEVENTF_KEYUP
+            ii_ = pdi.Input_I()
+            ii_.ki = pdi.KeyBdInput(0, scan_code, flags, 0, ctypes.pointer(extra))
+            inputs.append(pdi.Input(ctypes.c_ulong(1), ii_))
+
+        if not inputs:
+            return 0
+        batch = (pdi.Input * len(inputs))(*inputs)
+        return pdi.SendInput(len(inputs), batch, ctypes.sizeof(pdi.Input))
+
+    # Tidak ada sleep pydirectinput.PAUSE di sini, hold dijadwalkan oleh player
+    def chord_down(self, keys: Sequence[str]):
+        if self._batch_supported:
+            self._send_batch(keys, key_up=False)
+        else:
+            super().chord_down(keys)
+
+    def chord_up(self, keys: Sequence[str]):
+        if self._batch_supported:
+            self._send_batch(keys, key_up=True)
+        else:
+            super().chord_up(keys)
+
+
+# STEP B2: Recording Backend - Backend in-memory untuk testing dan benchmark
+class RecordingBackend(InputBackend):
+    """Backend yang hanya mencatat setiap event beserta timestamp perf_counter_ns"""
+
+    name = "recording"
+    batches_chords = True
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._events: List[Tuple[int, str, str]] = []  # (timestamp_ns, action, key)
+
+    def key_down(self, key: str):
+        with self._lock:
+            self._events.append((time.perf_counter_ns(), 'down', key))
+
+    def key_up(self, key: str):
+        with self._lock:
+            self._events.append((time.perf_counter_ns(), 'up', key))
+
+    def chord_down(self, keys: Sequence[str]):
+        timestamp = time.perf_counter_ns()
+        with self._lock:
+            self._events.extend((timestamp, 'down', key) for key in keys)
+
+    def chord_up(self, keys: Sequence[str]):
+        timestamp = time.perf_counter_ns()
+        with self._lock:
+            self._events.extend((timestamp, 'up', key) for key in keys)
+
+    @property
+    def events(self) -> List[Tuple[int, str, str]]:
+        """Salinan semua event yang tercatat"""
+        with self._lock:
+            return list(self._events)
+
+    def clear(self):
+        with self._lock:
+            self._events.clear()
+
+
+def create_default_backend() -> InputBackend:
+    """Buat backend pydirectinput, fallback ke RecordingBackend jika tidak tersedia"""
+    try:
+        return PyDirectInputBackend()
+    except Exception as e:
+        logger.warning(f"pydirectinput unavailable ({e}), using recording input backend")
+        return RecordingBackend()
+
+
+# STEP B3: Lazy Backend - Backend asli dibuat saat pertama dipakai
+class LazyInputBackend(InputBackend):
+    """Tunda pembuatan backend (import pydirectinput) sampai play pertama
+
+    `load()` bisa dipanggil lebih awal dari thread lain (misalnya saat
+    countdown) agar event pertama tidak menanggung biaya import.
+    """
+
+    def __init__(self, factory: Callable[[], InputBackend] = create_default_backend):
+        self._factory = factory
+        self._lock = threading.Lock()
+        self._backend: Optional[InputBackend] = None
+
+    @property
+    def is_loaded(self) -> bool:
+        return self._backend is not None
+
+    def load(self) -> InputBackend:
+        backend = self._backend
+        if backend is None:
+            with self._lock:
+                if self._backend is None:
+                    start = time.perf_counter()
+                    self._backend = self._factory()
+                    logger.info(f"Using input backend: {self._backend.name} "
+                                f"(loaded in {(time.perf_counter() - start) * 1000:.1f} ms)")
+                backend = self._backend
+        return backend
+
+    @property
+    def name(self) -> str:
+        return self._backend.name if self._backend is not None else "lazy"
+
+    @property
+    def batches_chords(self) -> bool:
+        return self.load().batches_chords
+
+    def key_down(self, key: str):
+        self.load().key_down(key)
+
+    def key_up(self, key: str):
+        self.load().key_up(key)
+
+    def chord_down(self, keys: Sequence[str]):
+        self.load().chord_down(keys)
+
+    def chord_up(self, keys: Sequence[str]):
+        self.load().chord_up(keys)
+
+    def send_chord(self, keys: Sequence[str]):
+        self.load().send_chord(keys)
+
+    def close(self):
+        if self._backend is not None:
+            self._backend.close()
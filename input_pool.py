@@ -0,0 +1,162 @@
+# =============================================================================
+# Input Worker Pool - Thread input yang hidup selama satu sesi pemutaran
+# =============================================================================
+import time
+import queue
+import threading
+import logging
+from typing import Callable, Dict, List, Optional, Sequence
+
+from input_backend import InputBackend
+from log_pipeline import HOT_PATH_DEBUG
+
+logger = logging.getLogger(__name__)
+
+# Jumlah key unik di keyboard Sky (15 key), satu worker per key
+DEFAULT_WORKER_COUNT = 15
+
+
+class ChordTicket:
+    """Handle completion untuk satu chord yang di-dispatch ke pool"""
+
+    __slots__ = ('_pending', '_lock', '_done', 'dispatched_ns', 'completed_ns')
+
+    def __init__(self, job_count: int):
+        self._pending = job_count
+        self._lock = threading.Lock()
+        self._done = threading.Event()
+        self.dispatched_ns = time.perf_counter_ns()
+        self.completed_ns = 0
+        if job_count == 0:
+            self.completed_ns = self.dispatched_ns
+            self._done.set()
+
+    def _complete_one(self):
+        """Dipanggil worker setelah satu job selesai diproses"""
+        with self._lock:
+            self._pending -= 1
+            finished = self._pending == 0
+        if finished:
+            self.completed_ns = time.perf_counter_ns()
+            self._done.set()
+
+    @property
+    def done(self) -> bool:
+        return self._done.is_set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """Tunggu sampai semua key di chord selesai, return False jika timeout"""
+        return self._done.wait(timeout)
+
+
+class InputWorkerPool:
+    """Pool worker input persisten untuk dispatch chord tanpa spawn thread
+
+    Jika backend mendukung batching, seluruh chord dikirim sebagai satu job
+    ke satu worker (satu panggilan send_chord), jadi hanya satu worker yang
+    di-start. Jika tidak, `worker_count` worker di-start dan setiap key selalu
+    diproses oleh worker yang sama (key affinity) sehingga urutan event untuk
+    satu key tetap terjaga, sementara key berbeda diproses paralel.
+    """
+
+    def __init__(self, backend: InputBackend,
+                 worker_count: int = DEFAULT_WORKER_COUNT):
+        self.backend = backend
+        self.worker_count = max(1, worker_count)
+        self._queues: List[queue.SimpleQueue] = []
+        self._threads: List[threading.Thread] = []
+        self._lanes: Dict[str, int] = {}  # key -> index worker
+        self._running = False
+
+        # Statistik biaya dispatch (diukur di thread pemanggil)
+        self.dispatch_count = 0
+        self.dispatch_total_ns = 0
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    # STEP P1: Lifecycle - Start dan stop worker sekali per sesi
+    def start(self):
+        """Start worker (no-op jika sudah berjalan), satu saja jika backend batching"""
+        if self._running:
+            return
+        # Backend batching hanya memakai worker pertama, worker lain akan menganggur
+        count = 1 if self.backend.batches_chords else self.worker_count
+        self._queues = [queue.SimpleQueue() for _ in range(count)]
+        self._threads = []
+        for index, jobs in enumerate(self._queues):
+            thread = threading.Thread(target=self._worker, args=(jobs,),
+                                      name=f"input-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self.dispatch_count = 0
+        self.dispatch_total_ns = 0
+        self._running = True
+        logger.debug("Input worker pool started with %d workers", len(self._queues))
+
+    def stop(self, timeout: float = 1.0):
+        """Stop semua worker setelah job yang tersisa selesai"""
+        if not self._running:
+            return
+        self._running = False
+        for jobs in self._queues:
+            jobs.put(None)
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._queues = []
+        self._threads = []
+        logger.debug("Input worker pool stopped (%s)", self.stats())
+
+    # STEP P2: Chord Dispatch - Kirim satu chord utuh ke worker
+    def dispatch(self, keys: Sequence[str],
+                 action: Optional[Callable[[Sequence[str]], None]] = None) -> ChordTicket:
+        """Dispatch semua key dalam chord, return ticket untuk menunggu completion
+
+        `action` adalah method backend yang dipanggil (chord_down, chord_up),
+        default send_chord (down lalu up).
+        """
+        if not self._running:
+            self.start()
+
+        send_chord = action or self.backend.send_chord
+        if self.backend.batches_chords:
+            # Satu job untuk seluruh chord, selalu di worker pertama agar urut
+            ticket = ChordTicket(1 if keys else 0)
+            if keys:
+                self._queues[0].put((send_chord, keys, ticket))
+        else:
+            ticket = ChordTicket(len(keys))
+            lanes = self._lanes
+            for key in keys:
+                lane = lanes.get(key)
+                if lane is None:
+                    lane = lanes[key] = len(lanes) % len(self._queues)
+                self._queues[lane].put((send_chord, (key,), ticket))
+
+        self.dispatch_count += 1
+        self.dispatch_total_ns += time.perf_counter_ns() - ticket.dispatched_ns
+        return ticket
+
+    def stats(self) -> str:
+        """Ringkasan biaya dispatch rata-rata"""
+        if not self.dispatch_count:
+            return "no chords dispatched"
+        average_us = self.dispatch_total_ns / self.dispatch_count / 1000
+        return f"{self.dispatch_count} chords, avg dispatch {average_us:.1f}us"
+
+    def _worker(self, jobs: queue.SimpleQueue):
+        """Loop worker: ambil job dari queue dan kirim ke backend"""
+        while True:
+            job = jobs.get()
+            if job is None:
+                break
+            action, keys, ticket = job
+            try:
+                action(keys)
+                if HOT_PATH_DEBUG:
+                    logger.debug("%s %s", getattr(action, "__name__", "send"), list(keys))
+            except Exception as e:
+                logger.error("Error sending keys %s to input backend: %s", list(keys), e)
+            finally:
+                ticket._complete_one()
@@ -1,21 +1,24 @@
-self.key_mapping = {
-            # Instrumen 1 - Mapping keyboard ke key game
-            "1Key0": "y", "1Key1": "u", "1Key2": "i", "1Key3": "o", "1Key4": "p",
-            "1Key5": "h", "1Key6": "j", "1Key7": "k", "1Key8": "l", "1Key9": ";",
-            "1Key10": "n", "1Key11": "m", "1Key12": ",", "1Key13": ".", "1Key14": "/",
-            
-            # Instrumen 2 - Saat ini menggunakan mapping yang sama
-            "2Key0": "y", "2Key1": "u", "2Key2": "i", "2Key3": "o", "2Key4": "p",
-            "2Key5": "h", "2Key6": "j", "2Key7": "k", "2Key8": "l", "2Key9": ";",
-            "2Key10": "n", "2Key11": "m", "2Key12": ",", "2Key13": ".", "2Key14": "/",
-            
-            # Instrumen 3 - Saat ini menggunakan mapping yang sama
-            "3Key0": "y", "3Key1": "u", "3Key2": "i", "3Key3": "o", "3Key4": "p",
-            "3Key5": "h", "3Key6": "j", "3Key7": "k", "3Key8": "l", "3Key9": ";",
-            "3Key10": "n", "3Key11": "m", "3Key12": ",", "3Key13": ".", "3Key14": "/",
-            
-            # Instrumen 4 - Saat ini menggunakan mapping yang sama
-            "4Key0": "y", "4Key1": "u", "4Key2": "i", "4Key3": "o", "4Key4": "p",
-            "4Key5": "h", "4Key6": "j", "4Key7": "k", "4Key8": "l", "4Key9": ";",
-            "4Key10": "n", "4Key11": "m", "4Key12": ",", "4Key13": ".", "4Key14": "/",
-        }
\ No newline at end of file
+# =============================================================================
+# Key Mapping - Mapping key Sky Music ke key keyboard game
+# =============================================================================
+KEY_MAPPING = {
+    # Instrumen 1 - Mapping keyboard ke key game
+    "1Key0": "y", "1Key1": "u", "1Key2": "i", "1Key3": "o", "1Key4": "p",
+    "1Key5": "h", "1Key6": "j", "1Key7": "k", "1Key8": "l", "1Key9": ";",
+    "1Key10": "n", "1Key11": "m", "1Key12": ",", "1Key13": ".", "1Key14": "/",
+    
+    # Instrumen 2 - Saat ini menggunakan mapping yang sama
+    "2Key0": "y", "2Key1": "u", "2Key2": "i", "2Key3": "o", "2Key4": "p",
+    "2Key5": "h", "2Key6": "j", "2Key7": "k", "2Key8": "l", "2Key9": ";",
+    "2Key10": "n", "2Key11": "m", "2Key12": ",", "2Key13": ".", "2Key14": "/",
+    
+    # Instrumen 3 - Saat ini menggunakan mapping yang sama
+    "3Key0": "y", "3Key1": "u", "3Key2": "i", "3Key3": "o", "3Key4": "p",
+    "3Key5": "h", "3Key6": "j", "3Key7": "k", "3Key8": "l", "3Key9": ";",
+    "3Key10": "n", "3Key11": "m", "3Key12": ",", "3Key13": ".", "3Key14": "/",
+    
+    # Instrumen 4 - Saat ini menggunakan mapping yang sama
+    "4Key0": "y", "4Key1": "u", "4Key2": "i", "4Key3": "o", "4Key4": "p",
+    "4Key5": "h", "4Key6": "j", "4Key7": "k", "4Key8": "l", "4Key9": ";",
+    "4Key10": "n", "4Key11": "m", "4Key12": ",", "4Key13": ".", "4Key14": "/",
+}
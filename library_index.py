@@ -0,0 +1,163 @@
+# =============================================================================
+# Library Index - Index lagu persisten (SQLite) di config dir user
+# =============================================================================
+import os
+import sys
+import sqlite3
+import logging
+from typing import Iterable, List, Optional, Tuple
+
+from song_archive import member_fingerprint, split_member_path
+from song_loader import SongData
+
+logger = logging.getLogger(__name__)
+
+APP_DIR_NAME = "SkyMusicPlayer"
+INDEX_FILE_NAME = "library.sqlite3"
+SCHEMA_VERSION = 2
+
+
+def default_config_dir() -> str:
+    """Config dir aplikasi: %APPDATA% di Windows, $XDG_CONFIG_HOME atau ~/.config di lainnya"""
+    if sys.platform == "win32":
+        base = os.environ.get("APPDATA") or os.path.expanduser("~")
+    elif sys.platform == "darwin":
+        base = os.path.expanduser("~/Library/Application Support")
+    else:
+        base = os.environ.get("XDG_CONFIG_HOME") or os.path.expanduser("~/.config")
+    return os.path.join(base, APP_DIR_NAME)
+
+
+def default_index_path() -> str:
+    return os.path.join(default_config_dir(), INDEX_FILE_NAME)
+
+
+def file_fingerprint(file_path: str) -> Optional[Tuple[int, int]]:
+    """(mtime_ns, size) file atau (CRC32, size) member zip, None jika tidak ada"""
+    if split_member_path(file_path) is not None:
+        return member_fingerprint(file_path)
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+class LibraryIndex:
+    """Index metadata lagu (name, BPM, jumlah note, durasi, chord) per path
+
+    Setiap baris menyimpan fingerprint file (mtime_ns, size) saat di-parse,
+    sehingga saat startup hanya file yang berubah yang perlu di-parse ulang.
+    Koneksi SQLite hanya dipakai dari thread yang membuatnya (GUI thread).
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        self.db_path = db_path or default_index_path()
+        if self.db_path != ":memory:":
+            os.makedirs(os.path.dirname(os.path.abspath(self.db_path)), exist_ok=True)
+        self._conn = sqlite3.connect(self.db_path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+        logger.info(f"Library index: {self.db_path}")
+
+    def _create_schema(self):
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        if version != SCHEMA_VERSION:
+            # Index hanya cache hasil parse, aman dibuat ulang saat schema berubah
+            self._conn.execute("DROP TABLE IF EXISTS songs")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS songs (
+                path TEXT PRIMARY KEY,
+                mtime_ns INTEGER NOT NULL,
+                size INTEGER NOT NULL,
+                name TEXT NOT NULL,
+                bpm INTEGER NOT NULL,
+                note_count INTEGER NOT NULL,
+                duration_ms INTEGER NOT NULL,
+                chord_count INTEGER NOT NULL,
+                content_hash TEXT NOT NULL,
+                position INTEGER NOT NULL
+            )
+        """)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS roots (
+                path TEXT PRIMARY KEY
+            )
+        """)
+        self._conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self._conn.commit()
+
+    # STEP I1: Read Index - Metadata lagu tanpa parse file
+    def load_songs(self) -> List[SongData]:
+        """Semua lagu di index (urut sesuai urutan import), tanpa notes"""
+        rows = self._conn.execute(
+            "SELECT path, mtime_ns, size, name, bpm, note_count, duration_ms, chord_count, "
+            "content_hash FROM songs ORDER BY position").fetchall()
+        return [SongData(name=name, bpm=bpm, notes=None, file_path=path,
+                         note_count=note_count, duration_ms=duration_ms,
+                         chord_count=chord_count, content_hash=content_hash,
+                         file_mtime_ns=mtime_ns, file_size=size)
+                for (path, mtime_ns, size, name, bpm, note_count, duration_ms, chord_count,
+                     content_hash) in rows]
+
+    def __len__(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM songs").fetchone()[0]
+
+    # STEP I2: Update Index - Simpan hasil parse
+    def upsert(self, songs: Iterable[SongData]):
+        """Simpan/ganti metadata lagu (satu transaksi untuk satu batch)"""
+        with self._conn:
+            position = self._conn.execute(
+                "SELECT COALESCE(MAX(position), -1) FROM songs").fetchone()[0]
+            rows = []
+            for song in songs:
+                position += 1
+                rows.append((song.file_path, song.file_mtime_ns, song.file_size, song.name,
+                             song.bpm, song.note_count, song.duration_ms, song.chord_count,
+                             song.content_hash, position))
+            # Path yang sudah ada tetap di posisi lamanya
+            self._conn.executemany("""
+                INSERT INTO songs (path, mtime_ns, size, name, bpm, note_count,
+                                   duration_ms, chord_count, content_hash, position)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(path) DO UPDATE SET
+                    mtime_ns=excluded.mtime_ns, size=excluded.size, name=excluded.name,
+                    bpm=excluded.bpm, note_count=excluded.note_count,
+                    duration_ms=excluded.duration_ms, chord_count=excluded.chord_count,
+                    content_hash=excluded.content_hash
+            """, rows)
+
+    def remove(self, paths: Iterable[str]):
+        with self._conn:
+            self._conn.executemany("DELETE FROM songs WHERE path = ?", ((p,) for p in paths))
+
+    def clear(self):
+        with self._conn:
+            self._conn.execute("DELETE FROM songs")
+            self._conn.execute("DELETE FROM roots")
+
+    # STEP I2b: Library Roots - Folder yang di-scan rekursif dan di-watch
+    def roots(self) -> List[str]:
+        return [path for path, in self._conn.execute("SELECT path FROM roots ORDER BY rowid")]
+
+    def add_root(self, path: str):
+        with self._conn:
+            self._conn.execute("INSERT OR IGNORE INTO roots (path) VALUES (?)", (path,))
+
+    def close(self):
+        self._conn.close()
+
+
+# STEP I3: Stale Check - Cari file yang berubah atau hilang (aman di thread lain)
+def find_stale(songs: Iterable[SongData]) -> Tuple[List[str], List[str]]:
+    """Return (changed_paths, missing_paths) berdasarkan mtime_ns dan size file"""
+    changed = []
+    missing = []
+    for song in songs:
+        fingerprint = file_fingerprint(song.file_path)
+        if fingerprint is None:
+            missing.append(song.file_path)
+        elif fingerprint != (song.file_mtime_ns, song.file_size):
+            changed.append(song.file_path)
+    return changed, missing
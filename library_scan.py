@@ -0,0 +1,256 @@
+# =============================================================================
+# Library Scan - Scan folder lagu rekursif dan watch perubahan file
+# =============================================================================
+import os
+import sys
+import errno
+import ctypes
+import select
+import zipfile
+import threading
+import logging
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from song_archive import ARCHIVE_EXTENSIONS, list_members
+from song_binary import COMPILED_EXTENSION
+
+logger = logging.getLogger(__name__)
+
+SONG_EXTENSIONS = ('.json', '.json.gz', COMPILED_EXTENSION)
+DEFAULT_POLL_INTERVAL = 2.0
+# Jeda setelah event inotify sebelum rescan, agar satu copy folder jadi satu update
+WATCH_DEBOUNCE_SECONDS = 0.3
+# Batas debounce jika event terus berdatangan (misalnya file besar sedang ditulis)
+WATCH_MAX_DEBOUNCE_ROUNDS = 10
+
+# path -> (mtime_ns, size) atau (CRC32, size) untuk member zip, sama dengan fingerprint di LibraryIndex
+Snapshot = Dict[str, Tuple[int, int]]
+
+
+def is_song_file(name: str) -> bool:
+    return name.lower().endswith(SONG_EXTENSIONS)
+
+
+# STEP S1: Recursive Scan - os.scandir, stat dari entry (gratis di Windows)
+def scan_library(roots: Iterable[str]) -> Tuple[Snapshot, List[str]]:
+    """Scan semua root secara rekursif, return (snapshot file lagu, folder yang di-scan)
+
+    Folder tersembunyi (diawali '.') dan symlink folder dilewati agar tidak
+    ada loop. Folder yang tidak bisa dibaca di-log dan dilewati. Song pack
+    .zip diganti dengan member-membernya (path virtual, lihat song_archive).
+    """
+    files: Snapshot = {}
+    folders: List[str] = []
+    seen: Set[str] = set()
+    stack = [os.path.normpath(os.path.abspath(root)) for root in roots]
+    while stack:
+        folder = stack.pop()
+        if folder in seen:
+            continue
+        seen.add(folder)
+        try:
+            with os.scandir(folder) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not entry.name.startswith('.'):
+                                stack.append(entry.path)
+                        elif is_song_file(entry.name) and entry.is_file():
+                            stat = entry.stat()
+                            files[entry.path] = (stat.st_mtime_ns, stat.st_size)
+                        elif entry.name.lower().endswith(ARCHIVE_EXTENSIONS) and entry.is_file():
+                            files.update(list_members(entry.path))
+                    except OSError:
+                        continue  # File terhapus di tengah scan
+                    except zipfile.BadZipFile as e:
+                        logger.warning(f"Skipping song pack {entry.path}: {e}")
+        except OSError as e:
+            logger.warning(f"Cannot scan folder {folder}: {e}")
+            continue
+        folders.append(folder)
+    return files, folders
+
+
+def scan_song_files(roots: Iterable[str]) -> List[str]:
+    """Path semua file lagu di bawah roots (terurut)"""
+    return sorted(scan_library(roots)[0])
+
+
+def diff_snapshots(old: Snapshot, new: Snapshot) -> Tuple[List[str], List[str], List[str]]:
+    """Return (added, changed, removed) antara dua snapshot"""
+    added = sorted(path for path in new if path not in old)
+    changed = sorted(path for path, fingerprint in new.items()
+                     if path in old and old[path] != fingerprint)
+    removed = sorted(path for path in old if path not in new)
+    return added, changed, removed
+
+
+# STEP S2: inotify - Notifikasi perubahan folder di Linux (via ctypes)
+class _Inotify:
+    """Watch non-rekursif per folder; event hanya dipakai sebagai pemicu rescan"""
+
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    IN_DELETE_SELF = 0x400
+    IN_MOVE_SELF = 0x800
+    IN_NONBLOCK = 0o4000
+    IN_CLOEXEC = 0o2000000
+    MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO |
+            IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_MOVE_SELF)
+
+    def __init__(self):
+        self._libc = ctypes.CDLL(None, use_errno=True)
+        self._fd = self._libc.inotify_init1(self.IN_NONBLOCK | self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self._watched: Set[str] = set()
+
+    def watch(self, folders: List[str]):
+        """Tambah watch untuk folder yang belum di-watch (folder yang hilang dilupakan)"""
+        self._watched.intersection_update(folders)
+        for folder in folders:
+            if folder in self._watched:
+                continue
+            if self._libc.inotify_add_watch(self._fd, os.fsencode(folder), self.MASK) < 0:
+                error = ctypes.get_errno()
+                if error == errno.ENOSPC:
+                    raise OSError(error, "inotify watch limit reached")
+                continue  # Folder sudah hilang
+            self._watched.add(folder)
+
+    def wait(self, timeout: Optional[float]) -> bool:
+        """Tunggu event sampai timeout, return True jika ada (event dibuang)"""
+        ready, _, _ = select.select([self._fd], [], [], timeout)
+        if not ready:
+            return False
+        while True:
+            try:
+                if not os.read(self._fd, 65536):
+                    break
+            except BlockingIOError:
+                break
+        return True
+
+    def close(self):
+        os.close(self._fd)
+
+
+def inotify_available() -> bool:
+    return sys.platform.startswith("linux") and hasattr(ctypes.CDLL(None), "inotify_init1")
+
+
+# STEP S3: Watcher - Laporkan file lagu yang ditambah, diubah, atau dihapus
+class LibraryWatcher:
+    """Watch folder library di background thread
+
+    Memakai inotify jika tersedia (Linux), selain itu polling stat setiap
+    `poll_interval` detik. Setiap ada perubahan, snapshot (mtime_ns, size)
+    dibandingkan dengan scan sebelumnya dan `on_change(added, changed,
+    removed)` dipanggil dari thread watcher, hanya jika ada yang berbeda.
+    """
+
+    def __init__(self, roots: Iterable[str],
+                 on_change: Callable[[List[str], List[str], List[str]], None],
+                 poll_interval: float = DEFAULT_POLL_INTERVAL,
+                 use_inotify: bool = True):
+        self.on_change = on_change
+        self.poll_interval = poll_interval
+        self.use_inotify = use_inotify
+        self._roots = list(roots)
+        self._lock = threading.Lock()
+        self._rebase = True
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.backend = "poll"
+
+    @property
+    def roots(self) -> List[str]:
+        with self._lock:
+            return list(self._roots)
+
+    def set_roots(self, roots: Iterable[str]):
+        """Ganti root, file di root baru menjadi baseline (tidak dilaporkan sebagai added)"""
+        with self._lock:
+            self._roots = list(roots)
+            self._rebase = True
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        """Mulai watch, isi folder saat ini menjadi baseline"""
+        self._stop.clear()
+        with self._lock:
+            self._rebase = True
+        self._thread = threading.Thread(target=self._run, name="library-watch", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = 1.0):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def _create_inotify(self) -> Optional[_Inotify]:
+        if not self.use_inotify or not inotify_available():
+            return None
+        try:
+            return _Inotify()
+        except OSError as e:
+            logger.warning(f"inotify unavailable ({e}), polling library folders")
+            return None
+
+    def _run(self):
+        inotify = self._create_inotify()
+        self.backend = "inotify" if inotify is not None else "poll"
+        logger.info(f"Watching library folders ({self.backend})")
+        snapshot: Snapshot = {}
+        try:
+            while not self._stop.is_set():
+                with self._lock:
+                    roots = list(self._roots)
+                    rebase = self._rebase
+                    self._rebase = False
+                files, folders = scan_library(roots)
+                if rebase:
+                    snapshot = files
+                else:
+                    added, changed, removed = diff_snapshots(snapshot, files)
+                    snapshot = files
+                    if added or changed or removed:
+                        logger.info(f"Library folders changed: {len(added)} added, "
+                                    f"{len(changed)} changed, {len(removed)} removed")
+                        self.on_change(added, changed, removed)
+                if inotify is not None:
+                    try:
+                        inotify.watch(folders)
+                    except OSError as e:
+                        logger.warning(f"{e}, falling back to polling")
+                        inotify.close()
+                        inotify = None
+                        self.backend = "poll"
+                self._wait(inotify)
+        except Exception as e:
+            logger.error(f"Library watcher stopped: {e}")
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+    def _wait(self, inotify: Optional[_Inotify]):
+        """Tunggu perubahan berikutnya (atau stop)"""
+        if inotify is None:
+            self._stop.wait(self.poll_interval)
+            return
+        # Timeout pendek agar stop() dan set_roots() tetap responsif
+        while not self._stop.is_set() and not self._rebase:
+            if inotify.wait(0.5):
+                # Debounce: kumpulkan event beruntun sebelum rescan
+                for _ in range(WATCH_MAX_DEBOUNCE_ROUNDS):
+                    if self._stop.is_set() or not inotify.wait(WATCH_DEBOUNCE_SECONDS):
+                        break
+                return
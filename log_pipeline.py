@@ -0,0 +1,89 @@
+# =============================================================================
+# Log Pipeline - Logging non-blocking lewat queue dan writer di background
+# =============================================================================
+# Thread pemanggil (player, worker input, UI) hanya memasukkan LogRecord ke
+# queue; format pesan, tulis ke terminal dan file (rotasi dengan batas ukuran)
+# dilakukan QueueListener di thread sendiri, jadi disk yang lambat tidak
+# pernah menunda note.
+import os
+import sys
+import queue
+import atexit
+import logging
+import logging.handlers
+from typing import List, Optional
+
+LOG_FORMAT = '%(asctime)s - %(levelname)s - %(message)s'
+DEFAULT_LOG_FILE = 'sky_music_player.log'
+# Batas ukuran file log sebelum dirotasi, dan jumlah file lama yang disimpan
+LOG_MAX_BYTES = 5 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# Debug per note/chord di hot path hanya aktif dengan SKY_HOT_PATH_DEBUG=1.
+# Dicek sebagai konstanta modul (`if HOT_PATH_DEBUG:`), jadi saat mati tidak
+# ada string yang dibangun maupun panggilan logger.
+HOT_PATH_DEBUG = os.environ.get("SKY_HOT_PATH_DEBUG", "") not in ("", "0")
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+class DeferredQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler yang tidak memformat pesan di thread pemanggil
+
+    QueueHandler bawaan memanggil format() (merge msg % args, traceback)
+    sebelum enqueue. Karena queue ini in-process, record bisa dikirim apa
+    adanya dan diformat oleh handler di thread listener.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def setup_logging(log_file: Optional[str] = DEFAULT_LOG_FILE, level: int = logging.INFO,
+                  max_bytes: int = LOG_MAX_BYTES,
+                  backup_count: int = LOG_BACKUP_COUNT) -> logging.handlers.QueueListener:
+    """Pasang QueueHandler di root logger dan start listener (terminal + file rotasi)
+
+    Aman dipanggil berulang: listener lama dihentikan dulu. Listener
+    dihentikan otomatis saat proses keluar (sisa record di-flush).
+    """
+    global _listener
+    shutdown_logging()
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    handlers: List[logging.Handler] = [logging.StreamHandler()]  # Output ke terminal
+    if log_file:
+        try:
+            # delay=True: file baru dibuka oleh thread listener saat record pertama
+            handlers.append(logging.handlers.RotatingFileHandler(
+                log_file, maxBytes=max_bytes, backupCount=backup_count,
+                encoding='utf-8', delay=True))
+        except OSError as e:
+            print(f"Cannot open log file {log_file}: {e}", file=sys.stderr)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    # SimpleQueue tidak pernah blok saat put (tanpa batas)
+    records = queue.SimpleQueue()
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(DeferredQueueHandler(records))
+    root.setLevel(level)
+
+    _listener = logging.handlers.QueueListener(records, *handlers, respect_handler_level=True)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging():
+    """Flush record yang tersisa dan hentikan thread listener"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+atexit.register(shutdown_logging)
@@ -0,0 +1,180 @@
+# =============================================================================
+# Note Columns - Penyimpanan notes kompak (struct-of-arrays)
+# =============================================================================
+import sys
+import hashlib
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+# Instrument untuk key yang namanya tidak berformat "<instrumen>Key<index>";
+# index key-nya menunjuk ke NoteColumns.other_keys
+OTHER_INSTRUMENT = 255
+
+
+@dataclass
+class Note:
+    """Satu note musik (view dari NoteColumns, dibuat saat diakses)"""
+    __slots__ = ('key', 'time')
+    key: str
+    time: int
+
+
+# Cache parse nama key -> (instrument, key index), nama key dalam satu library sedikit
+_KEY_CODES: Dict[str, Tuple[int, int]] = {}
+
+
+def parse_key_name(name: str) -> Tuple[int, int]:
+    """Parse "1Key12" menjadi (1, 12), return (OTHER_INSTRUMENT, -1) jika format lain"""
+    code = _KEY_CODES.get(name)
+    if code is None:
+        instrument, sep, index = name.partition("Key")
+        if (sep and instrument.isdigit() and index.isdigit()
+                and int(instrument) < OTHER_INSTRUMENT and int(index) < 256):
+            code = (int(instrument), int(index))
+        else:
+            code = (OTHER_INSTRUMENT, -1)
+        if len(_KEY_CODES) < 4096:
+            _KEY_CODES[name] = code
+    return code
+
+
+class NoteColumns:
+    """Notes sebagai kolom array paralel: time (uint32), instrument dan key (uint8)
+
+    Menggantikan List[Note]: len(), index, slice, dan iterasi tetap
+    menghasilkan objek Note, tapi Note hanya dibuat saat diakses sehingga
+    satu note di memori cukup 6 bytes, bukan objek + string per note.
+    Kolom juga boleh berupa memoryview read-only (misalnya dari mmap .skyc).
+    """
+
+    __slots__ = ('times', 'instruments', 'keys', 'other_keys')
+
+    def __init__(self, times: array = None, instruments: array = None,
+                 keys: array = None, other_keys: List[str] = None):
+        self.times = times if times is not None else array('I')
+        self.instruments = instruments if instruments is not None else array('B')
+        self.keys = keys if keys is not None else array('B')
+        self.other_keys = other_keys if other_keys is not None else []
+
+    @classmethod
+    def from_notes(cls, notes: Iterable) -> 'NoteColumns':
+        """Buat kolom dari objek dengan atribut key dan time (misalnya Note)"""
+        columns = cls()
+        for note in notes:
+            columns.append(note.key, note.time)
+        return columns
+
+    # STEP N1: Building - Tambah note langsung ke kolom
+    def append(self, key_name: str, time_ms: int):
+        instrument, index = parse_key_name(key_name)
+        if instrument == OTHER_INSTRUMENT:
+            try:
+                index = self.other_keys.index(key_name)
+            except ValueError:
+                if len(self.other_keys) >= 256:
+                    raise ValueError(f"Too many distinct unrecognized keys (at {key_name!r})")
+                index = len(self.other_keys)
+                self.other_keys.append(key_name)
+        try:
+            self.times.append(time_ms)
+        except TypeError:
+            # Beberapa sheet menyimpan waktu sebagai float
+            self._append_time(time_ms)
+        except OverflowError:
+            raise ValueError(f"Invalid note time: {time_ms!r}") from None
+        self.instruments.append(instrument)
+        self.keys.append(index)
+
+    def _append_time(self, time_ms):
+        try:
+            self.times.append(int(time_ms))
+        except (OverflowError, TypeError, ValueError):
+            raise ValueError(f"Invalid note time: {time_ms!r}") from None
+
+    def sort_by_time(self):
+        """Urutkan notes berdasarkan waktu (stabil), no-op jika sudah terurut"""
+        times = self.times
+        if all(times[i - 1] <= times[i] for i in range(1, len(times))):
+            return
+        order = sorted(range(len(times)), key=times.__getitem__)
+        self.times = array('I', [times[i] for i in order])
+        self.instruments = array('B', [self.instruments[i] for i in order])
+        self.keys = array('B', [self.keys[i] for i in order])
+
+    # STEP N2: Sequence API - Kompatibel dengan List[Note]
+    def key_name(self, index: int) -> str:
+        instrument = self.instruments[index]
+        if instrument == OTHER_INSTRUMENT:
+            return self.other_keys[self.keys[index]]
+        return f"{instrument}Key{self.keys[index]}"
+
+    def key_names(self) -> List[str]:
+        """Nama key setiap note (dibuat sekali per kombinasi instrument/key)"""
+        names: Dict[Tuple[int, int], str] = {}
+        result = []
+        for instrument, key in zip(self.instruments, self.keys):
+            name = names.get((instrument, key))
+            if name is None:
+                if instrument == OTHER_INSTRUMENT:
+                    name = self.other_keys[key]
+                else:
+                    name = f"{instrument}Key{key}"
+                names[(instrument, key)] = name
+            result.append(name)
+        return result
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self.times)))]
+        if index < 0:
+            index += len(self.times)
+        return Note(key=self.key_name(index), time=self.times[index])
+
+    def __iter__(self) -> Iterator[Note]:
+        for key, time_ms in zip(self.key_names(), self.times):
+            yield Note(key=key, time=time_ms)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, NoteColumns):
+            return (self.times == other.times and self.key_names() == other.key_names())
+        try:
+            return list(self) == list(other)
+        except TypeError:
+            return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"NoteColumns({len(self.times)} notes)"
+
+    @property
+    def nbytes(self) -> int:
+        """Ukuran data kolom dalam bytes"""
+        return sum(column.itemsize * len(column)
+                   for column in (self.times, self.instruments, self.keys))
+
+    def content_hash(self) -> str:
+        """Fingerprint isi lagu dari note stream yang dinormalisasi ("" jika kosong)
+
+        Waktu relatif terhadap note pertama dan urutan key dalam chord tidak
+        berpengaruh, jadi sheet yang sama dengan nama file, metadata atau
+        format (JSON/.skyc) berbeda menghasilkan hash yang sama.
+        """
+        times = self.times
+        if not len(times):
+            return ""
+        base = times[0]
+        other_keys = sorted(self.other_keys)
+        other_rank = {index: other_keys.index(name) for index, name in enumerate(self.other_keys)}
+        codes = array('Q', sorted(
+            ((time_ms - base) << 16) | (instrument << 8) |
+            (other_rank[key] if instrument == OTHER_INSTRUMENT else key)
+            for time_ms, instrument, key in zip(times, self.instruments, self.keys)))
+        if sys.byteorder != "little":
+            codes.byteswap()
+        digest = hashlib.blake2b(codes.tobytes(), digest_size=16)
+        for name in other_keys:
+            digest.update(name.encode("utf-8") + b"\0")
+        return digest.hexdigest()
@@ -0,0 +1,467 @@
+# =============================================================================
+# Playback Controller - State machine pemutaran dengan satu thread pemilik
+# =============================================================================
+import time
+import heapq
+import bisect
+import itertools
+import threading
+import logging
+from collections import deque
+from typing import Callable, Optional, Tuple
+
+from input_backend import InputBackend
+from input_pool import InputWorkerPool
+from log_pipeline import HOT_PATH_DEBUG
+from scheduler import PlaybackScheduler
+from telemetry import NoteTelemetry
+from timeline import CompiledTimeline
+
+logger = logging.getLogger(__name__)
+
+# Durasi default key ditahan sebelum key-up (ms)
+DEFAULT_HOLD_MS = 40
+# Jarak minimum key-up sebelum key yang sama ditekan lagi (ms)
+MIN_RELEASE_GAP_MS = 10
+# Countdown default sebelum lagu mulai (detik)
+DEFAULT_COUNTDOWN_SECONDS = 3
+
+
+class PlaybackState:
+    """State pemutaran"""
+    IDLE = "idle"
+    COUNTDOWN = "countdown"
+    PLAYING = "playing"
+    PAUSED = "paused"
+
+
+class PlaybackController:
+    """Controller pemutaran dengan command queue dan wait berbasis Condition
+
+    Semua perubahan state (play, pause, stop, seek, tempo) dikirim sebagai
+    command ke satu thread pemilik yang persisten, sehingga hanya ada satu
+    thread pemutaran. Setiap wait (countdown, deadline note, pause) memakai
+    Condition yang di-notify saat command masuk, sehingga stop/pause/seek
+    langsung membangunkan player tanpa polling.
+
+    Progress tidak dikirim per group; posisi dipublikasikan ke atribut
+    `position_ms`/`total_ms` yang dibaca UI dengan timer (lihat progress()).
+    """
+
+    def __init__(self, backend: InputBackend, input_pool: InputWorkerPool,
+                 scheduler: Optional[PlaybackScheduler] = None,
+                 on_status: Optional[Callable[[str], None]] = None,
+                 on_finished: Optional[Callable[[], None]] = None,
+                 on_session_end: Optional[Callable[[], None]] = None,
+                 next_track: Optional[Callable[[], Optional[CompiledTimeline]]] = None):
+        self.backend = backend
+        self.input_pool = input_pool
+        self.scheduler = scheduler or PlaybackScheduler()
+        self.on_status = on_status or (lambda message: None)
+        self.on_finished = on_finished or (lambda: None)
+        # Dipanggil setiap sesi berakhir (selesai, stop, atau error), telemetry sudah final
+        self.on_session_end = on_session_end or (lambda: None)
+        # Provider timeline berikutnya (playlist), dipanggil di thread pemilik saat lagu selesai
+        self.next_track = next_track
+        self.gap_ms = 0  # Jeda antar lagu saat handoff playlist (ms)
+        # Timing jadwal/dispatch/emit per group untuk lagu terakhir yang diputar
+        self.telemetry = NoteTelemetry()
+
+        self.hold_ms = DEFAULT_HOLD_MS  # Lama key ditahan sebelum key-up
+        self.state = PlaybackState.IDLE
+        # Progress bersama: ditulis thread pemilik, di-sample UI tanpa signal per group
+        self.position_ms = 0  # Posisi group terakhir yang dimainkan
+        self.total_ms = 0  # Durasi timeline sesi terakhir
+        self.progress_publishes = 0  # Jumlah update posisi di sesi terakhir
+        self.start_position = 0  # Posisi awal untuk play berikutnya (hasil seek saat berhenti)
+
+        self._commands = deque()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._release_seq = itertools.count()  # Tie-breaker untuk heap key-up
+
+        # Flag sesi, hanya diubah oleh thread pemilik
+        self._stop_requested = False
+        self._shutdown = False
+        self._seek_ms: Optional[int] = None
+
+    @property
+    def is_active(self) -> bool:
+        """True selama countdown, playing, atau paused"""
+        return self.state != PlaybackState.IDLE
+
+    def progress(self) -> Tuple[int, int]:
+        """Snapshot (position_ms, total_ms) untuk di-sample oleh UI"""
+        return self.position_ms, self.total_ms
+
+    @property
+    def thread(self) -> Optional[threading.Thread]:
+        return self._thread
+
+    # STEP C1: Command API - Dipanggil dari thread mana pun (UI, CLI)
+    def play(self, timeline: CompiledTimeline, position_ms: Optional[int] = None,
+             countdown: int = DEFAULT_COUNTDOWN_SECONDS):
+        self._submit('play', (timeline, position_ms, countdown))
+
+    def toggle_pause(self):
+        self._submit('pause')
+
+    def stop(self):
+        self._submit('stop')
+
+    def seek(self, position_ms: int):
+        self._submit('seek', int(position_ms))
+
+    def set_tempo(self, tempo: float):
+        self._submit('tempo', tempo)
+
+    def shutdown(self, timeout: float = 1.0):
+        """Stop pemutaran dan hentikan thread pemilik"""
+        self._submit('shutdown')
+        if self._thread is not None:
+            self._thread.join(timeout)
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Tunggu sampai tidak ada sesi aktif dan command kosong (untuk mode headless)"""
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._cond:
+            while self._commands or self.state != PlaybackState.IDLE:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._cond.wait(remaining)
+        return True
+
+    def _submit(self, command: str, argument=None):
+        with self._cond:
+            self._commands.append((command, argument))
+            if self._thread is None or not self._thread.is_alive():
+                self._shutdown = False
+                self._thread = threading.Thread(target=self._run, name="playback-controller",
+                                                daemon=True)
+                self._thread.start()
+            self._cond.notify_all()
+
+    # STEP C2: Owner Thread - Loop command saat idle
+    def _run(self):
+        logger.debug("Playback controller thread started")
+        while not self._shutdown:
+            with self._cond:
+                while not self._commands:
+                    self._cond.wait()
+                command, argument = self._commands.popleft()
+                if command == 'play':
+                    # Set di dalam lock agar wait_idle tidak melihat celah IDLE
+                    self.state = PlaybackState.COUNTDOWN
+
+            if command == 'play':
+                timeline, position_ms, countdown = argument
+                if position_ms is not None:
+                    self.start_position = position_ms
+                self._run_session(timeline, self.start_position, countdown)
+            elif command == 'seek':
+                # Berlaku untuk play berikutnya ("play from here")
+                self.start_position = argument
+                self.position_ms = argument
+            elif command == 'tempo':
+                self.scheduler.set_tempo(argument)
+            elif command == 'stop':
+                self.start_position = 0
+                self.position_ms = 0
+                self.on_status("Stopped")
+            elif command == 'pause':
+                logger.warning("No song is currently playing")
+            elif command == 'shutdown':
+                self._shutdown = True
+
+            with self._cond:
+                self._cond.notify_all()  # Bangunkan wait_idle
+        logger.debug("Playback controller thread stopped")
+
+    def _drain_commands(self):
+        """Proses semua command yang masuk selama sesi berjalan"""
+        while True:
+            with self._cond:
+                if not self._commands:
+                    return
+                command, argument = self._commands.popleft()
+
+            if command == 'pause':
+                if self.state == PlaybackState.PLAYING:
+                    self.scheduler.pause()
+                    self.state = PlaybackState.PAUSED
+                    self.on_status("Paused")
+                    logger.info("Paused playback")
+                elif self.state == PlaybackState.PAUSED:
+                    self.scheduler.resume()
+                    self.state = PlaybackState.PLAYING
+                    self.on_status("Playing...")
+                    logger.info("Resumed playback")
+                else:
+                    logger.warning("Cannot pause during countdown")
+            elif command == 'stop':
+                logger.info("Stopping playback")
+                self._stop_requested = True
+            elif command == 'seek':
+                self._seek_ms = argument
+            elif command == 'tempo':
+                self.scheduler.set_tempo(argument)
+            elif command == 'play':
+                logger.warning("Song is already playing")
+            elif command == 'shutdown':
+                self._stop_requested = True
+                self._shutdown = True
+
+    # STEP C3: Interruptible Waits - Condition wait yang bangun saat ada command
+    def _wait_command(self, timeout_ns: Optional[int] = None) -> bool:
+        """Tunggu command baru (maksimal timeout_ns), return True jika ada command"""
+        with self._cond:
+            if not self._commands:
+                self._cond.wait(None if timeout_ns is None else timeout_ns / 1e9)
+            return bool(self._commands)
+
+    def _wait_for(self, time_ms: int) -> Optional[int]:
+        """Tunggu sampai posisi lagu time_ms, return lateness (ns) atau None jika ada command"""
+        scheduler = self.scheduler
+        spin_threshold = scheduler.spin_threshold_ns
+        with self._cond:
+            while not self._commands:
+                remaining = scheduler.deadline_ns(time_ms) - time.perf_counter_ns()
+                if remaining <= spin_threshold:
+                    break
+                self._cond.wait((remaining - spin_threshold) / 1e9)
+            if self._commands:
+                return None
+
+        # Spin/yield singkat sampai deadline, tetap responsif terhadap command
+        deadline_ns = scheduler.deadline_ns(time_ms)
+        while time.perf_counter_ns() < deadline_ns:
+            if self._commands:
+                return None
+            time.sleep(0)
+        return time.perf_counter_ns() - deadline_ns
+
+    # STEP C4: Key Release Scheduling - Key-up terjadwal setelah hold
+    def _shorten_repeated_releases(self, pending_releases: list, keys: Tuple[str, ...], time_ms: int):
+        """Majukan key-up untuk key yang akan ditekan lagi sebelum hold-nya selesai"""
+        changed = False
+        for index, (release_ms, seq, held_keys, down_ms) in enumerate(list(pending_releases)):
+            if release_ms <= time_ms - MIN_RELEASE_GAP_MS:
+                continue
+            repeated = tuple(key for key in held_keys if key in keys)
+            if not repeated:
+                continue
+            early_ms = max(down_ms, time_ms - MIN_RELEASE_GAP_MS)
+            remaining = tuple(key for key in held_keys if key not in keys)
+            pending_releases[index] = (early_ms, seq, repeated, down_ms)
+            if remaining:
+                pending_releases.append((release_ms, next(self._release_seq), remaining, down_ms))
+            changed = True
+        if changed:
+            heapq.heapify(pending_releases)
+
+    def _flush_releases(self, pending_releases: list, until_ms: Optional[int] = None) -> bool:
+        """Kirim key-up terjadwal sebelum until_ms (None = semua), False jika di-interrupt"""
+        while pending_releases and (until_ms is None or pending_releases[0][0] <= until_ms):
+            if self._wait_for(pending_releases[0][0]) is None:
+                return False
+            _, _, held_keys, _ = heapq.heappop(pending_releases)
+            self.input_pool.dispatch(held_keys, self.backend.chord_up)
+        return True
+
+    def _release_all(self, pending_releases: list):
+        """Lepaskan semua key yang masih ditahan sekarang juga"""
+        while pending_releases:
+            _, _, held_keys, _ = heapq.heappop(pending_releases)
+            self.input_pool.dispatch(held_keys, self.backend.chord_up)
+
+    # STEP C5: Playback Session - Countdown lalu mainkan timeline
+    def _countdown(self, seconds: int) -> bool:
+        """Countdown sebelum play, return False jika di-stop"""
+        logger.info("Starting %d-second countdown", seconds)
+        for i in range(seconds, 0, -1):
+            self.on_status(f"Starting in {i}...")
+            logger.info("Countdown: %d", i)
+            deadline_ns = time.perf_counter_ns() + 1_000_000_000
+            while True:
+                remaining = deadline_ns - time.perf_counter_ns()
+                if remaining <= 0:
+                    break
+                if self._wait_command(remaining):
+                    self._drain_commands()
+                    if self._stop_requested:
+                        return False
+        logger.info("Countdown finished, starting playback")
+        return True
+
+    def _run_session(self, timeline: CompiledTimeline, position_ms: int, countdown: int):
+        """Satu sesi pemutaran: countdown, lalu timeline berikutnya dari next_track tanpa countdown"""
+        self._stop_requested = False
+        self._seek_ms = None
+        finished = False
+
+        try:
+            self.state = PlaybackState.COUNTDOWN
+            if countdown and not self._countdown(countdown):
+                # Tidak return: status "Stopped" tetap dikirim di bawah
+                logger.info("Playback cancelled during countdown")
+            else:
+                finished = self._play_tracks(timeline, position_ms)
+        except Exception as e:
+            logger.error("Error during song playback: %s", e)
+            self.on_status("Error occurred during playback")
+        finally:
+            self.input_pool.stop()
+            self.state = PlaybackState.IDLE
+            self.start_position = 0
+
+        if finished:
+            logger.info("Song finished naturally")
+            self.on_status("Finished")
+            self.on_finished()
+        elif self._stop_requested:
+            self.position_ms = 0
+            self.on_status("Stopped")
+        self.on_session_end()
+
+    def _play_tracks(self, timeline: CompiledTimeline, position_ms: int) -> bool:
+        """Mainkan timeline lalu lagu berikutnya dari next_track, return True jika selesai natural"""
+        self.state = PlaybackState.PLAYING
+        self.on_status("Playing...")
+
+        # Worker input dimulai sekali per sesi pemutaran (tetap hidup antar lagu)
+        self.input_pool.start()
+
+        # Heap (release_ms, seq, keys, down_ms), dibawa ke lagu berikutnya saat handoff
+        pending_releases = []
+        anchor_ns = 0
+        try:
+            while True:
+                finished, next_timeline = self._play_timeline(timeline, position_ms,
+                                                              pending_releases, anchor_ns)
+                if next_timeline is None:
+                    return finished
+                # Handoff tanpa countdown: posisi 0 lagu berikutnya jatuh gap_ms (waktu nyata)
+                # setelah key-down terakhir, bukan setelah key-up terakhir selesai
+                gap_song_ms = round(self.gap_ms * self.scheduler.tempo)
+                anchor_ns = self.scheduler.deadline_ns(self.position_ms)
+                offset_ms = self.position_ms + gap_song_ms
+                # Geser seragam ke koordinat lagu berikutnya, urutan heap tetap
+                pending_releases[:] = [(release_ms - offset_ms, seq, held_keys, down_ms - offset_ms)
+                                       for release_ms, seq, held_keys, down_ms in pending_releases]
+                logger.info("Handing off to next track with %dms gap", self.gap_ms)
+                timeline = next_timeline
+                position_ms = -gap_song_ms
+        finally:
+            self._release_all(pending_releases)
+
+    def _play_timeline(self, timeline: CompiledTimeline, position_ms: int,
+                       pending_releases: list,
+                       anchor_ns: int = 0) -> Tuple[bool, Optional[CompiledTimeline]]:
+        """Mainkan satu timeline dari position_ms, return (selesai natural, timeline berikutnya)
+
+        Timeline berikutnya diminta dari next_track begitu group terakhir
+        dikirim; jika ada, key-up yang tersisa tidak ditunggu tapi dibiarkan
+        di pending_releases untuk lagu berikutnya.
+        """
+        finished = False
+        next_timeline = None
+        next_requested = False
+        total_time = timeline.duration_ms
+        self.total_ms = total_time
+        self.progress_publishes = 0
+        logger.info("Playing %d note groups over %dms", len(timeline), total_time)
+
+        try:
+            # Semua deadline dihitung dari titik mulai absolut ini (anchor_ns saat handoff)
+            self.scheduler.start(position_ms, anchor_ns)
+            self.telemetry.reset()
+            self.position_ms = max(0, position_ms)
+
+            # Cari group pertama dari posisi awal dengan bisection
+            index = bisect.bisect_left(timeline.times, position_ms)
+            group_count = len(timeline)
+
+            while True:
+                self._drain_commands()
+                if self._stop_requested:
+                    logger.info("Playback stopped by user")
+                    break
+
+                # Seek diproses sebelum pause: saat paused posisi dan jadwal tetap pindah
+                if self._seek_ms is not None:
+                    index = self._apply_seek(timeline, pending_releases)
+                    continue
+
+                if self.state == PlaybackState.PAUSED:
+                    # Lepaskan semua key lalu tidur sampai ada command (resume/stop/seek)
+                    self._release_all(pending_releases)
+                    self._wait_command()
+                    continue
+
+                if index >= group_count:
+                    if not next_requested and self.next_track is not None:
+                        next_requested = True
+                        next_timeline = self.next_track()
+                    if next_timeline is not None:
+                        finished = True
+                        break
+                    # Tidak ada group lagi dan tidak ada lagu berikutnya, tunggu key-up terakhir
+                    if self._flush_releases(pending_releases):
+                        finished = True
+                        break
+                    continue
+
+                time_ms = timeline.times[index]
+                keys = timeline.group_keys(index)
+
+                # Key-up yang jatuh tempo sebelum group ini dikirim lebih dulu
+                self._shorten_repeated_releases(pending_releases, keys, time_ms)
+                if not self._flush_releases(pending_releases, time_ms):
+                    continue
+
+                # Wait sampai waktunya play group ini (Condition wait + spin)
+                lateness_ns = self._wait_for(time_ms)
+                if lateness_ns is None:
+                    continue  # Ada command, proses dulu di awal loop
+
+                # Key-down untuk semua notes di group ini, key-up dijadwalkan setelah hold
+                ticket = self.input_pool.dispatch(keys, self.backend.chord_down)
+                self.telemetry.record(time_ms, self.scheduler.deadline_ns(time_ms), ticket, len(keys))
+                if HOT_PATH_DEBUG:
+                    logger.debug("Group %d at %dms: %s (%.3fms late)",
+                                 index, time_ms, keys, lateness_ns / 1e6)
+                # Hold dalam waktu nyata, dikonversi ke posisi lagu sesuai tempo
+                hold_song_ms = max(1, round(self.hold_ms * self.scheduler.tempo))
+                heapq.heappush(pending_releases,
+                               (time_ms + hold_song_ms, next(self._release_seq), keys, time_ms))
+                self.scheduler.record(lateness_ns)
+
+                # Publikasikan progress (di-sample UI, tanpa signal per group)
+                self.position_ms = time_ms
+                self.progress_publishes += 1
+                index += 1
+        finally:
+            if next_timeline is None:
+                self._release_all(pending_releases)
+
+        self.telemetry.finish()
+        logger.info("Scheduler timing: %s", self.scheduler.summary())
+        logger.info("Note timing: %s", self.telemetry.summary())
+        logger.info("Input dispatch: %s", self.input_pool.stats())
+        return finished, next_timeline
+
+    def _apply_seek(self, timeline: CompiledTimeline, pending_releases: list) -> int:
+        """Proses seek di thread pemilik, return index group pertama dari posisi baru"""
+        position_ms = self._seek_ms
+        self._seek_ms = None
+
+        # Lepaskan semua key yang masih ditahan sebelum lompat
+        self._release_all(pending_releases)
+
+        # Rebase jadwal pada posisi baru dan cari group dengan bisection
+        self.scheduler.rebase(position_ms)
+        self.position_ms = position_ms
+        self.progress_publishes += 1
+        logger.info("Seek to %dms", position_ms)
+        return bisect.bisect_left(timeline.times, position_ms)
@@ -0,0 +1,1382 @@
+# =============================================================================
+# Sky Music Player App - Engine pemutaran dan main window (PyQt6)
+# =============================================================================
+# Di-import oleh main() di main.py setelah startup profiling dan logging aktif.
+# Dipisah dari main.py karena worker SongImportJob (spawn di Windows) meng-import
+# ulang script utama: worker tidak perlu memuat Qt.
+
+# =============================================================================
+# STEP 1: Import Libraries - Menyiapkan semua tools yang dibutuhkan
+# =============================================================================
+import json
+import os
+import threading
+import sqlite3
+import logging
+from typing import Dict, List, Optional, Tuple
+from PyQt6.QtWidgets import (QMainWindow, QVBoxLayout, QHBoxLayout, 
+                             QPushButton, QLabel, QListWidget, QWidget, QFileDialog,
+                             QProgressBar, QSpinBox, QCheckBox, QGroupBox, QComboBox)
+from PyQt6.QtCore import QTimer, pyqtSignal, QObject, Qt, QCoreApplication
+from PyQt6.QtGui import QFont, QPalette, QColor, QIcon
+from scheduler import PlaybackScheduler
+from input_backend import InputBackend, LazyInputBackend, create_default_backend
+from input_pool import InputWorkerPool
+from key_mapping import KEY_MAPPING
+from timeline import CompiledTimeline, compile_timeline
+from playback import PlaybackController, PlaybackState, DEFAULT_COUNTDOWN_SECONDS
+from playlist import PlaylistMode, PlaylistQueue
+from note_columns import NoteColumns
+from song_loader import SongData, SongImportJob, parse_song
+from library_index import LibraryIndex, find_stale
+from library_scan import LibraryWatcher, scan_song_files
+from song_archive import expand_archives, normalize_song_path
+from song_cache import DEFAULT_CACHE_BUDGET_BYTES, SongCache
+import startup_profile
+
+# =============================================================================
+# STEP 2: Setup Logging System - Sistem untuk mencatat aktivitas aplikasi
+# =============================================================================
+# Handler dipasang oleh main.py (setup_logging di log_pipeline.py)
+logger = logging.getLogger(__name__)
+
+# =============================================================================
+# STEP 3: Data Classes - Struktur data untuk menyimpan informasi musik
+# =============================================================================
+# SongData didefinisikan di song_loader.py (dipakai juga oleh worker import),
+# Note dan NoteColumns di note_columns.py
+
+# =============================================================================
+# STEP 4: Music Player Engine - Inti sistem pemutaran musik
+# =============================================================================
+class MidiPlayer(QObject):
+    """Class untuk mengelola pemutaran musik MIDI dengan dukungan simultaneous notes"""
+    
+    # Signals untuk komunikasi dengan UI
+    progress_updated = pyqtSignal(int, int)  # current_time, total_time
+    song_finished = pyqtSignal()
+    status_changed = pyqtSignal(str)
+    track_changed = pyqtSignal(object)  # SongData yang mulai diputar lewat handoff playlist
+    session_ended = pyqtSignal()  # Sesi pemutaran berakhir, telemetry siap dibaca
+    
+    def __init__(self, backend: Optional[InputBackend] = None,
+                 cache_budget_bytes: int = DEFAULT_CACHE_BUDGET_BYTES):
+        super().__init__()
+        logger.info("Initializing MidiPlayer")
+        
+        # Status pemutaran
+        self._current_song: Optional[SongData] = None
+        self.scheduler = PlaybackScheduler()  # Scheduler presisi tinggi (perf_counter_ns)
+        
+        # Key mapping untuk berbagai instrumen Sky Music (lihat key_mapping.py)
+        self.key_mapping = dict(KEY_MAPPING)
+        
+        # Backend input (default: pydirectinput, di-load saat play pertama) dan pool worker persisten
+        self.backend = backend or LazyInputBackend(create_default_backend)
+        self.input_pool = InputWorkerPool(self.backend,
+                                          worker_count=len(set(self.key_mapping.values())))
+        if not isinstance(self.backend, LazyInputBackend):
+            logger.info(f"Using input backend: {self.backend.name}")
+        
+        # Controller dengan satu thread pemilik untuk semua perintah pemutaran
+        self.controller = PlaybackController(
+            self.backend, self.input_pool, self.scheduler,
+            on_status=self.status_changed.emit,
+            on_finished=self.song_finished.emit,
+            on_session_end=self.session_ended.emit,
+            next_track=self._next_track,
+        )
+        
+        # Notes + timeline lagu yang pernah dipilih, dibatasi byte budget (LRU)
+        self.song_cache = SongCache(loader=self._load_full_song, budget_bytes=cache_budget_bytes)
+        
+        # Playlist: lagu berikutnya di-compile di background selama lagu sekarang diputar
+        self.playlist: PlaylistQueue[SongData] = PlaylistQueue(prepare=self.get_timeline)
+        logger.info("MidiPlayer initialized successfully")
+    
+    # STEP 5: Song Loading Function - Fungsi untuk memuat file lagu
+    def load_song(self, file_path: str) -> bool:
+        """Load song dari file JSON, .json.gz, .skyc, atau member song pack .zip"""
+        logger.info(f"Loading song from: {file_path}")
+        
+        try:
+            self.current_song = parse_song(file_path)
+            
+            logger.info(f"Successfully loaded song: {self.current_song.name} "
+                       f"(BPM: {self.current_song.bpm}, Notes: {len(self.current_song.notes)})")
+            return True
+            
+        except FileNotFoundError:
+            logger.error(f"File not found: {file_path}")
+            return False
+        except json.JSONDecodeError as e:
+            logger.error(f"Invalid JSON format in {file_path}: {e}")
+            return False
+        except Exception as e:
+            logger.error(f"Unexpected error loading song from {file_path}: {e}")
+            return False
+    
+    # STEP 6: Timeline Compilation - Compile lagu sekali, dipakai ulang oleh UI dan playback
+    def _load_full_song(self, file_path: str) -> SongData:
+        """Loader SongCache: parse notes dan compile timeline sekaligus"""
+        song = parse_song(file_path)
+        self.get_timeline(song)
+        return song
+    
+    def get_notes(self, song: SongData) -> NoteColumns:
+        """Notes lagu, dari SongCache jika song hanya berisi metadata"""
+        if song.notes is not None:
+            return song.notes
+        return self.song_cache.get(song.file_path).notes
+    
+    def get_timeline(self, song: SongData) -> CompiledTimeline:
+        """Return CompiledTimeline untuk song, compile dan cache jika belum ada"""
+        if song.notes is None:
+            # Entry list (metadata saja): timeline disimpan di SongCache
+            return self.song_cache.get(song.file_path).timeline
+        if song.timeline is None:
+            song.timeline = compile_timeline(song.notes, self.key_mapping)
+            song.chord_count = song.timeline.chord_count
+            if song.timeline.unknown_keys:
+                logger.warning(f"{song.timeline.unknown_keys} notes with unknown key mapping in {song.name}")
+            logger.debug(f"Compiled timeline for {song.name}: {len(song.timeline)} groups, "
+                         f"{song.timeline.nbytes} bytes")
+        return song.timeline
+    
+    def prefetch(self, song: SongData):
+        """Muat notes lagu ke SongCache di background (misalnya saat lagu dipilih)"""
+        if song.notes is None and song.file_path not in self.song_cache:
+            self.song_cache.prefetch(song.file_path)
+    
+    # STEP 7: Playback Settings - Tempo, hold key, dan jeda antar lagu
+    def set_speed(self, percent: int):
+        """Set tempo pemutaran dalam persen (100 = normal), berlaku mulai group berikutnya"""
+        self.controller.set_tempo(percent / 100.0)
+        logger.info(f"Playback speed set to {percent}%")
+    
+    def set_gap_ms(self, gap_ms: int):
+        """Set jeda antar lagu saat pindah ke lagu berikutnya di playlist (ms)"""
+        self.controller.gap_ms = max(0, int(gap_ms))
+        logger.info(f"Track gap set to {self.controller.gap_ms}ms")
+    
+    def set_playlist_mode(self, mode: str):
+        """Set mode playlist dan siapkan ulang lagu berikutnya"""
+        self.playlist.set_mode(mode)
+        if self.controller.is_active:
+            self.playlist.prepare_next()
+    
+    @property
+    def hold_ms(self) -> int:
+        return self.controller.hold_ms
+    
+    def set_hold_ms(self, hold_ms: int):
+        """Set lama key ditahan sebelum key-up (ms)"""
+        self.controller.hold_ms = max(1, int(hold_ms))
+        logger.info(f"Key hold duration set to {self.controller.hold_ms}ms")
+    
+    # STEP 8: Playback State - Status pemutaran dibaca dari controller
+    @property
+    def current_song(self) -> Optional[SongData]:
+        return self._current_song
+    
+    @current_song.setter
+    def current_song(self, song: Optional[SongData]):
+        if song is not self._current_song and not self.controller.is_active:
+            # Posisi seek lagu sebelumnya tidak berlaku untuk lagu baru
+            self.controller.start_position = 0
+        self._current_song = song
+    
+    @property
+    def is_playing(self) -> bool:
+        """True selama countdown, playing, atau paused"""
+        return self.controller.is_active
+    
+    @property
+    def is_paused(self) -> bool:
+        return self.controller.state == PlaybackState.PAUSED
+    
+    @property
+    def current_position(self) -> int:
+        return self.controller.position_ms
+    
+    @property
+    def play_thread(self) -> Optional[threading.Thread]:
+        """Satu-satunya thread pemutaran (milik controller)"""
+        return self.controller.thread
+    
+    # STEP 9: Play Control Functions - Fungsi kontrol pemutaran (play, pause, stop)
+    def play(self, position_ms: Optional[int] = None):
+        """Start playing current song dengan countdown (dari position_ms jika diberikan)"""
+        if not self.current_song:
+            logger.warning("No song loaded, cannot play")
+            return
+        
+        logger.info(f"Starting to play: {self.current_song.name}")
+        try:
+            timeline = self.get_timeline(self.current_song)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to load {self.current_song.file_path}: {e}")
+            self.status_changed.emit(f"Failed to load {self.current_song.name}")
+            return
+        self.preload_backend()
+        self.controller.play(timeline, position_ms, countdown=DEFAULT_COUNTDOWN_SECONDS)
+        logger.info(f"Song cache: {self.song_cache.stats()}")
+        self.playlist.prepare_next()
+    
+    def preload_backend(self):
+        """Load backend input di background (selama countdown), bukan di note pertama"""
+        if isinstance(self.backend, LazyInputBackend) and not self.backend.is_loaded:
+            threading.Thread(target=self.backend.load, name="input-backend-load",
+                             daemon=True).start()
+    
+    def _next_track(self) -> Optional[CompiledTimeline]:
+        """Dipanggil thread controller saat lagu selesai, return timeline lagu berikutnya"""
+        song = self.playlist.advance()
+        if song is None:
+            return None
+        timeline = self.playlist.take_prepared(song)
+        self._current_song = song
+        logger.info(f"Next track: {song.name}")
+        self.track_changed.emit(song)
+        self.playlist.prepare_next()
+        return timeline
+    
+    def pause(self):
+        """Pause/resume playing"""
+        self.controller.toggle_pause()
+    
+    def stop(self):
+        """Stop playing"""
+        self.controller.stop()
+    
+    def seek(self, position_ms: int):
+        """Pindah ke posisi position_ms, saat playing, paused, maupun berhenti"""
+        if not self.current_song:
+            logger.warning("No song loaded, cannot seek")
+            return
+        
+        total_time = self.current_song.duration_ms
+        position_ms = max(0, min(int(position_ms), total_time))
+        self.controller.seek(position_ms)
+        if not self.controller.is_active:
+            # Saat playing, posisi baru di-sample UI lewat progress()
+            self.progress_updated.emit(position_ms, total_time)
+    
+    def progress(self) -> Tuple[int, int]:
+        """Snapshot (current_time, total_time) pemutaran untuk di-sample UI"""
+        return self.controller.progress()
+    
+    def shutdown(self):
+        """Stop pemutaran dan hentikan thread controller"""
+        self.controller.shutdown()
+        self.playlist.shutdown()
+        self.song_cache.shutdown()
+
+# =============================================================================
+# STEP 10b: Seekable Progress Bar - Progress bar yang bisa di-klik/drag untuk seek
+# =============================================================================
+# Resolusi progress bar (per mille) agar seek cukup presisi untuk lagu panjang
+PROGRESS_STEPS = 1000
+# Frekuensi UI men-sample posisi pemutaran (Hz)
+PROGRESS_UI_HZ = 30
+
+class SeekProgressBar(QProgressBar):
+    """QProgressBar yang emit posisi (0.0 - 1.0) saat di-klik atau di-drag"""
+    
+    seek_requested = pyqtSignal(float)
+    
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.setRange(0, PROGRESS_STEPS)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+    
+    def _emit_seek(self, event):
+        if self.width() > 0:
+            fraction = min(max(event.position().x() / self.width(), 0.0), 1.0)
+            self.setValue(int(fraction * PROGRESS_STEPS))
+            self.seek_requested.emit(fraction)
+        event.accept()
+    
+    def mousePressEvent(self, event):
+        if event.button() == Qt.MouseButton.LeftButton:
+            self._emit_seek(event)
+    
+    def mouseMoveEvent(self, event):
+        if event.buttons() & Qt.MouseButton.LeftButton:
+            self._emit_seek(event)
+
+# =============================================================================
+# STEP 11: Main Window Class - Class utama untuk tampilan aplikasi
+# =============================================================================
+class SkyMusicPlayer(QMainWindow):
+    """Main window class untuk Sky Music Player"""
+    
+    # Signals dari thread import ke UI (queued ke GUI thread)
+    import_batch_ready = pyqtSignal(list, list)  # songs, [(file_path, error)]
+    import_finished = pyqtSignal(int, int, bool)  # loaded, failed, cancelled
+    library_changed = pyqtSignal(list, list, list)  # added, changed, removed (scan/watcher)
+    folder_scanned = pyqtSignal(str, list)  # root, song file paths
+    
+    def __init__(self):
+        super().__init__()
+        logger.info("Initializing Sky Music Player main window")
+        
+        self.player = MidiPlayer()
+        self.song_list: List[SongData] = []  # List untuk menyimpan semua song data
+        self.loaded_file_paths = set()  # Set untuk track file yang sudah di-load (mencegah duplikasi)
+        self.import_job: Optional[SongImportJob] = None  # Import folder/file yang sedang berjalan
+        self.import_skipped = 0
+        self.import_loaded = 0  # Counter import yang sudah masuk ke list
+        self.import_failed = 0
+        self.pending_import_paths: List[str] = []  # File yang menunggu import berikutnya
+        # Deduplikasi isi: content_hash -> path lagu yang tampil, dan path -> lagu duplikat tersembunyi
+        self.song_hashes: Dict[str, str] = {}
+        self.duplicate_songs: Dict[str, SongData] = {}
+        self.import_duplicates = 0
+        
+        # Folder library (rekursif) dan watcher perubahan file di folder tersebut
+        self.library_roots: List[str] = []
+        self.watcher = LibraryWatcher([], on_change=self.library_changed.emit)
+        
+        # Index library persisten, dibuka setelah frame pertama (lihat open_library)
+        self.library: Optional[LibraryIndex] = None
+        
+        self.setup_window_properties()
+        self.setup_ui()
+        self.setup_connections()
+        self.setup_progress_timer()
+        self.apply_cyberpunk_style()
+        # Window tampil dulu, baru buka SQLite dan isi list dari library index
+        QTimer.singleShot(0, self.open_library)
+        
+        logger.info("Sky Music Player initialized successfully")
+    
+    # STEP 12: Window Properties Setup - Pengaturan dasar tampilan window
+    def setup_window_properties(self):
+        """Setup window properties untuk transparan dan frameless"""
+        logger.debug("Setting up window properties")
+        
+        # Hapus title bar dan borders, tapi tetap muncul di taskbar
+        self.setWindowFlags(
+            Qt.WindowType.FramelessWindowHint | 
+            Qt.WindowType.WindowStaysOnTopHint
+        )
+        
+        # Set window transparency
+        self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+        
+        # Tambahkan ini untuk memastikan window muncul di taskbar
+        self.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating, False)
+        
+        # Set window size dan posisi
+        self.setGeometry(100, 100, 800, 600)
+        self.setWindowTitle("Sky Music - By Ayy")
+        
+        logger.debug("Window properties configured for transparent frameless display")
+    
+    # STEP 13: UI Layout Creation - Membuat layout dan elemen-elemen visual
+    def setup_ui(self):
+        """Setup user interface"""
+        logger.debug("Setting up UI components")
+        
+        # Main container widget sebagai container utama
+        main_container = QWidget()
+        main_container.setObjectName("MainContainer")
+        self.setCentralWidget(main_container)
+        
+        # Main layout dengan margins untuk visual border
+        main_layout = QVBoxLayout(main_container)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(15)
+        
+        # STEP 13a: Title Bar - Membuat title bar dengan tombol close
+        title_layout = QHBoxLayout()
+        
+        # Title label
+        title_label = QLabel("Sky Music - By Ayy")
+        title_label.setStyleSheet("""
+            QLabel {
+                color: #00ffff;
+                font-size: 16px;
+                font-weight: bold;
+                padding: 10px;
+            }
+        """)
+        
+        # Close button
+        self.close_btn = QPushButton("⌐")
+        self.close_btn.clicked.connect(self.close_application)
+        self.close_btn.setFixedSize(60, 35)
+        self.close_btn.setStyleSheet("""
+            QPushButton {
+                background-color: rgba(200, 0, 0, 0);
+                color: white;
+                border: 2px solid #ff4444;
+                border-radius: 8px;
+                font-weight: bold;
+            } 
+            QPushButton:hover {
+                background-color: rgba(255, 0, 0, 220);
+            }
+        """)
+        
+        title_layout.addWidget(title_label)
+        title_layout.addStretch()
+        title_layout.addWidget(self.close_btn)
+        
+        main_layout.addLayout(title_layout)
+        
+        # STEP 13b: File Management Section - Area untuk memilih dan mengelola file
+        file_group = QGroupBox("File Management")
+        file_layout = QHBoxLayout(file_group)
+        
+        self.select_folder_btn = QPushButton("Select Folder")
+        self.select_files_btn = QPushButton("Select Files")
+        self.clear_list_btn = QPushButton("Clear List")
+        self.cancel_import_btn = QPushButton("Cancel")
+        self.cancel_import_btn.setEnabled(False)
+        self.import_label = QLabel("")  # Counter loaded/failed selama import
+        self.watch_check = QCheckBox("Watch")  # Update list otomatis saat folder berubah
+        self.watch_check.setChecked(True)
+        
+        file_layout.addWidget(self.select_folder_btn)
+        file_layout.addWidget(self.select_files_btn)
+        file_layout.addWidget(self.clear_list_btn)
+        file_layout.addWidget(self.cancel_import_btn)
+        file_layout.addWidget(self.watch_check)
+        file_layout.addWidget(self.import_label)
+        
+        main_layout.addWidget(file_group)
+        
+        # STEP 13c: Song List Widget - Daftar lagu yang bisa dipilih
+        list_group = QGroupBox("Song List")
+        list_layout = QVBoxLayout(list_group)
+        
+        self.song_list_widget = QListWidget()
+        self.song_list_widget.setMinimumHeight(250)  # Tinggi minimum 250 pixel
+        
+        list_layout.addWidget(self.song_list_widget)
+        
+        main_layout.addWidget(list_group)
+        
+        # STEP 13d: Control Section - Tombol-tombol kontrol pemutaran
+        control_group = QGroupBox("Controls")
+        control_layout = QVBoxLayout(control_group)
+        
+        # Playback controls
+        playback_layout = QHBoxLayout()
+        
+        self.play_btn = QPushButton("Play")
+        self.pause_btn = QPushButton("Pause/Resume")
+        self.stop_btn = QPushButton("Stop")
+        
+        playback_layout.addWidget(self.play_btn)
+        playback_layout.addWidget(self.pause_btn)
+        playback_layout.addWidget(self.stop_btn)
+        
+        control_layout.addLayout(playback_layout)
+        
+        # STEP 13e: Settings Controls - Pengaturan kecepatan, hold, dan playlist
+        settings_layout = QHBoxLayout()
+        
+        self.speed_label = QLabel("Speed:")
+        self.speed_spin = QSpinBox()
+        self.speed_spin.setRange(50, 200)
+        self.speed_spin.setValue(100)
+        self.speed_spin.setSuffix("%")
+        
+        self.hold_label = QLabel("Hold:")
+        self.hold_spin = QSpinBox()
+        self.hold_spin.setRange(5, 500)
+        self.hold_spin.setValue(self.player.hold_ms)
+        self.hold_spin.setSuffix(" ms")
+        
+        # Panel playlist jarang dipakai: dibuat saat tombol Playlist pertama kali ditekan
+        self.playlist_btn = QPushButton("Playlist")
+        self.playlist_btn.setCheckable(True)
+        self.playlist_panel: Optional[QWidget] = None
+        
+        settings_layout.addWidget(self.speed_label)
+        settings_layout.addWidget(self.speed_spin)
+        settings_layout.addWidget(self.hold_label)
+        settings_layout.addWidget(self.hold_spin)
+        settings_layout.addStretch()
+        settings_layout.addWidget(self.playlist_btn)
+        
+        control_layout.addLayout(settings_layout)
+        self.control_layout = control_layout
+        
+        main_layout.addWidget(control_group)
+        
+        # STEP 13f: Status Section - Area untuk menampilkan status dan progress
+        status_group = QGroupBox("Status")
+        status_layout = QVBoxLayout(status_group)
+        
+        self.status_label = QLabel("Ready - Now supports simultaneous notes!")
+        self.progress_bar = SeekProgressBar()  # Klik/drag untuk seek
+        
+        # Timing note aktual vs jadwal dari lagu terakhir (lihat telemetry.py)
+        timing_layout = QHBoxLayout()
+        self.timing_label = QLabel("Timing: -")
+        self.export_timing_btn = QPushButton("Export Timing")
+        self.export_timing_btn.setEnabled(False)
+        timing_layout.addWidget(self.timing_label)
+        timing_layout.addStretch()
+        timing_layout.addWidget(self.export_timing_btn)
+        
+        status_layout.addWidget(self.status_label)
+        status_layout.addWidget(self.progress_bar)
+        status_layout.addLayout(timing_layout)
+        
+        main_layout.addWidget(status_group)
+        
+        # Initially disable control buttons
+        self.play_btn.setEnabled(False)
+        self.pause_btn.setEnabled(False)
+        self.stop_btn.setEnabled(False)
+        
+        logger.debug("UI setup completed")
+    
+    # STEP 14: Signal Connections - Menghubungkan tombol dengan fungsi-fungsinya
+    def setup_connections(self):
+        """Setup signal connections"""
+        logger.debug("Setting up signal connections")
+        
+        # File management connections
+        self.select_folder_btn.clicked.connect(self.select_folder)
+        self.select_files_btn.clicked.connect(self.select_files)
+        self.clear_list_btn.clicked.connect(self.clear_song_list)
+        self.cancel_import_btn.clicked.connect(self.cancel_import)
+        self.import_batch_ready.connect(self.add_imported_songs)
+        self.import_finished.connect(self.import_completed)
+        self.library_changed.connect(self.apply_library_changes)
+        self.folder_scanned.connect(self.folder_scan_completed)
+        self.watch_check.toggled.connect(self.set_watch_enabled)
+        self.song_list_widget.currentRowChanged.connect(self.song_selected)
+        
+        # Playback control connections
+        self.play_btn.clicked.connect(self.play_song)
+        self.pause_btn.clicked.connect(self.pause_song)
+        self.stop_btn.clicked.connect(self.stop_song)
+        
+        # Settings connections
+        self.speed_spin.valueChanged.connect(self.player.set_speed)
+        self.progress_bar.seek_requested.connect(self.seek_song)
+        self.hold_spin.valueChanged.connect(self.player.set_hold_ms)
+        self.playlist_btn.toggled.connect(self.toggle_playlist_panel)
+        self.export_timing_btn.clicked.connect(self.export_timing)
+        
+        # Player signal connections
+        self.player.progress_updated.connect(self.update_progress)
+        self.player.song_finished.connect(self.song_finished)
+        self.player.status_changed.connect(self.update_status)
+        self.player.track_changed.connect(self.track_changed)
+        self.player.session_ended.connect(self.update_timing)
+        
+        logger.debug("Signal connections completed")
+    
+    # STEP 14b: Progress Sampling - UI membaca posisi player dengan timer, bukan signal per group
+    def setup_progress_timer(self):
+        """Setup QTimer untuk sampling progress pada frame rate UI"""
+        self.progress_timer = QTimer(self)
+        self.progress_timer.timeout.connect(self.sample_progress)
+        self.set_progress_rate(PROGRESS_UI_HZ)
+        
+        self._last_progress: Optional[Tuple[int, int]] = None
+        self.progress_ui_updates = 0  # Update progress bar di lagu ini
+        self.progress_signals_saved = 0  # Signal yang dihemat di lagu terakhir
+    
+    def set_progress_rate(self, hz: int):
+        """Set frekuensi sampling progress (Hz)"""
+        self.progress_timer.setInterval(max(1, 1000 // max(1, hz)))
+        logger.debug(f"Progress sampling rate set to {hz} Hz")
+    
+    def start_progress_sampling(self):
+        """Reset counter dan mulai sampling progress"""
+        self._last_progress = None
+        self.progress_ui_updates = 0
+        self.progress_timer.start()
+    
+    def stop_progress_sampling(self):
+        """Stop sampling dan catat berapa signal progress yang dihemat"""
+        if not self.progress_timer.isActive():
+            return
+        self.progress_timer.stop()
+        publishes = self.player.controller.progress_publishes
+        self.progress_signals_saved = max(0, publishes - self.progress_ui_updates)
+        logger.info(f"Progress: {publishes} position updates shown with {self.progress_ui_updates} "
+                    f"UI updates ({self.progress_signals_saved} signals saved)")
+    
+    def sample_progress(self):
+        """Dipanggil QTimer: baca posisi player dan update progress bar jika berubah"""
+        progress = self.player.progress()
+        if progress != self._last_progress:
+            self._last_progress = progress
+            self.progress_ui_updates += 1
+            self.update_progress(*progress)
+    
+    # STEP 15: Cyberpunk Styling - Menerapkan tema cyberpunk yang keren
+    def apply_cyberpunk_style(self):
+        """Apply cyberpunk theme styling dengan transparansi dan main container"""
+        logger.debug("Applying cyberpunk theme with transparency and main container")
+        
+        self.setStyleSheet("""
+            QMainWindow {
+                background-color: transparent;
+                color: #00ffff;
+                font-family: 'Consolas', 'Monaco', monospace;
+            }
+            
+            #MainContainer {
+                background-color: rgba(50, 50, 70, 180);
+                border: 2px solid #00ffff;
+                border-radius: 15px;
+            }
+            
+            QWidget {
+                background-color: transparent;
+            }
+            
+            QGroupBox {
+                border: 2px solid rgba(0, 255, 255, 200);
+                border-radius: 8px;
+                margin: 20px;
+                padding-top: 15px;
+                font-weight: bold;
+                color: #00ffff;
+                background-color: rgba(26, 26, 58, 100);
+            }
+            
+            QGroupBox::title {
+                subcontrol-origin: margin;
+                left: 15px;
+                padding: 0 10px 0 10px;
+                background-color: rgba(10, 10, 26, 200);
+                border-radius: 4px;
+            }
+            
+            QPushButton {
+                background-color: rgba(26, 26, 58, 150);
+                border: 2px solid #00ffff;
+                border-radius: 6px;
+                padding: 8px 16px;
+                color: #00ffff;
+                font-weight: bold;
+                min-height: 20px;
+            }
+            
+            QPushButton:hover {
+                background-color: rgba(42, 42, 74, 200);
+                border-color: #44ffff;
+            }
+            
+            QPushButton:pressed {
+                background-color: rgba(0, 255, 255, 200);
+                color: #0a0a1a;
+            }
+            
+            QPushButton:disabled {
+                background-color: rgba(26, 26, 42, 100);
+                border-color: #666666;
+                color: #666666;
+            }
+            
+            QListWidget {
+                background-color: rgba(26, 26, 42, 150);
+                border: 2px solid #00ffff;
+                border-radius: 6px;
+                color: #00ffff;
+                selection-background-color: rgba(0, 255, 255, 100);
+                selection-color: #0a0a1a;
+                padding: 5px;
+            }
+            
+            QListWidget::item {
+                padding: 8px;
+                border-bottom: 1px solid rgba(51, 51, 102, 100);
+                background-color: transparent;
+            }
+            
+            QListWidget::item:hover {
+                background-color: rgba(42, 42, 74, 100);
+            }
+            
+            QListWidget::item:selected {
+                background-color: rgba(0, 255, 255, 150);
+                color: #0a0a1a;
+            }
+            
+            QProgressBar {
+                border: 2px solid #00ffff;
+                border-radius: 6px;
+                text-align: center;
+                background-color: rgba(26, 26, 42, 150);
+                color: #00ffff;
+                font-weight: bold;
+            }
+            
+            QProgressBar::chunk {
+                background-color: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+                    stop:0 rgba(0, 255, 255, 200), stop:1 rgba(0, 136, 255, 200));
+                border-radius: 4px;
+            }
+            
+            QLabel {
+                color: #00ffff;
+                font-weight: bold;
+                background-color: transparent;
+            }
+            
+            QSpinBox {
+                background-color: rgba(26, 26, 42, 150);
+                border: 2px solid #00ffff;
+                border-radius: 4px;
+                padding: 4px;
+                color: #00ffff;
+                min-width: 60px;
+            }
+            
+            QSpinBox::up-button, QSpinBox::down-button {
+                background-color: rgba(26, 26, 58, 150);
+                border: 1px solid #00ffff;
+            }
+            
+            QSpinBox::up-arrow, QSpinBox::down-arrow {
+                border: 2px solid #00ffff;
+                width: 6px;
+                height: 6px;
+            }
+            
+            QCheckBox {
+                color: #00ffff;
+                font-weight: bold;
+                background-color: transparent;
+            }
+            
+            QCheckBox::indicator {
+                width: 18px;
+                height: 18px;
+                border: 2px solid #00ffff;
+                border-radius: 4px;
+                background-color: rgba(26, 26, 42, 150);
+            }
+            
+            QCheckBox::indicator:checked {
+                background-color: rgba(0, 255, 255, 200);
+            }
+        """)
+    
+    # STEP 16: Window Control Functions - Fungsi untuk mengontrol window
+    def close_application(self):
+        """Method untuk menutup aplikasi dengan benar"""
+        logger.info("Close button clicked - shutting down application")
+        
+        # Stop player jika sedang bermain
+        if self.player.is_playing:
+            self.player.stop()
+        
+        # Stop import, watcher, dan thread controller pemutaran
+        self.cancel_import()
+        self.watcher.stop()
+        self.player.shutdown()
+        
+        # Tutup window
+        self.close()
+        
+        # Force quit aplikasi
+        QCoreApplication.quit()
+        
+        logger.info("Application shutdown initiated")
+    
+    def closeEvent(self, event):
+        """Override closeEvent untuk memastikan aplikasi benar-benar tertutup"""
+        logger.info("Window close event triggered")
+        
+        # Stop import, watcher, player, dan thread controller
+        self.cancel_import()
+        self.watcher.stop()
+        self.player.shutdown()
+        
+        # Accept close event
+        event.accept()
+        
+        # Force quit aplikasi
+        QCoreApplication.quit()
+        
+        logger.info("Application closed")
+    
+    # STEP 17: File Management Functions - Fungsi untuk mengelola file lagu
+    def clear_song_list(self):
+        """Clear semua song dari list dan reset state"""
+        logger.info("Clearing song list")
+        
+        # Stop playback jika sedang bermain
+        if self.player.is_playing:
+            self.player.stop()
+        self.stop_progress_sampling()
+        self.cancel_import()
+        
+        # Clear semua data
+        self.song_list.clear()
+        self.loaded_file_paths.clear()
+        self.pending_import_paths.clear()
+        self.song_hashes.clear()
+        self.duplicate_songs.clear()
+        self.library_roots.clear()
+        self.watcher.set_roots([])
+        self.player.playlist.clear()
+        self.player.song_cache.clear()
+        if self.library is not None:
+            self.library.clear()
+        self.song_list_widget.clear()
+        
+        # Reset player state
+        self.player.current_song = None
+        
+        # Disable control buttons
+        self.play_btn.setEnabled(False)
+        self.pause_btn.setEnabled(False)
+        self.stop_btn.setEnabled(False)
+        
+        # Reset progress bar
+        self.progress_bar.setValue(0)
+        
+        self.update_status("Song list cleared")
+        logger.info("Song list cleared successfully")
+    
+    def select_folder(self):
+        """Select folder containing song files"""
+        logger.info("Opening folder selection dialog")
+        
+        folder = QFileDialog.getExistingDirectory(self, "Select Folder with Song Files")
+        if folder:
+            logger.info(f"Selected folder: {folder}")
+            self.load_songs_from_folder(folder)
+        else:
+            logger.info("Folder selection cancelled")
+    
+    def select_files(self):
+        """Select individual song files"""
+        logger.info("Opening file selection dialog")
+        
+        files, _ = QFileDialog.getOpenFileNames(
+            self, "Select Song Files", "", "Song Files (*.json *.skyc *.json.gz *.zip);;All Files (*)"
+        )
+        if files:
+            logger.info(f"Selected {len(files)} files")
+            self.load_songs_from_files(files)
+        else:
+            logger.info("File selection cancelled")
+    
+    # STEP 18: Song Loading Functions - Fungsi untuk memuat lagu dari file
+    def load_songs_from_folder(self, folder_path: str):
+        """Tambahkan folder sebagai root library dan load semua lagu di dalamnya (rekursif)"""
+        logger.info(f"Loading songs from folder: {folder_path}")
+        
+        root = os.path.normpath(os.path.abspath(folder_path))
+        if root not in self.library_roots:
+            self.library_roots.append(root)
+            if self.library is not None:
+                self.library.add_root(root)
+            self.update_watcher()
+        self.update_status(f"Scanning {root}...")
+        threading.Thread(target=self._scan_folder, args=(root,),
+                         name="folder-scan", daemon=True).start()
+    
+    def _scan_folder(self, root: str):
+        """Scan folder di thread terpisah, file baru dikirim lewat signal"""
+        try:
+            song_files = scan_song_files([root])
+        except Exception as e:
+            logger.error(f"Error scanning folder {root}: {e}")
+            song_files = []
+        self.folder_scanned.emit(root, song_files)
+    
+    def folder_scan_completed(self, root: str, song_files: List[str]):
+        if song_files:
+            logger.info(f"Found {len(song_files)} song files in {root}")
+            self.load_songs_from_files(song_files)
+        else:
+            message = "No song files found in selected folder"
+            logger.warning(message)
+            self.update_status(message)
+    
+    def load_songs_from_files(self, file_paths: List[str]):
+        """Load songs dari file paths secara paralel di background (tanpa duplikasi)"""
+        if self.import_job is not None and self.import_job.is_running:
+            # Dijalankan setelah import sekarang selesai
+            self.pending_import_paths.extend(file_paths)
+            return
+        
+        logger.info(f"Loading songs from {len(file_paths)} files")
+        
+        # Song pack .zip dibuka menjadi member-membernya (tanpa extract)
+        file_paths = expand_archives(file_paths)
+        
+        # Normalisasi path untuk mencegah duplikasi, sebelum dikirim ke worker
+        new_paths = []
+        for file_path in file_paths:
+            normalized_path = normalize_song_path(file_path)
+            if normalized_path in self.loaded_file_paths:
+                logger.debug(f"Skipping duplicate file: {file_path}")
+                continue
+            # Ditandai sekarang agar import berikutnya tidak mengambil file yang sama
+            self.loaded_file_paths.add(normalized_path)
+            new_paths.append(normalized_path)
+        self.import_skipped = len(file_paths) - len(new_paths)
+        self.import_loaded = 0
+        self.import_failed = 0
+        self.import_duplicates = 0
+        
+        if not new_paths:
+            self.update_status(f"Skipped {self.import_skipped} duplicates")
+            return
+        
+        # Parse di process pool, hasil masuk ke list per batch lewat signal
+        self.import_job = SongImportJob(
+            new_paths,
+            on_batch=self.import_batch_ready.emit,
+            on_done=self.import_finished.emit,
+        )
+        self.cancel_import_btn.setEnabled(True)
+        self.update_import_counters()
+        self.import_job.start()
+    
+    def add_imported_songs(self, songs: List[SongData], errors: List[Tuple[str, str]]):
+        """Tambahkan satu batch hasil import ke list dan UI"""
+        if self.import_job is None or self.import_job.cancelled:
+            return  # Batch yang masih di antrian setelah cancel diabaikan
+        for file_path, error in errors:
+            logger.error(f"Failed to load {file_path}: {error}")
+            self.loaded_file_paths.discard(file_path)
+        self.import_loaded += len(songs)
+        self.import_failed += len(errors)
+        if self.library is not None:
+            try:
+                self.library.upsert(songs)
+                if errors:
+                    self.library.remove(file_path for file_path, _ in errors)
+            except sqlite3.Error as e:
+                # Index hanya cache: list tetap di-update, index dibangun ulang di import berikutnya
+                logger.error(f"Failed to update library index: {e}")
+        if songs:
+            # Lagu yang sudah ada di list (file berubah) diganti di posisinya
+            positions = {song.file_path: index for index, song in enumerate(self.song_list)}
+            new_songs = []
+            for song in songs:
+                index = positions.get(song.file_path)
+                if index is None:
+                    self.duplicate_songs.pop(song.file_path, None)  # Dicek ulang di bawah
+                    new_songs.append(song)
+                    continue
+                old_song = self.song_list[index]
+                if self.song_hashes.get(old_song.content_hash) == song.file_path:
+                    del self.song_hashes[old_song.content_hash]
+                if song.content_hash:
+                    self.song_hashes.setdefault(song.content_hash, song.file_path)
+                if self.player.current_song is old_song and not self.player.is_playing:
+                    self.player.current_song = song
+                self.song_list[index] = song
+                self.song_list_widget.item(index).setText(f"{song.name} (BPM: {song.bpm})")
+            unique_songs = self.collapse_duplicates(new_songs)
+            self.import_duplicates += len(new_songs) - len(unique_songs)
+            new_songs = unique_songs
+            select_first = not self.song_list
+            self.song_list.extend(new_songs)
+            self.song_list_widget.addItems([f"{song.name} (BPM: {song.bpm})" for song in new_songs])
+            # Auto-select first song begitu batch pertama masuk
+            if select_first and new_songs:
+                self.song_list_widget.setCurrentRow(0)
+        self.update_import_counters()
+    
+    def collapse_duplicates(self, songs: List[SongData]) -> List[SongData]:
+        """Return lagu yang isinya belum ada di list, sisanya disimpan di duplicate_songs
+
+        Duplikat tetap tercatat di loaded_file_paths dan library index, jadi
+        tidak di-parse ulang, dan muncul lagi jika lagu aslinya dihapus.
+        """
+        unique = []
+        for song in songs:
+            primary = self.song_hashes.get(song.content_hash) if song.content_hash else None
+            if primary is not None and primary != song.file_path:
+                logger.info(f"Duplicate of {primary}: {song.file_path}")
+                self.duplicate_songs[song.file_path] = song
+                continue
+            if song.content_hash:
+                self.song_hashes[song.content_hash] = song.file_path
+            unique.append(song)
+        return unique
+    
+    def update_import_counters(self):
+        """Update counter loaded/failed dari import yang sedang berjalan"""
+        job = self.import_job
+        if job is not None:
+            self.import_label.setText(f"{self.import_loaded + self.import_failed}/{job.total} "
+                                      f"(loaded {self.import_loaded}, failed {self.import_failed})")
+    
+    def cancel_import(self):
+        """Batalkan import yang sedang berjalan"""
+        if self.import_job is not None and self.import_job.is_running:
+            logger.info("Cancelling song import")
+            self.pending_import_paths.clear()
+            self.import_job.cancel()
+            self.cancel_import_btn.setEnabled(False)
+    
+    def import_completed(self, loaded_count: int, error_count: int, cancelled: bool):
+        """Update status dengan hasil import"""
+        job = self.import_job
+        # Batch yang diabaikan setelah cancel tidak dihitung
+        loaded_count = self.import_loaded
+        error_count = self.import_failed
+        self.cancel_import_btn.setEnabled(False)
+        if job is not None and cancelled:
+            # File yang belum sempat di-import boleh dipilih lagi nanti
+            imported = {song.file_path for song in self.song_list}
+            for file_path in job.file_paths:
+                if file_path not in imported:
+                    self.loaded_file_paths.discard(file_path)
+        
+        status_parts = []
+        if loaded_count > 0:
+            status_parts.append(f"Loaded {loaded_count} songs")
+        if self.import_skipped > 0:
+            status_parts.append(f"Skipped {self.import_skipped} duplicates")
+        if self.import_duplicates > 0:
+            status_parts.append(f"Collapsed {self.import_duplicates} duplicate sheets")
+        if error_count > 0:
+            status_parts.append(f"Failed {error_count} files")
+        if cancelled:
+            status_parts.append("Cancelled")
+        
+        status_message = ", ".join(status_parts) if status_parts else "No files processed"
+        self.update_status(status_message)
+        self.update_import_counters()
+        
+        logger.info(f"Loading completed: {loaded_count} loaded, {self.import_skipped} skipped, "
+                    f"{error_count} errors")
+        
+        if self.pending_import_paths:
+            pending, self.pending_import_paths = self.pending_import_paths, []
+            self.load_songs_from_files(pending)
+    
+    # STEP 18b: Library Index Functions - List dari index, parse ulang hanya file yang berubah
+    def open_library(self):
+        """Buka library index persisten, lagu dari sesi sebelumnya tampil tanpa parse ulang"""
+        try:
+            self.library = LibraryIndex()
+        except (OSError, sqlite3.Error) as e:
+            logger.error(f"Library index unavailable: {e}")
+            self.library = None
+        self.load_library()
+        startup_profile.mark("library loaded")
+    
+    def load_library(self):
+        """Tampilkan lagu dari library index lalu cek file yang berubah di background"""
+        if self.library is None:
+            return
+        songs = self.library.load_songs()
+        self.library_roots = self.library.roots()
+        
+        if songs:
+            unique_songs = self.collapse_duplicates(songs)
+            self.song_list.extend(unique_songs)
+            self.loaded_file_paths.update(song.file_path for song in songs)
+            self.song_list_widget.addItems([f"{song.name} (BPM: {song.bpm})" for song in unique_songs])
+            self.song_list_widget.setCurrentRow(0)
+            self.update_status(f"Library: {len(unique_songs)} songs")
+            logger.info(f"Loaded {len(unique_songs)} songs from library index "
+                        f"({len(self.duplicate_songs)} duplicates collapsed)")
+        if not songs and not self.library_roots:
+            return
+        
+        # Stat semua file dan scan root di thread terpisah, hasilnya dikirim lewat signal
+        threading.Thread(target=self._check_library, args=(songs, list(self.library_roots)),
+                         name="library-check", daemon=True).start()
+        self.update_watcher()
+    
+    def _check_library(self, songs: List[SongData], roots: List[str]):
+        changed, missing = find_stale(songs)
+        known = {song.file_path for song in songs}
+        added = [file_path for file_path in scan_song_files(roots) if file_path not in known]
+        self.library_changed.emit(added, changed, missing)
+    
+    def apply_library_changes(self, added_paths: List[str], changed_paths: List[str],
+                              removed_paths: List[str]):
+        """Update list hanya untuk file yang ditambah, berubah, atau dihapus
+
+        Lagu yang filenya hilang dibuang, yang berubah di-parse ulang dan
+        diganti di posisinya, yang baru di-import ke akhir list.
+        """
+        if not added_paths and not changed_paths and not removed_paths:
+            return
+        logger.info(f"Library update: {len(added_paths)} added, {len(changed_paths)} changed, "
+                    f"{len(removed_paths)} removed")
+        
+        removed = set(removed_paths)
+        if removed:
+            current = self.player.current_song
+            self.song_list_widget.blockSignals(True)
+            for index in range(len(self.song_list) - 1, -1, -1):
+                song = self.song_list[index]
+                if song.file_path in removed:
+                    if self.song_hashes.get(song.content_hash) == song.file_path:
+                        del self.song_hashes[song.content_hash]
+                    del self.song_list[index]
+                    self.song_list_widget.takeItem(index)
+            for file_path in removed:
+                self.duplicate_songs.pop(file_path, None)
+            # Duplikat yang lagu aslinya dihapus tampil menggantikannya
+            orphans = [song for song in self.duplicate_songs.values()
+                       if song.content_hash not in self.song_hashes]
+            for song in orphans:
+                del self.duplicate_songs[song.file_path]
+            promoted = self.collapse_duplicates(orphans)
+            self.song_list.extend(promoted)
+            self.song_list_widget.addItems([f"{song.name} (BPM: {song.bpm})" for song in promoted])
+            for index, song in enumerate(self.song_list):
+                if song is current:
+                    self.song_list_widget.setCurrentRow(index)
+                    break
+            self.song_list_widget.blockSignals(False)
+            if self.song_list_widget.currentRow() < 0 and self.song_list:
+                self.song_list_widget.setCurrentRow(0)
+            self.loaded_file_paths.difference_update(removed)
+            self.pending_import_paths = [p for p in self.pending_import_paths if p not in removed]
+            if self.library is not None:
+                self.library.remove(removed)
+        
+        # File yang berubah di-parse ulang dan diganti di posisinya (lihat add_imported_songs)
+        for file_path in changed_paths:
+            self.player.song_cache.discard(file_path)
+            self.loaded_file_paths.discard(file_path)
+        for file_path in removed:
+            self.player.song_cache.discard(file_path)
+        
+        if added_paths or changed_paths:
+            self.load_songs_from_files(list(changed_paths) + list(added_paths))
+        elif removed:
+            self.update_status(f"Removed {len(removed)} songs")
+    
+    def update_watcher(self):
+        """Sinkronkan watcher dengan root library dan checkbox Watch"""
+        self.watcher.set_roots(self.library_roots)
+        if self.watch_check.isChecked() and self.library_roots and not self.watcher.is_running:
+            self.watcher.start()
+    
+    def set_watch_enabled(self, enabled: bool):
+        if enabled:
+            self.update_watcher()
+        else:
+            self.watcher.stop()
+    
+    # STEP 19: Song Selection Function - Fungsi untuk memilih lagu dari list
+    def song_selected(self, index: int):
+        """Handle song selection dari list"""
+        if index == -1:  # No selection
+            logger.debug("No song selected")
+            return
+            
+        if 0 <= index < len(self.song_list):
+            selected_song = self.song_list[index]
+            self.player.current_song = selected_song
+            # Notes dimuat di background, biasanya sudah siap sebelum countdown selesai
+            self.player.prefetch(selected_song)
+            
+            logger.info(f"Selected song: {selected_song.name}")
+            
+            # Enable control buttons
+            self.play_btn.setEnabled(True)
+            self.pause_btn.setEnabled(False)
+            self.stop_btn.setEnabled(False)
+            
+            # Analisis chord (simultaneous notes) dari metadata, tanpa parse ulang
+            chord_count = selected_song.chord_count
+            
+            status_msg = f"Selected: {selected_song.name} ({chord_count} chords detected)"
+            self.update_status(status_msg)
+            self.progress_bar.setValue(0)
+            
+            logger.info(f"Song analysis: {selected_song.note_count} total notes, {chord_count} chords")
+        else:
+            logger.warning(f"Invalid song index selected: {index}")
+    
+    # STEP 20: Playback Control Functions - Fungsi kontrol pemutaran untuk UI
+    def play_song(self):
+        """Start playing selected song"""
+        if self.player.current_song:
+            logger.info(f"Starting playback: {self.player.current_song.name}")
+            
+            # Update button states
+            self.play_btn.setEnabled(False)
+            self.pause_btn.setEnabled(True)
+            self.stop_btn.setEnabled(True)
+            self.player.playlist.set_songs(self.song_list, self.song_list_widget.currentRow())
+            self.player.play()
+            self.start_progress_sampling()
+        else:
+            logger.warning("No song selected for playback")
+            self.update_status("Please select a song first")
+    
+    def pause_song(self):
+        """Pause/resume current song"""
+        logger.info("Pause/resume button clicked")
+        self.player.pause()
+    
+    def stop_song(self):
+        """Stop current song"""
+        logger.info("Stop button clicked")
+        self.player.stop()
+        self.stop_progress_sampling()
+        
+        # Update button states
+        self.play_btn.setEnabled(True)
+        self.pause_btn.setEnabled(False)
+        self.stop_btn.setEnabled(False)
+        self.progress_bar.setValue(0)
+    
+    def seek_song(self, fraction: float):
+        """Seek ke posisi dari progress bar (play dari sini jika belum playing)"""
+        song = self.player.current_song
+        if not song:
+            return
+        self.player.seek(int(fraction * song.duration_ms))
+    
+    # STEP 21: UI Update Functions - Fungsi untuk update tampilan UI
+    def update_progress(self, current: int, total: int):
+        """Update progress bar"""
+        if total > 0:
+            progress = int((current / total) * PROGRESS_STEPS)
+            self.progress_bar.setValue(progress)
+            
+            # Log progress setiap 10% untuk debugging
+            if progress > 0 and progress % (PROGRESS_STEPS // 10) == 0:
+                logger.debug("Playback progress: %d%% (%d/%dms)", progress * 100 // PROGRESS_STEPS, current, total)
+    
+    def song_finished(self):
+        """Handle song finished event"""
+        logger.info("Song playback finished")
+        self.sample_progress()
+        self.stop_progress_sampling()
+        
+        # Lagu berikutnya di playlist sudah diputar controller tanpa countdown,
+        # signal ini hanya datang saat playlist selesai
+        self.play_btn.setEnabled(True)
+        self.pause_btn.setEnabled(False)
+        self.stop_btn.setEnabled(False)
+        self.progress_bar.setValue(PROGRESS_STEPS)
+        self.update_status(f"Finished ({self.progress_signals_saved} progress signals saved)")
+        
+        logger.info("Playback completed")
+    
+    # STEP 21a: Timing Telemetry - Lateness note terakhir di status panel dan export
+    def update_timing(self):
+        """Tampilkan p50/p95/p99/max lateness dan jitter lagu terakhir"""
+        telemetry = self.player.controller.telemetry
+        self.timing_label.setText(f"Timing: {telemetry.summary()}")
+        self.export_timing_btn.setEnabled(len(telemetry) > 0)
+    
+    def export_timing(self):
+        """Simpan telemetry lagu terakhir ke CSV (per group) atau JSON (ringkasan + group)"""
+        file_path, _ = QFileDialog.getSaveFileName(
+            self, "Export Note Timing", "note_timing.csv", "CSV (*.csv);;JSON (*.json)"
+        )
+        if not file_path:
+            return
+        try:
+            self.player.controller.telemetry.export(file_path)
+        except OSError as e:
+            logger.error(f"Failed to export timing to {file_path}: {e}")
+            self.update_status(f"Failed to export timing: {e}")
+            return
+        self.update_status(f"Timing exported to {os.path.basename(file_path)}")
+    
+    # STEP 21b: Playlist Functions - Mode, queue, dan pergantian lagu otomatis
+    def build_playlist_panel(self) -> QWidget:
+        """Buat kontrol playlist (mode, gap, queue) dari state player saat ini"""
+        panel = QWidget()
+        playlist_layout = QHBoxLayout(panel)
+        playlist_layout.setContentsMargins(0, 0, 0, 0)
+        
+        self.mode_label = QLabel("Mode:")
+        self.mode_combo = QComboBox()
+        for label, mode in (("Single", PlaylistMode.SINGLE),
+                            ("Sequential", PlaylistMode.SEQUENTIAL),
+                            ("Shuffle", PlaylistMode.SHUFFLE),
+                            ("Repeat One", PlaylistMode.REPEAT_ONE),
+                            ("Repeat All", PlaylistMode.REPEAT_ALL)):
+            self.mode_combo.addItem(label, mode)
+        self.mode_combo.setCurrentIndex(max(0, self.mode_combo.findData(self.player.playlist.mode)))
+        
+        self.gap_label = QLabel("Gap:")
+        self.gap_spin = QSpinBox()
+        self.gap_spin.setRange(0, 10000)
+        self.gap_spin.setValue(self.player.controller.gap_ms)
+        self.gap_spin.setSuffix(" ms")
+        
+        self.queue_btn = QPushButton("Queue")  # Putar lagu terpilih setelah lagu sekarang
+        
+        playlist_layout.addWidget(self.mode_label)
+        playlist_layout.addWidget(self.mode_combo)
+        playlist_layout.addWidget(self.gap_label)
+        playlist_layout.addWidget(self.gap_spin)
+        playlist_layout.addWidget(self.queue_btn)
+        playlist_layout.addStretch()
+        
+        self.mode_combo.currentIndexChanged.connect(self.playlist_mode_changed)
+        self.gap_spin.valueChanged.connect(self.player.set_gap_ms)
+        self.queue_btn.clicked.connect(self.queue_selected_song)
+        return panel
+    
+    def toggle_playlist_panel(self, visible: bool):
+        """Tampilkan/sembunyikan panel playlist, dibuat saat pertama kali ditampilkan"""
+        if self.playlist_panel is None:
+            if not visible:
+                return
+            self.playlist_panel = self.build_playlist_panel()
+            self.control_layout.addWidget(self.playlist_panel)
+        self.playlist_panel.setVisible(visible)
+    
+    def playlist_mode_changed(self, index: int):
+        """Handle perubahan mode playlist dari combo box"""
+        self.player.set_playlist_mode(self.mode_combo.itemData(index))
+    
+    def queue_selected_song(self):
+        """Tambahkan lagu terpilih ke up-next playlist"""
+        index = self.song_list_widget.currentRow()
+        if 0 <= index < len(self.song_list):
+            song = self.song_list[index]
+            self.player.playlist.enqueue(song)
+            if self.player.is_playing:
+                self.player.playlist.prepare_next()
+            self.update_status(f"Queued: {song.name}")
+    
+    def track_changed(self, song: SongData):
+        """Handle handoff ke lagu berikutnya: pilih lagu di list tanpa memicu song_selected"""
+        self.stop_progress_sampling()
+        for index, candidate in enumerate(self.song_list):
+            if candidate is song:
+                self.song_list_widget.blockSignals(True)
+                self.song_list_widget.setCurrentRow(index)
+                self.song_list_widget.blockSignals(False)
+                break
+        self.update_status(f"Playing: {song.name}")
+        self.start_progress_sampling()
+    
+    def update_status(self, message: str):
+        """Update status label dengan message"""
+        self.status_label.setText(message)
+        logger.debug(f"Status updated: {message}")
+
+    # STEP 22: Window Movement Functions - Fungsi untuk menggerakkan window
+    def mousePressEvent(self, event):
+        """Allow window movement when clicking and dragging"""
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.drag_pos = event.globalPosition().toPoint()
+            event.accept()
+
+    def mouseMoveEvent(self, event):
+        """Handle window movement"""
+        if hasattr(self, 'drag_pos'):
+            self.move(self.pos() + event.globalPosition().toPoint() - self.drag_pos)
+            self.drag_pos = event.globalPosition().toPoint()
+            event.accept()
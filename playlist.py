@@ -0,0 +1,182 @@
+# =============================================================================
+# Playlist Queue - Antrian lagu dengan persiapan lagu berikutnya di background
+# =============================================================================
+import random
+import threading
+import logging
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Generic, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar('T')
+
+
+class PlaylistMode:
+    """Mode lanjut ke lagu berikutnya setelah satu lagu selesai"""
+    SINGLE = "single"  # Berhenti setelah lagu selesai
+    SEQUENTIAL = "sequential"
+    SHUFFLE = "shuffle"
+    REPEAT_ONE = "repeat_one"
+    REPEAT_ALL = "repeat_all"
+
+    ALL = (SINGLE, SEQUENTIAL, SHUFFLE, REPEAT_ONE, REPEAT_ALL)
+
+
+class PlaylistQueue(Generic[T]):
+    """Antrian lagu (sequential, shuffle, repeat-one, repeat-all) + up-next manual
+
+    Lagu berikutnya ditentukan lebih dulu (peek_next) dan disiapkan lewat
+    `prepare` di thread background, sehingga saat lagu sekarang selesai hasil
+    persiapan tinggal diambil (take_prepared) tanpa parse/compile di hot path.
+    """
+
+    def __init__(self, prepare: Callable[[T], object], mode: str = PlaylistMode.SINGLE):
+        self.prepare = prepare
+        self.mode = mode
+        self._songs: List[T] = []
+        self._index = -1  # Index lagu sekarang di _songs
+        self._up_next = deque()  # Lagu yang di-queue manual, diputar lebih dulu
+        self._shuffle_order: List[int] = []
+        self._next: Optional[T] = None  # Hasil peek_next yang sudah ditentukan
+        self._next_index = -1
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._prepared: Dict[int, Future] = {}  # id(song) -> Future hasil prepare
+
+    # STEP Q1: Queue Content - Isi playlist dan up-next
+    @property
+    def current(self) -> Optional[T]:
+        if 0 <= self._index < len(self._songs):
+            return self._songs[self._index]
+        return None
+
+    @property
+    def up_next(self) -> List[T]:
+        return list(self._up_next)
+
+    def set_songs(self, songs: List[T], current_index: int = 0):
+        """Set daftar lagu playlist dan lagu yang sedang diputar"""
+        with self._lock:
+            self._songs = list(songs)
+            self._index = current_index
+            self._shuffle_order = []
+            self._invalidate_next()
+
+    def set_mode(self, mode: str):
+        if mode not in PlaylistMode.ALL:
+            raise ValueError(f"Unknown playlist mode: {mode}")
+        with self._lock:
+            self.mode = mode
+            self._shuffle_order = []
+            self._invalidate_next()
+        logger.info(f"Playlist mode set to {mode}")
+
+    def enqueue(self, song: T):
+        """Tambahkan lagu ke up-next (diputar setelah lagu sekarang)"""
+        with self._lock:
+            self._up_next.append(song)
+            self._invalidate_next()
+
+    def clear(self):
+        with self._lock:
+            self._songs = []
+            self._index = -1
+            self._up_next.clear()
+            self._shuffle_order = []
+            self._invalidate_next()
+            self._prepared.clear()
+
+    def _invalidate_next(self):
+        self._next = None
+        self._next_index = -1
+
+    # STEP Q2: Next Song Selection - Tentukan lagu berikutnya sesuai mode
+    def peek_next(self) -> Optional[T]:
+        """Lagu berikutnya tanpa pindah posisi (hasil di-cache sampai advance)"""
+        with self._lock:
+            if self._next is None:
+                self._next, self._next_index = self._choose_next()
+            return self._next
+
+    def _choose_next(self):
+        if self._up_next:
+            song = self._up_next[0]
+            return song, self._index_of(song)
+
+        count = len(self._songs)
+        if count == 0 or self.mode == PlaylistMode.SINGLE:
+            return None, -1
+        if self.mode == PlaylistMode.REPEAT_ONE:
+            return self.current, self._index
+        if self.mode == PlaylistMode.SHUFFLE:
+            if not self._shuffle_order:
+                self._shuffle_order = [i for i in range(count) if i != self._index]
+                random.shuffle(self._shuffle_order)
+            if not self._shuffle_order:
+                # Hanya ada lagu sekarang, tidak ada kandidat lain
+                return None, -1
+            index = self._shuffle_order[0]
+            return self._songs[index], index
+
+        index = self._index + 1
+        if index >= count:
+            if self.mode != PlaylistMode.REPEAT_ALL:
+                return None, -1
+            index = 0
+        return self._songs[index], index
+
+    def _index_of(self, song: T) -> int:
+        for index, candidate in enumerate(self._songs):
+            if candidate is song:
+                return index
+        return self._index
+
+    def advance(self) -> Optional[T]:
+        """Pindah ke lagu berikutnya, return lagu tersebut atau None jika selesai"""
+        song = self.peek_next()
+        with self._lock:
+            if song is None:
+                return None
+            if self._up_next and self._up_next[0] is song:
+                self._up_next.popleft()
+            elif self.mode == PlaylistMode.SHUFFLE and self._shuffle_order:
+                self._shuffle_order.pop(0)
+            self._index = self._next_index
+            self._invalidate_next()
+        return song
+
+    # STEP Q3: Background Preparation - Parse/compile lagu berikutnya di background
+    def prepare_next(self) -> Optional[Future]:
+        """Mulai persiapan lagu berikutnya di background (no-op jika sudah)"""
+        song = self.peek_next()
+        if song is None:
+            return None
+        key = id(song)
+        # Dipanggil dari thread UI dan thread controller (handoff), jadi di bawah lock
+        with self._lock:
+            future = self._prepared.get(key)
+            if future is None:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(max_workers=1,
+                                                        thread_name_prefix="playlist-prepare")
+                future = self._executor.submit(self.prepare, song)
+                # Hanya simpan hasil persiapan lagu berikutnya
+                self._prepared = {key: future}
+        return future
+
+    def take_prepared(self, song: T):
+        """Ambil hasil prepare untuk song (prepare sinkron jika belum disiapkan)"""
+        with self._lock:
+            future = self._prepared.pop(id(song), None)
+        # Tunggu hasil di luar lock agar prepare_next dari thread lain tidak ikut blok
+        if future is not None:
+            return future.result()
+        return self.prepare(song)
+
+    def shutdown(self):
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,98 @@
+# =============================================================================
+# Playback Scheduler - Penjadwal waktu presisi tinggi untuk note group
+# =============================================================================
+import sys
+import time
+from array import array
+
+# Sisa waktu (ns) sebelum deadline yang dihabiskan dengan spin/yield, bukan sleep.
+# Sebelum Python 3.11, time.sleep di Windows memakai timer ~15.6ms sehingga
+# margin harus lebih besar dari granularity tersebut.
+if sys.platform == "win32" and sys.version_info < (3, 11):
+    DEFAULT_SPIN_THRESHOLD_NS = 16_000_000
+else:
+    DEFAULT_SPIN_THRESHOLD_NS = 2_000_000
+
+
+class PlaybackScheduler:
+    """Scheduler note group berbasis monotonic clock (perf_counter_ns)
+
+    Jadwal disimpan sebagai anchor (anchor_ns, anchor_ms, tempo): posisi lagu
+    anchor_ms terjadi pada waktu absolut anchor_ns, dan posisi lain dihitung
+    dari situ dengan skala tempo. Deadline tidak dihitung dari group
+    sebelumnya, sehingga keterlambatan satu group tidak terakumulasi (drift).
+    Perubahan tempo me-rebase anchor pada posisi sekarang, bukan menskalakan
+    ulang setiap note. Lateness setiap group dicatat di `lateness_ns`.
+    """
+
+    def __init__(self, spin_threshold_ns: int = DEFAULT_SPIN_THRESHOLD_NS):
+        self.spin_threshold_ns = spin_threshold_ns
+        # Anchor disimpan sebagai satu tuple agar bisa diganti secara atomik dari thread UI
+        self._anchor = (0, 0, 1.0)  # (anchor_ns, anchor_ms, tempo)
+        self._paused_ns = 0  # Waktu mulai pause, 0 jika tidak sedang pause
+        self.lateness_ns = array('q')  # Lateness per group (ns), urut sesuai pemutaran
+
+    # STEP S1: Clock Control - Mengatur titik awal jadwal
+    def start(self, position_ms: int = 0, anchor_ns: int = 0) -> int:
+        """Mulai jadwal baru dengan posisi position_ms di anchor_ns (default sekarang)"""
+        now = anchor_ns or time.perf_counter_ns()
+        self._anchor = (now, position_ms, self._anchor[2])
+        self._paused_ns = 0
+        self.lateness_ns = array('q')
+        return now
+
+    def rebase(self, position_ms: int):
+        """Pindahkan jadwal ke posisi position_ms (seek), tempo dan status pause tetap"""
+        now = self._paused_ns or time.perf_counter_ns()
+        self._anchor = (now, position_ms, self._anchor[2])
+
+    def shift(self, delta_ns: int):
+        """Geser seluruh jadwal ke depan (misalnya setelah pause)"""
+        anchor_ns, anchor_ms, tempo = self._anchor
+        self._anchor = (anchor_ns + delta_ns, anchor_ms, tempo)
+
+    def pause(self):
+        """Bekukan posisi jadwal sampai resume()"""
+        if not self._paused_ns:
+            self._paused_ns = time.perf_counter_ns()
+
+    def resume(self):
+        """Lanjutkan jadwal, geser sebesar durasi pause"""
+        if self._paused_ns:
+            self.shift(time.perf_counter_ns() - self._paused_ns)
+            self._paused_ns = 0
+
+    @property
+    def tempo(self) -> float:
+        return self._anchor[2]
+
+    def set_tempo(self, tempo: float):
+        """Ubah tempo (1.0 = normal) dengan me-rebase jadwal pada posisi sekarang"""
+        now = self._paused_ns or time.perf_counter_ns()
+        self._anchor = (now, self.position_ms(now), max(0.01, float(tempo)))
+
+    def position_ms(self, now_ns: int = 0) -> int:
+        """Posisi lagu (ms) menurut jadwal pada waktu now_ns (default sekarang)"""
+        if not now_ns:
+            now_ns = self._paused_ns or time.perf_counter_ns()
+        anchor_ns, anchor_ms, tempo = self._anchor
+        return anchor_ms + int((now_ns - anchor_ns) * tempo) // 1_000_000
+
+    def deadline_ns(self, time_ms: int) -> int:
+        """Waktu absolut (perf_counter_ns) untuk note pada posisi time_ms"""
+        anchor_ns, anchor_ms, tempo = self._anchor
+        return anchor_ns + int((time_ms - anchor_ms) * 1_000_000 / tempo)
+
+    # STEP S2: Lateness Report - Ringkasan keterlambatan per group
+    def record(self, lateness_ns: int):
+        """Catat lateness untuk satu group"""
+        self.lateness_ns.append(lateness_ns)
+
+    def summary(self) -> str:
+        """Ringkasan lateness untuk logging"""
+        if not self.lateness_ns:
+            return "no groups scheduled"
+        count = len(self.lateness_ns)
+        average = sum(self.lateness_ns) / count / 1e6
+        worst = max(self.lateness_ns) / 1e6
+        return f"{count} groups, avg lateness {average:.3f}ms, max {worst:.3f}ms"
@@ -0,0 +1,250 @@
+# =============================================================================
+# Sky CLI - Validasi, statistik, konversi, dedupe dan dry-run play tanpa GUI
+# =============================================================================
+# Usage:
+#   python sky_cli.py validate  <path...>     (folder rekursif, .zip, .json.gz, .skyc)
+#   python sky_cli.py stats     <path...> [--per-file]
+#   python sky_cli.py convert   <path...> [-o OUTPUT_DIR]
+#   python sky_cli.py dedupe    <path...>
+#   python sky_cli.py play      <file> [--speed PERCENT] [--from MS] [--hold MS] [--telemetry FILE]
+#
+# Tidak mengimport PyQt6 maupun pydirectinput: play selalu memakai RecordingBackend.
+import os
+import sys
+import time
+import argparse
+import logging
+import multiprocessing
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, List, NamedTuple, Optional
+
+from input_backend import RecordingBackend
+from input_pool import InputWorkerPool
+from key_mapping import KEY_MAPPING
+from library_scan import scan_song_files
+from playback import DEFAULT_HOLD_MS, PlaybackController
+from song_archive import expand_archives, normalize_song_path
+from song_binary import convert_files, is_compiled_path
+from song_loader import parse_song
+from timeline import compile_timeline
+
+logger = logging.getLogger("sky_cli")
+
+
+class SongReport(NamedTuple):
+    """Hasil analisis satu file (dikirim balik dari worker, tanpa notes)"""
+    path: str
+    error: Optional[str] = None
+    name: str = ""
+    bpm: int = 0
+    note_count: int = 0
+    group_count: int = 0
+    chord_count: int = 0
+    duration_ms: int = 0
+    unknown_keys: int = 0
+    content_hash: str = ""
+
+    @property
+    def problems(self) -> List[str]:
+        """Masalah validasi (error parse atau isi yang tidak bisa dimainkan)"""
+        if self.error:
+            return [self.error]
+        problems = []
+        if not self.note_count:
+            problems.append("no notes")
+        if self.unknown_keys:
+            problems.append(f"{self.unknown_keys} notes with unknown key mapping")
+        if not isinstance(self.bpm, (int, float)) or self.bpm <= 0:
+            problems.append(f"invalid bpm {self.bpm!r}")
+        return problems
+
+
+# STEP C1: Analysis - Parse dan compile satu file di worker process
+def analyze_file(file_path: str) -> SongReport:
+    try:
+        song = parse_song(file_path)
+        timeline = compile_timeline(song.notes, KEY_MAPPING)
+    except Exception as e:
+        return SongReport(file_path, error=f"{type(e).__name__}: {e}")
+    return SongReport(file_path, name=str(song.name), bpm=song.bpm,
+                      note_count=song.note_count, group_count=len(timeline),
+                      chord_count=timeline.chord_count, duration_ms=song.duration_ms,
+                      unknown_keys=timeline.unknown_keys,
+                      content_hash=song.notes.content_hash())
+
+
+def collect_paths(paths: Iterable[str]) -> List[str]:
+    """Folder di-scan rekursif, .zip dibuka menjadi member, file lain apa adanya"""
+    file_paths = []
+    for path in paths:
+        if os.path.isdir(path):
+            file_paths.extend(scan_song_files([path]))
+        else:
+            file_paths.extend(expand_archives([normalize_song_path(path)]))
+    return list(dict.fromkeys(file_paths))
+
+
+def analyze_files(file_paths: List[str], jobs: Optional[int] = None) -> List[SongReport]:
+    """Analisis semua file di process pool (urutan hasil sama dengan input)"""
+    workers = min(jobs or os.cpu_count() or 1, max(1, len(file_paths)))
+    if workers <= 1:
+        return [analyze_file(file_path) for file_path in file_paths]
+    chunksize = max(1, min(64, len(file_paths) // (workers * 4)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(analyze_file, file_paths, chunksize=chunksize))
+
+
+def _format_duration(duration_ms: int) -> str:
+    seconds = duration_ms // 1000
+    return f"{seconds // 60}:{seconds % 60:02d}"
+
+
+# STEP C2: Commands
+def cmd_validate(args) -> int:
+    reports = analyze_files(collect_paths(args.paths), args.jobs)
+    invalid = 0
+    for report in reports:
+        problems = report.problems
+        if problems:
+            invalid += 1
+            print(f"INVALID {report.path}: {'; '.join(problems)}")
+        elif args.verbose:
+            print(f"OK      {report.path}")
+    print(f"{len(reports) - invalid}/{len(reports)} files valid")
+    return 1 if invalid else 0
+
+
+def cmd_stats(args) -> int:
+    reports = analyze_files(collect_paths(args.paths), args.jobs)
+    valid = [report for report in reports if not report.error]
+    if args.per_file:
+        for report in valid:
+            print(f"{report.note_count:7d} notes {report.chord_count:6d} chords "
+                  f"{_format_duration(report.duration_ms):>7}  {report.name}  ({report.path})")
+    total_notes = sum(report.note_count for report in valid)
+    total_ms = sum(report.duration_ms for report in valid)
+    print(f"Files:     {len(reports)} ({len(reports) - len(valid)} failed)")
+    print(f"Notes:     {total_notes}")
+    print(f"Chords:    {sum(report.chord_count for report in valid)}")
+    print(f"Duration:  {_format_duration(total_ms)}")
+    print(f"Unique:    {len({report.content_hash for report in valid if report.content_hash})}")
+    if valid:
+        longest = max(valid, key=lambda report: report.duration_ms)
+        print(f"Longest:   {longest.name} ({_format_duration(longest.duration_ms)})")
+    return 0
+
+
+def cmd_convert(args) -> int:
+    file_paths = [path for path in collect_paths(args.paths) if not is_compiled_path(path)]
+    failed = 0
+    for file_path, output_path, error in convert_files(file_paths, args.output_dir, args.jobs):
+        if error:
+            failed += 1
+            print(f"FAILED {file_path}: {error}", file=sys.stderr)
+        elif args.verbose:
+            print(f"{file_path} -> {output_path}")
+    print(f"Converted {len(file_paths) - failed}/{len(file_paths)} files")
+    return 1 if failed else 0
+
+
+def cmd_dedupe(args) -> int:
+    reports = analyze_files(collect_paths(args.paths), args.jobs)
+    groups = defaultdict(list)
+    for report in reports:
+        if report.content_hash:
+            groups[report.content_hash].append(report.path)
+    duplicates = 0
+    for paths in groups.values():
+        if len(paths) > 1:
+            duplicates += len(paths) - 1
+            print(f"KEEP {paths[0]}")
+            for path in paths[1:]:
+                print(f"  DUP {path}")
+    share = duplicates / len(reports) * 100 if reports else 0.0
+    print(f"{duplicates} duplicates of {len(reports)} files ({share:.1f}%) "
+          f"in {sum(len(paths) > 1 for paths in groups.values())} groups")
+    return 0
+
+
+def cmd_play(args) -> int:
+    """Dry-run: mainkan timeline dengan RecordingBackend dan laporkan lateness"""
+    song = parse_song(normalize_song_path(args.file))
+    timeline = compile_timeline(song.notes, KEY_MAPPING)
+    backend = RecordingBackend()
+    controller = PlaybackController(
+        backend, InputWorkerPool(backend, worker_count=len(set(KEY_MAPPING.values()))),
+        on_status=lambda message: logger.info(message))
+    controller.hold_ms = args.hold
+    controller.set_tempo(args.speed / 100)
+    print(f"Dry run: {song.name} ({len(timeline)} groups, "
+          f"{_format_duration(timeline.duration_ms)} at {args.speed}%)")
+    start = time.perf_counter()
+    controller.play(timeline, args.start, countdown=0)
+    try:
+        controller.wait_idle()
+    except KeyboardInterrupt:
+        controller.stop()
+        controller.wait_idle(1.0)
+    finally:
+        controller.shutdown()
+    downs = sum(1 for _, action, _ in backend.events if action == 'down')
+    print(f"Played {downs} key presses in {time.perf_counter() - start:.2f}s")
+    print(f"Scheduler: {controller.scheduler.summary()}")
+    print(f"Timing:    {controller.telemetry.summary()}")
+    for bucket, count in controller.telemetry.report()["histogram"].items():
+        if count:
+            print(f"  {bucket:>8} {count}")
+    if args.telemetry:
+        controller.telemetry.export(args.telemetry)
+        print(f"Timing written to {args.telemetry}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="sky_cli",
+                                     description="Headless Sky Music sheet tools")
+    parser.add_argument("-v", "--verbose", action="store_true", help="Print every file")
+    parser.add_argument("-j", "--jobs", type=int, default=None,
+                        help="Worker processes (default: all cores)")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    validate = commands.add_parser("validate", help="Parse sheets and report invalid ones")
+    validate.add_argument("paths", nargs="+")
+    validate.set_defaults(handler=cmd_validate)
+
+    stats = commands.add_parser("stats", help="Note, chord and duration totals")
+    stats.add_argument("paths", nargs="+")
+    stats.add_argument("--per-file", action="store_true", help="Print one line per sheet")
+    stats.set_defaults(handler=cmd_stats)
+
+    convert = commands.add_parser("convert", help="Convert sheets to compiled .skyc")
+    convert.add_argument("paths", nargs="+")
+    convert.add_argument("-o", "--output-dir", help="Output folder (default: next to each sheet)")
+    convert.set_defaults(handler=cmd_convert)
+
+    dedupe = commands.add_parser("dedupe", help="List sheets with identical notes")
+    dedupe.add_argument("paths", nargs="+")
+    dedupe.set_defaults(handler=cmd_dedupe)
+
+    play = commands.add_parser("play", help="Dry-run playback without sending keys")
+    play.add_argument("file")
+    play.add_argument("--speed", type=int, default=100, help="Tempo in percent")
+    play.add_argument("--from", dest="start", type=int, default=0, help="Start position (ms)")
+    play.add_argument("--hold", type=int, default=DEFAULT_HOLD_MS, help="Key hold time (ms)")
+    play.add_argument("--telemetry", metavar="FILE",
+                      help="Write per-group timing to FILE (.csv or .json)")
+    play.set_defaults(handler=cmd_play)
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(level=logging.INFO if args.verbose else logging.WARNING,
+                        format='%(levelname)s - %(message)s')
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    multiprocessing.freeze_support()
+    sys.exit(main())
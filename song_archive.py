@@ -0,0 +1,158 @@
+# =============================================================================
+# Song Archive - Sheet di dalam song pack .zip dan file .json.gz
+# =============================================================================
+# Member arsip dialamatkan dengan path virtual "<path arsip>::<nama member>",
+# fingerprint-nya (CRC32, ukuran) dari central directory zip, jadi member yang
+# tidak berubah tidak perlu di-parse ulang walaupun file zip-nya diganti.
+import os
+import gzip
+import struct
+import zipfile
+import threading
+import logging
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+MEMBER_SEPARATOR = "::"
+ARCHIVE_EXTENSIONS = ('.zip',)
+GZIP_EXTENSION = '.gz'
+# Member yang dianggap sheet (tanpa import song_binary agar tidak circular)
+MEMBER_EXTENSIONS = ('.json', '.skyc')
+# Jumlah ZipFile yang tetap terbuka per proses (dipakai ulang antar member)
+MAX_OPEN_ARCHIVES = 8
+MAX_CACHED_MEMBER_LISTS = 256
+
+_lock = threading.Lock()
+_open_archives: "OrderedDict[str, Tuple[Tuple[int, int], zipfile.ZipFile]]" = OrderedDict()
+_member_lists: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Tuple[int, int]]]]" = OrderedDict()
+
+
+def is_archive_path(file_path: str) -> bool:
+    return file_path.lower().endswith(ARCHIVE_EXTENSIONS)
+
+
+def is_gzip_path(file_path: str) -> bool:
+    return file_path.lower().endswith(GZIP_EXTENSION)
+
+
+def member_path(archive_path: str, member: str) -> str:
+    return f"{archive_path}{MEMBER_SEPARATOR}{member}"
+
+
+def split_member_path(file_path: str) -> Optional[Tuple[str, str]]:
+    """(path arsip, nama member) untuk path virtual, None untuk file biasa"""
+    archive_path, sep, member = file_path.partition(MEMBER_SEPARATOR)
+    if not sep:
+        return None
+    return archive_path, member
+
+
+def normalize_song_path(file_path: str) -> str:
+    """Normalisasi path lagu; nama member arsip tidak diubah"""
+    parts = split_member_path(file_path)
+    if parts is None:
+        return os.path.normpath(os.path.abspath(file_path))
+    return member_path(os.path.normpath(os.path.abspath(parts[0])), parts[1])
+
+
+def _archive_stat(archive_path: str) -> Tuple[int, int]:
+    stat = os.stat(archive_path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+# STEP A1: Member Listing - Central directory zip, di-cache per (mtime, size) arsip
+def list_members(archive_path: str) -> Dict[str, Tuple[int, int]]:
+    """Path virtual -> (CRC32, ukuran) untuk setiap sheet di dalam arsip
+
+    Raise OSError atau zipfile.BadZipFile jika arsip tidak bisa dibaca.
+    """
+    key = _archive_stat(archive_path)
+    with _lock:
+        cached = _member_lists.get(archive_path)
+        if cached is not None and cached[0] == key:
+            _member_lists.move_to_end(archive_path)
+            return cached[1]
+    with zipfile.ZipFile(archive_path) as archive:
+        members = {member_path(archive_path, info.filename): (info.CRC, info.file_size)
+                   for info in archive.infolist()
+                   if not info.is_dir() and info.filename.lower().endswith(MEMBER_EXTENSIONS)
+                   and not os.path.basename(info.filename).startswith('.')}
+    with _lock:
+        _member_lists[archive_path] = (key, members)
+        while len(_member_lists) > MAX_CACHED_MEMBER_LISTS:
+            _member_lists.popitem(last=False)
+    return members
+
+
+def member_fingerprint(file_path: str) -> Optional[Tuple[int, int]]:
+    """(CRC32, ukuran) member arsip, None jika arsip atau member tidak ada"""
+    parts = split_member_path(file_path)
+    if parts is None:
+        return None
+    try:
+        return list_members(parts[0]).get(file_path)
+    except (OSError, zipfile.BadZipFile):
+        return None
+
+
+def expand_archives(file_paths: Iterable[str]) -> List[str]:
+    """Ganti path .zip dengan path virtual semua sheet di dalamnya"""
+    expanded = []
+    for file_path in file_paths:
+        if is_archive_path(file_path):
+            try:
+                expanded.extend(sorted(list_members(file_path)))
+            except (OSError, zipfile.BadZipFile) as e:
+                logger.error(f"Cannot read song pack {file_path}: {e}")
+        else:
+            expanded.append(file_path)
+    return expanded
+
+
+# STEP A2: Member Reading - Stream langsung dari arsip tanpa extract
+def _get_archive(archive_path: str) -> zipfile.ZipFile:
+    key = _archive_stat(archive_path)
+    with _lock:
+        cached = _open_archives.get(archive_path)
+        if cached is not None and cached[0] == key:
+            _open_archives.move_to_end(archive_path)
+            return cached[1]
+    archive = zipfile.ZipFile(archive_path)
+    with _lock:
+        _open_archives[archive_path] = (key, archive)
+        while len(_open_archives) > MAX_OPEN_ARCHIVES:
+            # Member yang masih terbuka tetap bisa dibaca: file ditutup saat member terakhir selesai
+            _open_archives.popitem(last=False)[1][1].close()
+    return archive
+
+
+@contextmanager
+def open_member(file_path: str) -> Iterator[Tuple[BinaryIO, zipfile.ZipInfo]]:
+    """Buka member dari path virtual, yield (stream biner, ZipInfo)
+
+    Raise OSError (FileNotFoundError jika member tidak ada) atau zipfile.BadZipFile.
+    """
+    archive_path, member = split_member_path(file_path)
+    archive = _get_archive(archive_path)
+    try:
+        info = archive.getinfo(member)
+    except KeyError:
+        raise FileNotFoundError(f"No member {member!r} in {archive_path}") from None
+    with archive.open(info) as stream:
+        yield stream, info
+
+
+def gzip_uncompressed_size(raw: BinaryIO) -> int:
+    """Ukuran data .gz setelah dekompresi (field ISIZE di 4 byte terakhir, mod 2^32)"""
+    position = raw.tell()
+    raw.seek(-4, os.SEEK_END)
+    size = struct.unpack("<I", raw.read(4))[0]
+    raw.seek(position)
+    return size
+
+
+def open_gzip(raw: BinaryIO) -> gzip.GzipFile:
+    return gzip.GzipFile(fileobj=raw, mode='rb')
@@ -0,0 +1,245 @@
+# =============================================================================
+# Song Binary - Format sheet terkompilasi (.skyc) dengan loading via mmap
+# =============================================================================
+# Layout file (little-endian):
+#   header   : HEADER (magic, version, flags, bpm, note_count, chord_count,
+#              panjang name, jumlah other key, crc32 payload)
+#   payload  : name (UTF-8), other keys (u8 panjang + UTF-8 per key),
+#              padding ke kelipatan 4, lalu kolom times (u32 x n),
+#              instruments (u8 x n) dan keys (u8 x n)
+import os
+import sys
+import mmap
+import zlib
+import struct
+import logging
+import tempfile
+from array import array
+from typing import List, Optional, Tuple
+
+from note_columns import NoteColumns
+from song_archive import MEMBER_SEPARATOR
+
+logger = logging.getLogger(__name__)
+
+COMPILED_EXTENSION = ".skyc"
+MAGIC = b"SKYC"
+FORMAT_VERSION = 1
+HEADER = struct.Struct("<4sHHIIIHHI")
+
+
+def is_compiled_path(file_path: str) -> bool:
+    return file_path.lower().endswith(COMPILED_EXTENSION)
+
+
+def compiled_path_for(file_path: str, output_dir: Optional[str] = None) -> str:
+    """Path .skyc untuk sheet JSON, di samping file asli atau di output_dir
+
+    Untuk member song pack ("<arsip>::<member>") path relatif member tetap
+    dipakai di bawah folder bernama arsip, jadi "pack.zip::x/a.json" menjadi
+    "pack/x/a.skyc" dan tidak bentrok dengan "pack.zip::y/a.json".
+    """
+    archive_path, sep, member = file_path.partition(MEMBER_SEPARATOR)
+    name = os.path.basename(member if sep else file_path)
+    if name.lower().endswith(".gz"):
+        name = name[:-3]
+    base = os.path.splitext(name)[0] + COMPILED_EXTENSION
+    folder = output_dir or os.path.dirname(archive_path)
+    if sep:
+        archive_name = os.path.splitext(os.path.basename(archive_path))[0]
+        member_dirs = [part for part in member.replace("\\", "/").split("/")[:-1]
+                       if part not in ("", ".", "..")]
+        folder = os.path.join(folder, archive_name, *member_dirs)
+    return os.path.join(folder, base)
+
+
+def _column_bytes(column, typecode: str) -> bytes:
+    data = array(typecode, column)
+    if sys.byteorder != "little":
+        data.byteswap()
+    return data.tobytes()
+
+
+# STEP B1: Writing - Serialisasi NoteColumns ke bytes .skyc
+def encode_song(name: str, bpm: int, notes: NoteColumns, chord_count: int = 0) -> bytes:
+    """Encode satu lagu (notes terurut waktu) menjadi isi file .skyc"""
+    name_bytes = str(name).encode("utf-8")
+    if len(name_bytes) > 0xFFFF:
+        raise ValueError("Song name too long for compiled format")
+    other_keys = bytearray()
+    for key in notes.other_keys:
+        key_bytes = key.encode("utf-8")
+        if len(key_bytes) > 0xFF:
+            raise ValueError(f"Key name too long for compiled format: {key!r}")
+        other_keys.append(len(key_bytes))
+        other_keys += key_bytes
+
+    payload = bytearray(name_bytes + other_keys)
+    payload += bytes(-(HEADER.size + len(payload)) % 4)
+    payload += _column_bytes(notes.times, 'I')
+    payload += _column_bytes(notes.instruments, 'B')
+    payload += _column_bytes(notes.keys, 'B')
+
+    header = HEADER.pack(MAGIC, FORMAT_VERSION, 0, int(bpm), len(notes), chord_count,
+                         len(name_bytes), len(notes.other_keys), zlib.crc32(payload))
+    return header + bytes(payload)
+
+
+def write_compiled(file_path: str, name: str, bpm: int, notes: NoteColumns,
+                   chord_count: int = 0):
+    """Tulis .skyc secara atomik (file sementara unik lalu os.replace)"""
+    data = encode_song(name, bpm, notes, chord_count)
+    fd, temp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or ".",
+                                     prefix=os.path.basename(file_path) + ".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        try:
+            os.unlink(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+# STEP B2: Loading - Kolom notes langsung dari mmap tanpa copy
+def decode_song(buffer, verify: bool = True) -> Tuple[str, int, NoteColumns, int]:
+    """Decode isi .skyc, return (name, bpm, notes, chord_count)
+
+    Kolom NoteColumns berupa memoryview ke `buffer` (tanpa copy) di mesin
+    little-endian. Raise ValueError jika header atau checksum tidak valid.
+    """
+    view = memoryview(buffer)
+    if len(view) < HEADER.size:
+        raise ValueError("Compiled song is truncated")
+    (magic, version, _flags, bpm, note_count, chord_count,
+     name_length, other_count, checksum) = HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not a compiled song file")
+    if version != FORMAT_VERSION:
+        raise ValueError(f"Unsupported compiled song version {version}")
+
+    payload = view[HEADER.size:]
+    if verify and zlib.crc32(payload) != checksum:
+        raise ValueError("Compiled song checksum mismatch")
+
+    offset = HEADER.size
+    name = bytes(view[offset:offset + name_length]).decode("utf-8")
+    offset += name_length
+    other_keys = []
+    for _ in range(other_count):
+        length = view[offset]
+        other_keys.append(bytes(view[offset + 1:offset + 1 + length]).decode("utf-8"))
+        offset += 1 + length
+    offset += -offset % 4
+
+    end = offset + note_count * 6
+    if len(view) < end:
+        raise ValueError("Compiled song is truncated")
+    times = view[offset:offset + note_count * 4].cast('I')
+    if sys.byteorder != "little":
+        times = array('I', times)
+        times.byteswap()
+    offset += note_count * 4
+    instruments = view[offset:offset + note_count]
+    keys = view[offset + note_count:end]
+    return name, bpm, NoteColumns(times, instruments, keys, other_keys), chord_count
+
+
+def read_compiled(file_path: str, verify: bool = True) -> tuple:
+    """Baca .skyc via mmap, return (name, bpm, notes, mtime_ns, size, chord_count)
+
+    Format tuple sama dengan song_loader._read_song (plus chord_count dari header).
+    Mapping tetap hidup selama kolom notes masih dipakai.
+    """
+    with open(file_path, "rb") as f:
+        stat = os.fstat(f.fileno())
+        if stat.st_size == 0:
+            raise ValueError(f"Compiled song is empty: {file_path}")
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    name, bpm, notes, chord_count = decode_song(mapped, verify)
+    return name, bpm, notes, stat.st_mtime_ns, stat.st_size, chord_count
+
+
+# STEP B3: Converter - JSON sheet ke .skyc (batch, paralel)
+def convert_file(file_path: str, output_dir: Optional[str] = None) -> str:
+    """Convert satu sheet JSON ke .skyc, return path output"""
+    from song_loader import _read_song, count_chords
+
+    name, bpm, notes, _mtime_ns, _size = _read_song(file_path)
+    output_path = compiled_path_for(file_path, output_dir)
+    os.makedirs(os.path.dirname(output_path) or ".", exist_ok=True)
+    write_compiled(output_path, name, bpm, notes, count_chords(notes))
+    return output_path
+
+
+def _convert_one(args: Tuple[str, Optional[str]]) -> Tuple[str, Optional[str], Optional[str]]:
+    file_path, output_dir = args
+    try:
+        return file_path, convert_file(file_path, output_dir), None
+    except Exception as e:
+        return file_path, None, f"{type(e).__name__}: {e}"
+
+
+def convert_files(file_paths: List[str], output_dir: Optional[str] = None,
+                  max_workers: Optional[int] = None) -> List[Tuple[str, Optional[str], Optional[str]]]:
+    """Convert banyak sheet di process pool, return (path, output, error) per file
+
+    Input yang menghasilkan path output sama (misalnya a.json dan a.json.gz)
+    ditolak sebelum dikirim ke pool: hanya yang pertama di-convert.
+    """
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    results: List[Optional[Tuple[str, Optional[str], Optional[str]]]] = [None] * len(file_paths)
+    owners = {}
+    jobs = []
+    for index, file_path in enumerate(file_paths):
+        output_key = os.path.normcase(os.path.abspath(compiled_path_for(file_path, output_dir)))
+        if output_key in owners:
+            results[index] = (file_path, None, f"Output collides with {owners[output_key]}")
+        else:
+            owners[output_key] = file_path
+            jobs.append((index, (file_path, output_dir)))
+
+    if len(jobs) <= 1:
+        converted = [_convert_one(job) for _, job in jobs]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            converted = list(executor.map(_convert_one, [job for _, job in jobs], chunksize=16))
+    for (index, _), result in zip(jobs, converted):
+        results[index] = result
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert JSON song sheets to compiled .skyc files")
+    parser.add_argument("paths", nargs="+", help="JSON files or folders containing them")
+    parser.add_argument("-o", "--output-dir", help="Output folder (default: next to each sheet)")
+    parser.add_argument("-j", "--jobs", type=int, default=None, help="Worker processes")
+    args = parser.parse_args(argv)
+
+    file_paths = []
+    for path in args.paths:
+        if os.path.isdir(path):
+            file_paths.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                              if name.lower().endswith(".json"))
+        else:
+            file_paths.append(path)
+
+    failed = 0
+    for file_path, output_path, error in convert_files(file_paths, args.output_dir, args.jobs):
+        if error:
+            failed += 1
+            print(f"FAILED {file_path}: {error}", file=sys.stderr)
+        else:
+            print(f"{file_path} -> {output_path}")
+    print(f"Converted {len(file_paths) - failed}/{len(file_paths)} files")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
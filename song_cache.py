@@ -0,0 +1,146 @@
+# =============================================================================
+# Song Cache - LRU lagu yang sudah di-parse dengan batas memori (bytes)
+# =============================================================================
+import threading
+import logging
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Dict, Optional
+
+from song_loader import SongData
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CACHE_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def estimate_song_bytes(song: SongData) -> int:
+    """Perkiraan memori notes + timeline satu lagu (buffer array kolom)"""
+    total = song.timeline.nbytes if song.timeline is not None else 0
+    if song.notes is not None:
+        total += song.notes.nbytes
+    return total
+
+
+class SongCache:
+    """LRU lagu lengkap (notes + timeline) per file_path dengan byte budget
+
+    List lagu di UI hanya menyimpan metadata; notes dimuat lewat `loader` saat
+    dibutuhkan (get) atau lebih awal di background (prefetch). Entry paling
+    lama tidak dipakai dibuang saat total perkiraan bytes melebihi budget.
+    """
+
+    def __init__(self, loader: Callable[[str], SongData],
+                 budget_bytes: int = DEFAULT_CACHE_BUDGET_BYTES):
+        self.loader = loader
+        self.budget_bytes = budget_bytes
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()  # path -> (song, nbytes)
+        self._loading: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.evicted_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, file_path: str) -> bool:
+        return file_path in self._entries
+
+    # STEP K1: Lookup - Ambil lagu dari cache atau muat lewat loader
+    def get(self, file_path: str) -> SongData:
+        """Lagu lengkap untuk file_path, dimuat (sekali) jika belum ada di cache"""
+        with self._lock:
+            entry = self._entries.get(file_path)
+            if entry is not None:
+                self._entries.move_to_end(file_path)
+                self.hits += 1
+                return entry[0]
+            future = self._loading.get(file_path)
+            owner = future is None
+            if owner:
+                self.misses += 1
+                future = self._loading[file_path] = Future()
+            else:
+                self.hits += 1  # Sedang di-prefetch, tunggu hasilnya
+
+        if not owner:
+            return future.result()
+        try:
+            song = self.loader(file_path)
+        except BaseException as e:
+            with self._lock:
+                del self._loading[file_path]
+            future.set_exception(e)
+            raise
+        self.put(song)
+        with self._lock:
+            del self._loading[file_path]
+        future.set_result(song)
+        return song
+
+    def prefetch(self, file_path: str) -> Future:
+        """Muat lagu di background agar get() berikutnya tidak menunggu parse"""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="song-prefetch")
+        return self._executor.submit(self._prefetch, file_path)
+
+    def _prefetch(self, file_path: str) -> Optional[SongData]:
+        try:
+            return self.get(file_path)
+        except Exception as e:
+            logger.warning(f"Prefetch failed for {file_path}: {e}")
+            return None
+
+    # STEP K2: Insert & Evict - Simpan lagu dan jaga total bytes di bawah budget
+    def put(self, song: SongData):
+        nbytes = estimate_song_bytes(song)
+        with self._lock:
+            old = self._entries.pop(song.file_path, None)
+            if old is not None:
+                self.bytes -= old[1]
+            self._entries[song.file_path] = (song, nbytes)
+            self.bytes += nbytes
+            self._evict()
+
+    def _evict(self):
+        # Entry terbaru selalu disimpan walaupun sendirian melebihi budget
+        while self.bytes > self.budget_bytes and len(self._entries) > 1:
+            file_path, (song, nbytes) = self._entries.popitem(last=False)
+            self.bytes -= nbytes
+            self.evictions += 1
+            self.evicted_bytes += nbytes
+            logger.debug(f"Evicted {song.name} ({nbytes} bytes) from song cache")
+
+    def set_budget(self, budget_bytes: int):
+        with self._lock:
+            self.budget_bytes = max(0, int(budget_bytes))
+            self._evict()
+        logger.info(f"Song cache budget set to {self.budget_bytes} bytes")
+
+    def discard(self, file_path: str):
+        with self._lock:
+            entry = self._entries.pop(file_path, None)
+            if entry is not None:
+                self.bytes -= entry[1]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # STEP K3: Stats - Ringkasan hit/miss/eviction untuk logging
+    def stats(self) -> str:
+        lookups = self.hits + self.misses
+        hit_rate = self.hits / lookups * 100 if lookups else 0.0
+        return (f"{len(self._entries)} songs, {self.bytes / 1e6:.1f}/{self.budget_bytes / 1e6:.1f} MB, "
+                f"{self.hits} hits, {self.misses} misses ({hit_rate:.0f}% hit rate), "
+                f"{self.evictions} evictions ({self.evicted_bytes / 1e6:.1f} MB)")
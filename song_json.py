@@ -0,0 +1,330 @@
+# =============================================================================
+# Song JSON - Parse sheet JSON langsung ke NoteColumns (full atau streaming)
+# =============================================================================
+import io
+import json
+import codecs
+import logging
+from typing import Any, BinaryIO, Dict, Optional, TextIO, Tuple
+
+from note_columns import NoteColumns
+
+logger = logging.getLogger(__name__)
+
+# Backend opsional: orjson untuk parse seluruh file, ijson untuk streaming
+try:
+    import orjson
+except ImportError:
+    orjson = None
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# File lebih besar dari ini di-parse streaming agar tidak membangun tree JSON penuh.
+# Tanpa ijson, streaming memakai cursor Python murni: sheet 5 MB ~0.63 s vs
+# ~0.20 s dengan orjson.loads (peak ~1.6 MB vs ~9x ukuran file). Jika orjson
+# ada, full parse tetap dipakai sampai batas yang jauh lebih besar.
+if ijson is None and orjson is not None:
+    STREAMING_THRESHOLD_BYTES = 16 * 1024 * 1024
+else:
+    STREAMING_THRESHOLD_BYTES = 1024 * 1024
+# Ukuran chunk baca untuk parser streaming stdlib
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# Hasil parse: (field lagu selain songNotes, notes atau None jika tidak ada songNotes)
+SongFields = Tuple[Dict[str, Any], Optional[NoteColumns]]
+
+
+# BOM -> encoding (UTF-32 dicek sebelum UTF-16 karena BOM UTF-32 LE diawali BOM UTF-16 LE)
+_BOMS = (
+    (codecs.BOM_UTF8, 'utf-8'),
+    (codecs.BOM_UTF32_LE, 'utf-32-le'),
+    (codecs.BOM_UTF32_BE, 'utf-32-be'),
+    (codecs.BOM_UTF16_LE, 'utf-16-le'),
+    (codecs.BOM_UTF16_BE, 'utf-16-be'),
+)
+
+
+def detect_encoding(head: bytes) -> Tuple[str, int]:
+    """Encoding sheet dari 4 byte pertama, return (encoding, panjang BOM)
+
+    Tanpa BOM, pola byte nol dari karakter ASCII pertama JSON dipakai untuk
+    mengenali UTF-16/UTF-32 (seperti RFC 4627), selain itu UTF-8.
+    """
+    for bom, encoding in _BOMS:
+        if head.startswith(bom):
+            return encoding, len(bom)
+    if len(head) >= 4:
+        if head[0] == 0 and head[1] == 0 and head[2] == 0:
+            return 'utf-32-be', 0
+        if head[1] == 0 and head[2] == 0 and head[3] == 0:
+            return 'utf-32-le', 0
+    if len(head) >= 2:
+        if head[0] == 0:
+            return 'utf-16-be', 0
+        if head[1] == 0:
+            return 'utf-16-le', 0
+    return 'utf-8', 0
+
+
+def json_backend_name(streaming: bool = False) -> str:
+    if streaming:
+        return f"ijson/{ijson.backend}" if ijson is not None else "stdlib-stream"
+    return "orjson" if orjson is not None else "json"
+
+
+def _song_object(data: Any) -> Any:
+    """Sheet bisa berupa object lagu atau list berisi object lagu (dipakai yang pertama)"""
+    if isinstance(data, list) and len(data) > 0:
+        return data[0]
+    return data
+
+
+# STEP J1: Full Parse - json/orjson lalu konversi ke kolom
+def decode_song_bytes(raw: bytes):
+    """Isi file sheet siap di-parse: bytes UTF-8 apa adanya, encoding lain di-decode sekali"""
+    encoding, bom_length = detect_encoding(raw[:4])
+    if encoding == 'utf-8':
+        return raw[bom_length:] if bom_length else raw
+    return raw[bom_length:].decode(encoding)
+
+
+def parse_song_text(text) -> SongFields:
+    """Parse isi sheet (str atau bytes UTF-8) sekaligus
+
+    Raise json.JSONDecodeError (orjson.JSONDecodeError adalah subclass-nya)
+    atau ValueError jika bukan format lagu.
+    """
+    data = orjson.loads(text) if orjson is not None else json.loads(text)
+    song_data = _song_object(data)
+    if not isinstance(song_data, dict):
+        raise ValueError("Unsupported song format")
+
+    song_notes = song_data.pop('songNotes', None)
+    if song_notes is None:
+        return song_data, None
+    notes = NoteColumns()
+    for note_data in song_notes:
+        # Validasi data note
+        if isinstance(note_data, dict) and 'key' in note_data and 'time' in note_data:
+            notes.append(note_data['key'], note_data['time'])
+        else:
+            logger.warning(f"Invalid note data found: {note_data}")
+    return song_data, notes
+
+
+# STEP J2: Streaming Parse (stdlib) - Walk songNotes per elemen dari chunk
+# Sisa angka yang belum lengkap di ujung buffer ("." atau "e+"), lihat _JsonStream.value
+_NUMBER_TAIL_CHARS = frozenset(".eE+-")
+_NUMBER_TAIL_MAX = 2
+
+
+class _JsonStream:
+    """Cursor di atas file teks yang dibaca per chunk
+
+    Nilai kecil (string, angka, object note) di-decode dengan raw_decode dari
+    buffer; buffer ditambah saat nilai terpotong di akhir chunk dan bagian
+    yang sudah dibaca dibuang, jadi memori tidak bergantung ukuran file.
+    """
+
+    def __init__(self, stream: TextIO, chunk_size: int = STREAM_CHUNK_SIZE):
+        self._stream = stream
+        self._chunk_size = chunk_size
+        self._buffer = ""
+        self._pos = 0
+        self._eof = False
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self, size: int) -> bool:
+        if self._eof:
+            return False
+        chunk = self._stream.read(size)
+        if not chunk:
+            self._eof = True
+            return False
+        if self._pos > self._chunk_size:
+            self._buffer = self._buffer[self._pos:]
+            self._pos = 0
+        self._buffer += chunk
+        return True
+
+    def _error(self, message: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(message, self._buffer, self._pos)
+
+    def peek(self) -> str:
+        """Karakter non-whitespace berikutnya tanpa mengonsumsinya ('' jika EOF)"""
+        while True:
+            buffer = self._buffer
+            pos = self._pos
+            length = len(buffer)
+            while pos < length and buffer[pos] in " \t\n\r":
+                pos += 1
+            self._pos = pos
+            if pos < length:
+                return buffer[pos]
+            if not self._fill(self._chunk_size):
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise self._error(f"Expecting '{char}'")
+        self._pos += 1
+
+    def accept(self, char: str) -> bool:
+        if self.peek() == char:
+            self._pos += 1
+            return True
+        return False
+
+    def value(self) -> Any:
+        """Decode satu nilai JSON lengkap di posisi sekarang"""
+        self.peek()
+        read_size = self._chunk_size
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._pos)
+            except json.JSONDecodeError:
+                # Nilai mungkin terpotong di akhir buffer: baca lagi lalu ulangi
+                if not self._fill(read_size):
+                    raise
+            else:
+                # Angka di ujung buffer bisa berlanjut di chunk berikutnya: raw_decode
+                # membaca "99." sebagai 99 dan menyisakan "." (juga "e", "e+")
+                if not (self._number_may_continue(value, end) and self._fill(read_size)):
+                    self._pos = end
+                    return value
+            read_size *= 2
+
+    def _number_may_continue(self, value: Any, end: int) -> bool:
+        if not isinstance(value, (int, float)) or isinstance(value, bool):
+            return False
+        buffer = self._buffer
+        return len(buffer) - end <= _NUMBER_TAIL_MAX and all(
+            buffer[index] in _NUMBER_TAIL_CHARS for index in range(end, len(buffer)))
+
+    def items(self):
+        """Iterasi key object yang sudah dibuka ('{' sudah dikonsumsi)"""
+        if self.accept('}'):
+            return
+        while True:
+            key = self.value()
+            if not isinstance(key, str):
+                raise self._error("Expecting property name")
+            self.expect(':')
+            yield key
+            if self.accept('}'):
+                return
+            self.expect(',')
+
+    def elements(self):
+        """Iterasi elemen array yang sudah dibuka ('[' sudah dikonsumsi)"""
+        if self.accept(']'):
+            return
+        while True:
+            yield
+            if self.accept(']'):
+                return
+            self.expect(',')
+
+
+def _stream_song_stdlib(stream: TextIO) -> SongFields:
+    cursor = _JsonStream(stream)
+    if cursor.accept('['):
+        # Format list: hanya lagu pertama yang dipakai, sisanya tidak dibaca
+        if cursor.peek() != '{':
+            raise ValueError("Unsupported song format")
+    if not cursor.accept('{'):
+        raise ValueError("Unsupported song format")
+
+    song_data = {}
+    notes = None
+    for key in cursor.items():
+        if key != 'songNotes' or not cursor.accept('['):
+            song_data[key] = cursor.value()
+            continue
+        notes = NoteColumns()
+        for _ in cursor.elements():
+            note_data = cursor.value()
+            if isinstance(note_data, dict) and 'key' in note_data and 'time' in note_data:
+                notes.append(note_data['key'], note_data['time'])
+            else:
+                logger.warning(f"Invalid note data found: {note_data}")
+    return song_data, notes
+
+
+# STEP J3: Streaming Parse (ijson) - Event parser C jika terpasang
+def _stream_song_ijson(stream) -> SongFields:
+    events = ijson.parse(stream, use_float=True)
+    try:
+        _, first_event, _ = next(events)
+    except StopIteration:
+        raise ValueError("Unsupported song format") from None
+    if first_event == 'start_array':
+        base = 'item'
+        try:
+            _, first_event, _ = next(events)
+        except StopIteration:
+            raise ValueError("Unsupported song format") from None
+    else:
+        base = ''
+    if first_event != 'start_map':
+        raise ValueError("Unsupported song format")
+
+    field_prefix = f"{base}." if base else ""
+    notes_prefix = f"{field_prefix}songNotes"
+    note_prefix = f"{notes_prefix}.item"
+    song_data = {}
+    notes = None
+    note_key = note_time = None
+    for prefix, event, value in events:
+        if prefix == note_prefix:
+            if event == 'start_map':
+                note_key = note_time = None
+            elif event == 'end_map':
+                if note_key is not None and note_time is not None:
+                    notes.append(note_key, note_time)
+                else:
+                    logger.warning(f"Invalid note data found: key={note_key!r}, time={note_time!r}")
+        elif prefix.startswith(note_prefix):
+            if prefix == f"{note_prefix}.key" and event == 'string':
+                note_key = value
+            elif prefix == f"{note_prefix}.time" and event == 'number':
+                note_time = value
+        elif prefix == notes_prefix and event == 'start_array':
+            notes = NoteColumns()
+        elif prefix == base and event == 'end_map':
+            break
+        elif (prefix.startswith(field_prefix) and '.' not in prefix[len(field_prefix):]
+              and event in ('string', 'number', 'boolean', 'null')):
+            # Field skalar lagu (name, bpm, ...); field bertingkat tidak dipakai
+            song_data[prefix[len(field_prefix):]] = value
+    return song_data, notes
+
+
+def stream_song(stream) -> SongFields:
+    """Parse sheet secara streaming langsung ke NoteColumns
+
+    `stream` berupa file biner (UTF-8) jika ijson terpasang, selain itu file
+    teks. Raise json.JSONDecodeError atau ValueError jika file tidak valid.
+    """
+    if ijson is not None and not isinstance(stream.read(0), str):
+        try:
+            return _stream_song_ijson(stream)
+        except ijson.JSONError as e:
+            raise json.JSONDecodeError(str(e), "", 0) from None
+    return _stream_song_stdlib(stream)
+
+
+def stream_song_file(f: BinaryIO) -> SongFields:
+    """stream_song untuk file biner dengan encoding dideteksi dari byte awal
+
+    Hanya 4 byte pertama yang dibaca untuk deteksi, lalu file di-seek ke
+    setelah BOM dan di-decode sekali dengan encoding tersebut.
+    """
+    start = f.tell()
+    encoding, bom_length = detect_encoding(f.read(4))
+    f.seek(start + bom_length)
+    if encoding == 'utf-8' and ijson is not None:
+        return stream_song(f)
+    return stream_song(io.TextIOWrapper(f, encoding=encoding))
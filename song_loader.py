@@ -0,0 +1,277 @@
+# =============================================================================
+# Song Loader - Parse file lagu tanpa side effect dan import paralel
+# =============================================================================
+import os
+import threading
+import logging
+from dataclasses import dataclass, field
+from concurrent.futures import Executor, FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Callable, List, Optional, Tuple
+
+from key_mapping import KEY_MAPPING
+from note_columns import NoteColumns
+from song_archive import (gzip_uncompressed_size, is_gzip_path, open_gzip, open_member,
+                          split_member_path)
+from song_binary import decode_song, is_compiled_path, read_compiled
+from song_json import (STREAMING_THRESHOLD_BYTES, decode_song_bytes, parse_song_text,
+                       stream_song_file)
+from timeline import CompiledTimeline
+
+logger = logging.getLogger(__name__)
+
+# Jumlah file per task worker, mengurangi overhead IPC untuk library besar
+DEFAULT_IMPORT_BATCH_SIZE = 64
+# BPM jika sheet tidak punya field bpm yang valid
+DEFAULT_BPM = 120
+
+
+@dataclass
+class SongData:
+    """Data class untuk menyimpan informasi lagu lengkap"""
+    name: str
+    bpm: int
+    notes: Optional[NoteColumns]  # None untuk entry list (metadata saja, notes di SongCache)
+    file_path: str
+    # Timeline hasil compile, di-cache agar tidak di-group ulang setiap kali dipakai
+    timeline: Optional[CompiledTimeline] = field(default=None, repr=False, compare=False)
+    # Metadata untuk list/library index, tersedia tanpa notes
+    note_count: int = 0
+    duration_ms: int = 0
+    chord_count: int = 0
+    # Fingerprint file saat di-parse (st_mtime_ns, st_size), member zip: (CRC32, file_size)
+    file_mtime_ns: int = 0
+    file_size: int = 0
+    # Hash isi notes (NoteColumns.content_hash), untuk deteksi sheet duplikat
+    content_hash: str = ""
+
+
+# STEP L1: Song Parsing - Parse satu file lagu menjadi SongData
+def _parse_json(f, size: int) -> tuple:
+    """Parse stream biner sheet JSON, return (field lagu, notes)"""
+    if size > STREAMING_THRESHOLD_BYTES:
+        # Sheet besar: songNotes dibaca per elemen langsung ke kolom
+        return stream_song_file(f)
+    return parse_song_text(decode_song_bytes(f.read()))
+
+
+def _read_song(file_path: str) -> tuple:
+    """Baca file JSON lagu, return (name, bpm, notes, mtime_ns, size), notes terurut waktu
+
+    Encoding (UTF-8/16/32, dengan atau tanpa BOM) dideteksi dari byte awal.
+    File .skyc dibaca via mmap dan menambahkan chord_count dari header.
+    File .json.gz di-dekompresi sambil dibaca, member .zip (path virtual
+    "<arsip>::<member>") dibaca langsung dari arsip dengan fingerprint
+    (CRC32, ukuran) sebagai pengganti (mtime_ns, size).
+    """
+    name = os.path.basename(file_path)
+    if split_member_path(file_path) is not None:
+        with open_member(file_path) as (f, info):
+            fingerprint = (info.CRC, info.file_size)
+            name = os.path.basename(info.filename)
+            if is_compiled_path(info.filename):
+                song_name, bpm, notes, chord_count = decode_song(f.read())
+                return (song_name, bpm, notes) + fingerprint + (chord_count,)
+            song_data, notes = _parse_json(f, info.file_size)
+    elif is_compiled_path(file_path):
+        return read_compiled(file_path)
+    else:
+        with open(file_path, 'rb') as f:
+            stat = os.fstat(f.fileno())
+            fingerprint = (stat.st_mtime_ns, stat.st_size)
+            if is_gzip_path(file_path):
+                with open_gzip(f) as gz:
+                    song_data, notes = _parse_json(gz, gzip_uncompressed_size(f))
+            else:
+                song_data, notes = _parse_json(f, stat.st_size)
+
+    if notes is None:
+        logger.warning(f"No 'songNotes' found in {file_path}")
+        notes = NoteColumns()
+
+    # Sort berdasarkan waktu (stabil, urutan note dalam chord tetap)
+    notes.sort_by_time()
+    # Sheet bisa berisi "name": null atau "bpm": null; library index butuh nilai NOT NULL
+    song_name = song_data.get('name')
+    if not isinstance(song_name, str):
+        song_name = name
+    bpm = song_data.get('bpm')
+    if isinstance(bpm, bool) or not isinstance(bpm, (int, float)):
+        bpm = DEFAULT_BPM
+    return (song_name, bpm, notes) + fingerprint
+
+
+def count_chords(notes: NoteColumns) -> int:
+    """Jumlah group waktu dengan lebih dari satu key keyboard berbeda (notes terurut)"""
+    times = notes.times
+    chord_count = 0
+    count = len(times)
+    counted_time = None
+    # Hanya group dengan waktu yang sama yang perlu dicek, mayoritas note berdiri sendiri
+    for index in [i for i in range(1, count) if times[i] == times[i - 1]]:
+        time_ms = times[index]
+        if time_ms == counted_time:
+            continue
+        counted_time = time_ms
+        end = index + 1
+        while end < count and times[end] == time_ms:
+            end += 1
+        chars = {KEY_MAPPING.get(notes.key_name(i)) for i in range(index - 1, end)}
+        chars.discard(None)
+        chord_count += len(chars) > 1
+    return chord_count
+
+
+def _song_info(file_path: str, name: str, bpm: int, notes: NoteColumns,
+               mtime_ns: int = 0, size: int = 0, chord_count: Optional[int] = None,
+               content_hash: str = "") -> SongData:
+    if chord_count is None:
+        chord_count = count_chords(notes)
+    return SongData(name=name, bpm=bpm, notes=None, file_path=file_path,
+                    note_count=len(notes), duration_ms=notes.times[-1] if len(notes) else 0,
+                    chord_count=chord_count, content_hash=content_hash,
+                    file_mtime_ns=mtime_ns, file_size=size)
+
+
+def _build_song(file_path: str, name: str, bpm: int, notes: NoteColumns,
+                mtime_ns: int = 0, size: int = 0, chord_count: int = 0) -> SongData:
+    # count_chords dilewati: full load selalu di-compile, chord_count diambil dari timeline
+    song = _song_info(file_path, name, bpm, notes, mtime_ns, size, chord_count)
+    song.notes = notes
+    return song
+
+
+def parse_song(file_path: str) -> SongData:
+    """Parse file lagu (JSON, .json.gz, .skyc, atau member .zip) menjadi SongData (tanpa mengubah state player)
+
+    content_hash tidak dihitung (kosong): entry list sudah menyimpannya dari
+    read_song_info, panggil notes.content_hash() jika memang dibutuhkan.
+    chord_count hanya terisi dari header .skyc; untuk sheet lain ambil dari
+    CompiledTimeline.chord_count setelah compile.
+    Raise OSError, json.JSONDecodeError, atau ValueError jika file tidak valid.
+    """
+    return _build_song(file_path, *_read_song(file_path))
+
+
+def read_song_info(file_path: str) -> SongData:
+    """Parse file lagu tapi hanya simpan metadata (notes=None) untuk list/library
+
+    Termasuk content_hash untuk deteksi duplikat (dihitung sekali saat import).
+    """
+    song_fields = _read_song(file_path)
+    song = _song_info(file_path, *song_fields)
+    song.content_hash = song_fields[2].content_hash()
+    return song
+
+
+def _parse_batch(file_paths: List[str]) -> List[Tuple[str, Optional[SongData], Optional[str]]]:
+    """Parse beberapa file di worker, return (path, metadata SongData, error) per file
+
+    Notes tidak dikirim balik: list hanya butuh metadata, notes dimuat ulang
+    saat lagu dipilih, jadi IPC per file cukup beberapa field.
+    """
+    results = []
+    for file_path in file_paths:
+        try:
+            results.append((file_path, read_song_info(file_path), None))
+        except Exception as e:
+            results.append((file_path, None, f"{type(e).__name__}: {e}"))
+    return results
+
+
+# STEP L2: Parallel Import - Parse banyak file di pool, hasil dikirim per batch
+class SongImportJob:
+    """Import file lagu secara paralel di background
+
+    File dibagi per batch dan di-parse di process pool (atau thread pool).
+    Setiap batch yang selesai dikirim ke `on_batch(songs, errors)` dari thread
+    job ini, dan `on_done(loaded, failed, cancelled)` dipanggil di akhir.
+    """
+
+    def __init__(self, file_paths: List[str],
+                 on_batch: Callable[[List[SongData], List[Tuple[str, str]]], None],
+                 on_done: Optional[Callable[[int, int, bool], None]] = None,
+                 max_workers: Optional[int] = None,
+                 batch_size: int = DEFAULT_IMPORT_BATCH_SIZE,
+                 use_processes: bool = True):
+        self.file_paths = list(file_paths)
+        self.on_batch = on_batch
+        self.on_done = on_done or (lambda loaded, failed, cancelled: None)
+        self.max_workers = max_workers
+        self.batch_size = max(1, batch_size)
+        self.use_processes = use_processes
+        self.loaded = 0
+        self.failed = 0
+        self._cancel = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def total(self) -> int:
+        return len(self.file_paths)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancel.is_set()
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="song-import", daemon=True)
+        self._thread.start()
+
+    def cancel(self):
+        """Batalkan batch yang belum mulai, batch yang sedang jalan diabaikan"""
+        self._cancel.set()
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        if self._thread is not None:
+            self._thread.join(timeout)
+        return not self.is_running
+
+    def _create_executor(self, batch_count: int) -> Executor:
+        workers = min(self.max_workers or os.cpu_count() or 1, batch_count)
+        if self.use_processes and workers > 1:
+            # Import di sini: concurrent.futures.process (multiprocessing) mahal saat startup
+            from concurrent.futures import ProcessPoolExecutor
+            try:
+                return ProcessPoolExecutor(max_workers=workers)
+            except (OSError, NotImplementedError) as e:
+                logger.warning(f"Process pool unavailable ({e}), importing with threads")
+        return ThreadPoolExecutor(max_workers=workers, thread_name_prefix="song-import")
+
+    def _run(self):
+        batches = [self.file_paths[i:i + self.batch_size]
+                   for i in range(0, len(self.file_paths), self.batch_size)]
+        logger.info(f"Importing {len(self.file_paths)} files in {len(batches)} batches")
+        try:
+            if batches:
+                executor = self._create_executor(len(batches))
+                try:
+                    self._collect(executor, batches)
+                finally:
+                    executor.shutdown(wait=not self.cancelled, cancel_futures=True)
+        except Exception as e:
+            logger.error(f"Song import failed: {e}")
+        finally:
+            logger.info(f"Import {'cancelled' if self.cancelled else 'completed'}: "
+                        f"{self.loaded} loaded, {self.failed} failed")
+            self.on_done(self.loaded, self.failed, self.cancelled)
+
+    def _collect(self, executor: Executor, batches: List[List[str]]):
+        pending = {executor.submit(_parse_batch, batch) for batch in batches}
+        while pending and not self.cancelled:
+            done, pending = wait(pending, timeout=0.1, return_when=FIRST_COMPLETED)
+            for future in done:
+                if self.cancelled:
+                    break
+                songs = []
+                errors = []
+                for file_path, song, error in future.result():
+                    if song is None:
+                        errors.append((file_path, error))
+                    else:
+                        songs.append(song)
+                self.loaded += len(songs)
+                self.failed += len(errors)
+                self.on_batch(songs, errors)
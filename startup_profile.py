@@ -0,0 +1,82 @@
+# =============================================================================
+# Startup Profile - Laporan waktu startup (import per modul dan fase UI)
+# =============================================================================
+# Aktif dengan flag --startup-report atau env SKY_STARTUP_REPORT=1. main.py
+# memanggil install_from_argv() sebelum meng-import PyQt6 dan player_app.py
+# agar import tersebut ikut terukur.
+import os
+import sys
+import time
+import builtins
+import threading
+from typing import List, Tuple
+
+FLAG = "--startup-report"
+ENV_VAR = "SKY_STARTUP_REPORT"
+# Jumlah import paling lambat yang ditampilkan di laporan
+REPORT_TOP_IMPORTS = 25
+
+_start_ns = time.perf_counter_ns()
+_original_import = builtins.__import__
+_main_thread = threading.get_ident()
+_enabled = False
+_marks: List[Tuple[str, int]] = []
+_imports: List[Tuple[int, str, int, int]] = []  # (depth, module, self_ns, cumulative_ns)
+_stack: List[List[int]] = []  # [children_ns] per import yang sedang berjalan
+
+
+def is_enabled() -> bool:
+    return _enabled
+
+
+def _timed_import(name, globals=None, locals=None, fromlist=(), level=0):
+    # Hanya import absolut pertama kali di main thread yang diukur (seperti -X importtime)
+    if level or name in sys.modules or threading.get_ident() != _main_thread:
+        return _original_import(name, globals, locals, fromlist, level)
+    depth = len(_stack)
+    _stack.append([0])
+    start = time.perf_counter_ns()
+    try:
+        return _original_import(name, globals, locals, fromlist, level)
+    finally:
+        cumulative = time.perf_counter_ns() - start
+        children = _stack.pop()[0]
+        if _stack:
+            _stack[-1][0] += cumulative
+        _imports.append((depth, name, cumulative - children, cumulative))
+
+
+def install_from_argv():
+    """Aktifkan profiling jika ada flag/env (flag dibuang dari sys.argv)"""
+    global _enabled
+    if FLAG in sys.argv:
+        sys.argv.remove(FLAG)
+        _enabled = True
+    elif os.environ.get(ENV_VAR):
+        _enabled = True
+    if _enabled:
+        builtins.__import__ = _timed_import
+
+
+def mark(label: str):
+    """Catat fase startup (waktu sejak modul ini di-import)"""
+    if _enabled:
+        _marks.append((label, time.perf_counter_ns()))
+
+
+def report(stream=None) -> str:
+    """Tulis laporan ke stream (default stderr), hentikan profiling import"""
+    builtins.__import__ = _original_import
+    lines = ["Startup report (ms since startup_profile import)"]
+    previous = _start_ns
+    for label, timestamp in _marks:
+        lines.append(f"  {(timestamp - _start_ns) / 1e6:9.1f}  +{(timestamp - previous) / 1e6:8.1f}  {label}")
+        previous = timestamp
+    if _imports:
+        lines.append(f"Slowest imports (self | cumulative us), top {REPORT_TOP_IMPORTS}:")
+        slowest = sorted(_imports, key=lambda item: item[3], reverse=True)[:REPORT_TOP_IMPORTS]
+        for depth, name, self_ns, cumulative_ns in slowest:
+            lines.append(f"  {self_ns // 1000:9d} | {cumulative_ns // 1000:9d} | {'  ' * depth}{name}")
+    text = "\n".join(lines)
+    print(text, file=stream or sys.stderr)
+    return text
@@ -0,0 +1,174 @@
+# =============================================================================
+# Timing Telemetry - Waktu jadwal vs dispatch vs emisi aktual per note group
+# =============================================================================
+# Semua timestamp memakai perf_counter_ns. Lateness = waktu aktual - jadwal:
+#   dispatch : player menyerahkan chord ke input pool
+#   emit     : backend selesai mengirim chord (ChordTicket.completed_ns)
+import csv
+import json
+import math
+from array import array
+from collections import deque
+from typing import Dict, List
+
+# Kapasitas default ring buffer (group); lagu lebih panjang menyimpan group terakhir saja
+DEFAULT_TELEMETRY_CAPACITY = 65536
+# Batas atas bucket histogram lateness (ms), bucket terakhir untuk sisanya
+HISTOGRAM_BOUNDS_MS = (0.1, 0.25, 0.5, 1, 2, 5, 10, 20, 50)
+PERCENTILES = (50, 95, 99)
+
+
+def percentile(sorted_values: List[float], percent: float) -> float:
+    """Percentile nearest-rank dari list yang sudah terurut"""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, math.ceil(percent / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+def histogram(values_ms: List[float]) -> Dict[str, int]:
+    """Jumlah nilai per bucket HISTOGRAM_BOUNDS_MS (label "<=1ms", ">50ms")"""
+    counts = [0] * (len(HISTOGRAM_BOUNDS_MS) + 1)
+    for value in values_ms:
+        index = 0
+        while index < len(HISTOGRAM_BOUNDS_MS) and value > HISTOGRAM_BOUNDS_MS[index]:
+            index += 1
+        counts[index] += 1
+    labels = [f"<={bound}ms" for bound in HISTOGRAM_BOUNDS_MS] + [f">{HISTOGRAM_BOUNDS_MS[-1]}ms"]
+    return dict(zip(labels, counts))
+
+
+def _stats(values_ms: List[float]) -> Dict[str, float]:
+    """p50/p95/p99/max, mean dan jitter (standar deviasi) dalam ms"""
+    if not values_ms:
+        return {}
+    ordered = sorted(values_ms)
+    mean = sum(ordered) / len(ordered)
+    stats = {f"p{p}": percentile(ordered, p) for p in PERCENTILES}
+    stats["max"] = ordered[-1]
+    stats["mean"] = mean
+    stats["jitter"] = math.sqrt(sum((value - mean) ** 2 for value in ordered) / len(ordered))
+    return stats
+
+
+class NoteTelemetry:
+    """Ring buffer preallocated untuk timing setiap note group
+
+    Dipakai oleh thread pemilik PlaybackController saja. Ticket yang belum
+    selesai disimpan sementara di `_pending` dan diselesaikan saat record
+    berikutnya, jadi tidak ada alokasi per group di array utama dan tidak
+    ada ticket yang ditahan setelah chord-nya terkirim.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_TELEMETRY_CAPACITY):
+        self.capacity = max(1, capacity)
+        self.song_ms = array('q', bytes(8 * self.capacity))
+        self.scheduled_ns = array('q', bytes(8 * self.capacity))
+        self.dispatched_ns = array('q', bytes(8 * self.capacity))
+        self.completed_ns = array('q', bytes(8 * self.capacity))
+        self.key_counts = array('H', bytes(2 * self.capacity))
+        self._pending = deque()  # (slot, sequence, ticket) yang belum selesai
+        self.total = 0  # Jumlah group sejak reset (bisa > capacity)
+
+    def reset(self):
+        self._pending.clear()
+        self.total = 0
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    # STEP T1: Recording - Dipanggil setelah dispatch setiap group
+    def record(self, song_ms: int, scheduled_ns: int, ticket, key_count: int):
+        """Catat satu group: posisi lagu, deadline, dan ticket dispatch-nya"""
+        self._resolve()
+        slot = self.total % self.capacity
+        self.song_ms[slot] = song_ms
+        self.scheduled_ns[slot] = scheduled_ns
+        self.dispatched_ns[slot] = ticket.dispatched_ns
+        self.completed_ns[slot] = ticket.completed_ns
+        self.key_counts[slot] = min(key_count, 0xFFFF)
+        if not ticket.completed_ns:
+            self._pending.append((slot, self.total, ticket))
+        self.total += 1
+
+    def _resolve(self, timeout: float = 0.0):
+        """Salin completed_ns dari ticket yang sudah selesai (urut dispatch)"""
+        pending = self._pending
+        while pending:
+            slot, sequence, ticket = pending[0]
+            if not ticket.done and not (timeout and ticket.wait(timeout)):
+                break
+            pending.popleft()
+            if self.total - sequence <= self.capacity:  # Slot belum ditimpa
+                self.completed_ns[slot] = ticket.completed_ns
+
+    def finish(self, timeout: float = 0.5):
+        """Tunggu ticket terakhir (maksimal timeout per ticket) sebelum report"""
+        self._resolve(timeout)
+
+    # STEP T2: Report - Statistik lateness dan export
+    def _slots(self) -> range:
+        start = self.total - len(self)
+        return range(start, self.total)
+
+    def lateness_ms(self, emitted: bool = True) -> List[float]:
+        """Lateness emit (atau dispatch jika emitted=False) per group dalam ms"""
+        scheduled = self.scheduled_ns
+        actual = self.completed_ns if emitted else self.dispatched_ns
+        values = []
+        for sequence in self._slots():
+            slot = sequence % self.capacity
+            if actual[slot]:
+                values.append((actual[slot] - scheduled[slot]) / 1e6)
+        return values
+
+    def rows(self) -> List[Dict[str, object]]:
+        """Satu dict per group (urut pemutaran), lateness dalam ms"""
+        rows = []
+        for sequence in self._slots():
+            slot = sequence % self.capacity
+            scheduled = self.scheduled_ns[slot]
+            completed = self.completed_ns[slot]
+            rows.append({
+                "index": sequence,
+                "song_ms": self.song_ms[slot],
+                "keys": self.key_counts[slot],
+                "scheduled_ns": scheduled,
+                "dispatch_late_ms": (self.dispatched_ns[slot] - scheduled) / 1e6,
+                "emit_late_ms": (completed - scheduled) / 1e6 if completed else None,
+            })
+        return rows
+
+    def report(self) -> Dict[str, object]:
+        """Ringkasan: statistik lateness dispatch dan emit, histogram emit"""
+        emit = self.lateness_ms()
+        return {
+            "groups": self.total,
+            "recorded": len(self),
+            "incomplete": len(self) - len(emit),
+            "dispatch": _stats(self.lateness_ms(emitted=False)),
+            "emit": _stats(emit),
+            "histogram": histogram(emit),
+        }
+
+    def summary(self) -> str:
+        """Satu baris untuk log dan status panel"""
+        stats = _stats(self.lateness_ms())
+        if not stats:
+            return "no timing recorded"
+        return (f"{self.total} groups, lateness p50 {stats['p50']:.2f}ms "
+                f"p95 {stats['p95']:.2f}ms p99 {stats['p99']:.2f}ms "
+                f"max {stats['max']:.2f}ms, jitter {stats['jitter']:.2f}ms")
+
+    def export(self, file_path: str):
+        """Tulis telemetry ke .csv (per group) atau .json (ringkasan + per group)"""
+        rows = self.rows()
+        if file_path.lower().endswith(".csv"):
+            with open(file_path, "w", newline="", encoding="utf-8") as f:
+                writer = csv.DictWriter(f, fieldnames=list(rows[0]) if rows else ["index"])
+                writer.writeheader()
+                writer.writerows(rows)
+        else:
+            with open(file_path, "w", encoding="utf-8") as f:
+                json.dump({"summary": self.report(), "groups": rows}, f, indent=1)
+
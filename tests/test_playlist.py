@@ -0,0 +1,23 @@
+# =============================================================================
+# Test: PlaylistQueue - pemilihan lagu berikutnya
+# =============================================================================
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from playlist import PlaylistMode, PlaylistQueue  # noqa: E402
+
+
+def test_shuffle_single_song_has_no_next():
+    playlist = PlaylistQueue(lambda song: song, PlaylistMode.SHUFFLE)
+    playlist.set_songs(["only"], 0)
+    assert playlist.peek_next() is None
+    assert playlist.prepare_next() is None
+    assert playlist.advance() is None
+
+
+def test_shuffle_never_repeats_current_song():
+    playlist = PlaylistQueue(lambda song: song, PlaylistMode.SHUFFLE)
+    playlist.set_songs(["a", "b"], 0)
+    assert [playlist.advance() for _ in range(4)] == ["b", "a", "b", "a"]
@@ -0,0 +1,52 @@
+# =============================================================================
+# Test: Song JSON - parser streaming stdlib dengan chunk kecil
+# =============================================================================
+import io
+import os
+import sys
+import json
+import random
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from song_json import _stream_song_stdlib  # noqa: E402
+
+
+class ChunkedStringIO(io.StringIO):
+    """StringIO yang mengembalikan paling banyak chunk_size karakter per read"""
+
+    def __init__(self, text: str, chunk_size: int):
+        super().__init__(text)
+        self.chunk_size = chunk_size
+
+    def read(self, size=-1):
+        if size is None or size < 0 or size > self.chunk_size:
+            size = self.chunk_size
+        return super().read(size)
+
+
+def _parse(text: str, chunk_size: int):
+    song_data, notes = _stream_song_stdlib(ChunkedStringIO(text, chunk_size))
+    return song_data, [(notes.key_name(i), notes.times[i]) for i in range(len(notes))]
+
+
+def test_number_split_across_chunks():
+    text = '{"name": "n", "bpm": 99.5, "songNotes": []}'
+    for chunk_size in range(1, len(text) + 1):
+        song_data, notes = _parse(text, chunk_size)
+        assert song_data == {"name": "n", "bpm": 99.5}
+        assert notes == []
+
+
+def test_random_documents_match_json_loads():
+    rng = random.Random(1234)
+    numbers = [0, 7, -3, 99.5, 1e3, 2.5e-3, -12.75, 120, 1E+2]
+    for _ in range(300):
+        data = {"name": "song", "bpm": rng.choice(numbers), "pitchLevel": rng.choice(numbers),
+                "songNotes": [{"time": rng.randrange(100000), "key": f"1Key{rng.randrange(15)}"}
+                              for _ in range(rng.randrange(4))]}
+        text = json.dumps(data, indent=rng.choice([None, 1]))
+        song_data, notes = _parse(text, rng.randrange(1, 9))
+        expected = json.loads(text)
+        assert song_data == {key: value for key, value in expected.items() if key != "songNotes"}
+        assert notes == [(note["key"], note["time"]) for note in expected["songNotes"]]
@@ -0,0 +1,105 @@
+# =============================================================================
+# Compiled Timeline - Representasi lagu yang siap diputar (array-backed)
+# =============================================================================
+from array import array
+from typing import Dict, Iterable, Iterator, Tuple
+
+
+class CompiledTimeline:
+    """Timeline note group dalam kolom array paralel
+
+    - times:   waktu mulai setiap group (ms), terurut
+    - offsets: index awal key setiap group di `keys` (panjang = group + 1)
+    - keys:    index key keyboard (ke `key_table`) yang sudah di-resolve
+    """
+
+    __slots__ = ('times', 'offsets', 'keys', 'key_table',
+                 'note_count', 'chord_count', 'unknown_keys')
+
+    def __init__(self, times: array, offsets: array, keys: array,
+                 key_table: Tuple[str, ...], note_count: int,
+                 chord_count: int, unknown_keys: int = 0):
+        self.times = times
+        self.offsets = offsets
+        self.keys = keys
+        self.key_table = key_table
+        self.note_count = note_count
+        self.chord_count = chord_count
+        self.unknown_keys = unknown_keys
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    @property
+    def duration_ms(self) -> int:
+        return self.times[-1] if self.times else 0
+
+    @property
+    def nbytes(self) -> int:
+        """Ukuran data kolom dalam bytes"""
+        return sum(column.itemsize * len(column)
+                   for column in (self.times, self.offsets, self.keys))
+
+    def group_keys(self, index: int) -> Tuple[str, ...]:
+        """Key keyboard untuk group ke-index"""
+        key_table = self.key_table
+        return tuple(key_table[k] for k in self.keys[self.offsets[index]:self.offsets[index + 1]])
+
+    def groups(self) -> Iterator[Tuple[int, Tuple[str, ...]]]:
+        """Iterasi (time_ms, keys) untuk setiap group"""
+        for index in range(len(self.times)):
+            yield self.times[index], self.group_keys(index)
+
+
+def build_key_table(key_mapping: Dict[str, str]) -> Tuple[Tuple[str, ...], Dict[str, int]]:
+    """Buat tabel key keyboard unik dan index untuk setiap nama key Sky"""
+    key_table = tuple(dict.fromkeys(key_mapping.values()))
+    key_index = {name: key_table.index(char) for name, char in key_mapping.items()}
+    return key_table, key_index
+
+
+def compile_timeline(notes: Iterable, key_mapping: Dict[str, str]) -> CompiledTimeline:
+    """Compile notes (terurut berdasarkan waktu) menjadi CompiledTimeline
+
+    `notes` berupa NoteColumns (dibaca langsung dari kolom) atau iterable objek
+    dengan atribut key dan time.
+    """
+    key_table, key_index = build_key_table(key_mapping)
+    if hasattr(notes, 'key_names'):
+        pairs = zip(notes.times, notes.key_names())
+    else:
+        pairs = ((note.time, note.key) for note in notes)
+
+    times = array('I')
+    offsets = array('I', [0])
+    keys = array('B')
+    note_count = 0
+    chord_count = 0
+    unknown_keys = 0
+
+    current_time = None
+    group_keys = []
+    for time_ms, key in pairs:
+        note_count += 1
+        if time_ms != current_time:
+            if group_keys:
+                keys.extend(group_keys)
+                offsets.append(len(keys))
+                times.append(current_time)
+                chord_count += len(group_keys) > 1
+            current_time = time_ms
+            group_keys = []
+        index = key_index.get(key)
+        if index is None:
+            unknown_keys += 1
+        elif index not in group_keys:
+            group_keys.append(index)
+
+    if group_keys:
+        keys.extend(group_keys)
+        offsets.append(len(keys))
+        times.append(current_time)
+        chord_count += len(group_keys) > 1
+
+    return CompiledTimeline(times, offsets, keys, key_table,
+                            note_count, chord_count, unknown_keys)